@@ -25,7 +25,9 @@ DEPENDENCY_GROUPS = [
             "pydantic-settings",
             "email-validator",
             "sqlalchemy",
-            "fastapi",
+            # 0.118 runs yield-dependency teardown after a streamed response,
+            # which keeps the export endpoint's session open while it streams
+            "fastapi>=0.118",
             "uvicorn",
             "alembic",
             "dependency-injector",
@@ -35,6 +37,7 @@ DEPENDENCY_GROUPS = [
             "greenlet",
             "requests",
             "psycopg[binary]",
+            "prometheus-client",
         ],
         "dev_packages": [
             "twine",
@@ -67,6 +70,24 @@ DEPENDENCY_GROUPS = [
             "black",
         ],
     },
+    {
+        "name": "speedups",
+        "description": "Faster event loop and HTTP parser (uvloop, httptools)",
+        "packages": [
+            "uvloop",
+            "httptools",
+        ],
+        "dev_packages": [],
+    },
+    {
+        "name": "tracing",
+        "description": "OpenTelemetry tracing (SDK, OTLP exporter)",
+        "packages": [
+            "opentelemetry-sdk",
+            "opentelemetry-exporter-otlp-proto-http",
+        ],
+        "dev_packages": [],
+    },
 ]
 
 
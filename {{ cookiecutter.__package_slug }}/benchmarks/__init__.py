@@ -0,0 +1 @@
+"""Benchmarks for the service; run each module with `python -m benchmarks.<name>`."""
@@ -0,0 +1,143 @@
+"""Load test comparing throughput of the sync and async persistence stacks.
+
+Starts the application with uvicorn once per stack (DATABASE_ASYNC off/on),
+drives a read-heavy mix of list and create requests from concurrent clients
+and reports requests per second and latency percentiles.
+
+Usage:
+    poetry run python benchmarks/bench_async_stack.py
+    poetry run python benchmarks/bench_async_stack.py --concurrency 200 --duration 20
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+ENV_PREFIX = "{{ cookiecutter.__package_slug | upper }}_"
+APP = "{{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }}:create_app"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url: str, use_async: bool, port: int) -> subprocess.Popen:
+    env = dict(os.environ)
+    env[ENV_PREFIX + "DATABASE_URL"] = database_url
+    env[ENV_PREFIX + "DATABASE_ASYNC"] = "true" if use_async else "false"
+    cmd = [sys.executable, "-m", "uvicorn", APP, "--factory", "--port", str(port)]
+    cmd += ["--log-level", "warning"]
+    return subprocess.Popen(cmd, env=env)
+
+
+async def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/task-lists/")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def drive(base_url: str, concurrency: int, duration: float, write_ratio: float):
+    """Run clients for `duration` seconds and return per-request latencies."""
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+        tl = (await client.post("/task-lists/", json={"name": "load"})).json()
+        for i in range(100):
+            payload = {"task_list_id": tl["id"], "title": f"seed {i}"}
+            await client.post("/tasks/", json=payload)
+
+        latencies: list[float] = []
+        errors = 0
+        deadline = time.monotonic() + duration
+        every = max(1, round(1 / write_ratio)) if write_ratio else 0
+
+        async def worker(n: int) -> None:
+            nonlocal errors
+            i = 0
+            while time.monotonic() < deadline:
+                i += 1
+                start = time.perf_counter()
+                if every and (i + n) % every == 0:
+                    payload = {"task_list_id": tl["id"], "title": f"w{n}-{i}"}
+                    r = await client.post("/tasks/", json=payload)
+                else:
+                    url = f"/tasks/by-list/{tl['id']}"
+                    r = await client.get(url, params={"limit": 50})
+                latencies.append(time.perf_counter() - start)
+                if r.status_code != 200:
+                    errors += 1
+
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        return latencies, errors
+
+
+def _percentile_ms(ordered: list[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+
+def summarize(latencies: list[float], errors: int, duration: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": len(ordered) / duration,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": _percentile_ms(ordered, 0.95),
+        "p99_ms": _percentile_ms(ordered, 0.99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    print(
+        f"{'stack':>6} {'requests':>9} {'errors':>7} {'rps':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for use_async in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            database_url = args.database_url or f"sqlite:///{Path(tmp) / 'load.db'}"
+            port = _free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            server = start_server(database_url, use_async, port)
+            try:
+                asyncio.run(wait_ready(base_url))
+                latencies, errors = asyncio.run(
+                    drive(base_url, args.concurrency, args.duration, args.write_ratio)
+                )
+            finally:
+                server.terminate()
+                server.wait()
+        r = summarize(latencies, errors, args.duration)
+        print(
+            f"{'async' if use_async else 'sync':>6} {r['requests']:>9} {r['errors']:>7} "
+            f"{r['rps']:>9.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark server memory while exporting large task lists.
+
+For each list size a fresh database is filled with one list of that many
+tasks, the application is started with uvicorn and the list is downloaded
+through `GET /tasks/by-list/{id}/export`. The server's peak RSS (VmHWM from
+/proc, so Linux only), time to first byte and total time are reported. With
+`--compare-list` the non-streaming `GET /tasks/by-list/{id}?limit=N` endpoint
+is measured too, to show how its memory grows with the list.
+
+Usage:
+    poetry run python benchmarks/bench_export_memory.py
+    poetry run python benchmarks/bench_export_memory.py --sizes 10000 100000 1000000
+    poetry run python benchmarks/bench_export_memory.py --format csv --compare-list
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Union, cast
+from uuid import uuid4
+
+import httpx
+from sqlalchemy import Table, create_engine, insert
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list import TaskListModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.schema import upgrade_database
+
+ENV_PREFIX = "{{ cookiecutter.__package_slug | upper }}_"
+APP = "{{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }}:create_app"
+BATCH = 50_000
+TASK_LISTS = cast(Table, TaskListModel.__table__)
+TASKS = cast(Table, TaskModel.__table__)
+
+
+def populate(database_url: str, size: int):
+    """Create one task list holding `size` tasks and return its id."""
+    engine = create_engine(database_url)
+    upgrade_database(engine)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    list_id = uuid4()
+    with engine.begin() as conn:
+        conn.execute(
+            insert(TASK_LISTS),
+            [{"id": list_id, "name": "export", "created_at": base}],
+        )
+        for start in range(0, size, BATCH):
+            rows = [
+                {
+                    "id": uuid4(),
+                    "task_list_id": list_id,
+                    "title": f"task {n}",
+                    "description": "x" * 200,
+                    "is_completed": n % 3 == 0,
+                    "created_at": base + timedelta(seconds=n),
+                    "completed_at": base + timedelta(seconds=n) if n % 3 == 0 else None,
+                }
+                for n in range(start, min(start + BATCH, size))
+            ]
+            conn.execute(insert(TASKS), rows)
+    engine.dispose()
+    return list_id
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url: str, port: int) -> subprocess.Popen:
+    env = dict(os.environ)
+    env[ENV_PREFIX + "DATABASE_URL"] = database_url
+    cmd = [sys.executable, "-m", "uvicorn", APP, "--factory", "--port", str(port)]
+    cmd += ["--log-level", "warning"]
+    return subprocess.Popen(cmd, env=env)
+
+
+def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(base_url + "/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+def peak_rss_mb(pid: int) -> float:
+    """Peak resident set size of process `pid` in MiB."""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    raise RuntimeError("VmHWM not available")
+
+
+def download(url: str, params: dict):
+    """Stream `url` to nowhere; return (bytes, first byte s, total s)."""
+    received = 0
+    first_byte = None
+    start = time.perf_counter()
+    with httpx.stream("GET", url, params=params, timeout=None) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes():
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            received += len(chunk)
+    return received, first_byte or 0.0, time.perf_counter() - start
+
+
+def measure(size: int, endpoint: str, export_format: str) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{Path(tmp) / 'export.db'}"
+        list_id = populate(database_url, size)
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(database_url, port)
+        try:
+            wait_ready(base_url)
+            idle_mb = peak_rss_mb(server.pid)
+            if endpoint == "export":
+                url = f"{base_url}/tasks/by-list/{list_id}/export"
+                params: Dict[str, Union[str, int]] = {"format": export_format}
+            else:
+                url = f"{base_url}/tasks/by-list/{list_id}"
+                params = {"limit": size}
+            received, first_byte, total = download(url, params)
+            peak_mb = peak_rss_mb(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+    return {
+        "size": size,
+        "endpoint": endpoint,
+        "mb": received / 2**20,
+        "ttfb_ms": first_byte * 1000,
+        "total_s": total,
+        "idle_rss_mb": idle_mb,
+        "peak_rss_mb": peak_mb,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--compare-list", action="store_true")
+    args = parser.parse_args()
+
+    endpoints = ["export"] + (["list"] if args.compare_list else [])
+    print(
+        f"{'endpoint':>8} {'tasks':>9} {'body MB':>8} {'ttfb ms':>8} "
+        f"{'total s':>8} {'idle MB':>8} {'peak MB':>8} {'growth':>7}"
+    )
+    for size in args.sizes:
+        for endpoint in endpoints:
+            r = measure(size, endpoint, args.format)
+            print(
+                f"{r['endpoint']:>8} {r['size']:>9} {r['mb']:>8.1f} {r['ttfb_ms']:>8.1f} "
+                f"{r['total_s']:>8.2f} {r['idle_rss_mb']:>8.1f} {r['peak_rss_mb']:>8.1f} "
+                f"{r['peak_rss_mb'] - r['idle_rss_mb']:>7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark list reads with full entities versus the TaskSummary projection.
+
+A SQLite database is filled with one list of tasks carrying a long
+description, then a page of `--limit` tasks is read and serialized the way
+`GET /tasks/by-list/{id}` does it: once through `page_by_task_list` (ORM
+instances hydrated into `Task` entities) and once through
+`page_summaries_by_task_list` (four columns as plain rows). Wall time per page
+and the peak Python allocation while building the response are reported.
+
+Usage:
+    poetry run python benchmarks/bench_projection.py
+    poetry run python benchmarks/bench_projection.py --tasks 200000 --limit 1000 --description-size 1000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import cast
+from uuid import uuid4
+
+from sqlalchemy import Table, create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list import TaskListModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.schema import upgrade_database
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
+
+BATCH = 50_000
+TASK_LISTS = cast(Table, TaskListModel.__table__)
+TASKS = cast(Table, TaskModel.__table__)
+
+
+def populate(engine, size: int, description_size: int):
+    """Create one task list holding `size` tasks and return its id."""
+    upgrade_database(engine)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    list_id = uuid4()
+    with engine.begin() as conn:
+        conn.execute(
+            insert(TASK_LISTS),
+            [{"id": list_id, "name": "projection", "created_at": base}],
+        )
+        for start in range(0, size, BATCH):
+            rows = [
+                {
+                    "id": uuid4(),
+                    "task_list_id": list_id,
+                    "title": f"task {n}",
+                    "description": "x" * description_size,
+                    "is_completed": n % 3 == 0,
+                    "created_at": base + timedelta(seconds=n),
+                }
+                for n in range(start, min(start + BATCH, size))
+            ]
+            conn.execute(insert(TASKS), rows)
+    return list_id
+
+
+def full_rows(session, list_id, limit: int) -> bytes:
+    page = TaskRepositoryRds(session).page_by_task_list(list_id, limit=limit)
+    return TaskOut.dump_json_many(page.items)
+
+
+def projected(session, list_id, limit: int) -> bytes:
+    page = TaskRepositoryRds(session).page_summaries_by_task_list(list_id, limit=limit)
+    return TaskOut.dump_json_many(page.items)
+
+
+def measure(fn, session_factory, list_id, limit: int, repeat: int):
+    """Return (best ms per page, peak KiB allocated) over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        with session_factory() as session:
+            start = time.perf_counter()
+            fn(session, list_id, limit)
+            best = min(best, time.perf_counter() - start)
+    with session_factory() as session:
+        tracemalloc.start()
+        fn(session, list_id, limit)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--description-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'projection.db'}")
+        list_id = populate(engine, args.tasks, args.description_size)
+        session_factory = sessionmaker(bind=engine)
+
+        print(
+            f"{'limit':>6} {'full ms':>8} {'proj ms':>8} {'speedup':>8} "
+            f"{'full KiB':>9} {'proj KiB':>9}"
+        )
+        for limit in args.limit:
+            with session_factory() as session:
+                assert json.loads(full_rows(session, list_id, limit)) == json.loads(
+                    projected(session, list_id, limit)
+                )
+            full_ms, full_kib = measure(
+                full_rows, session_factory, list_id, limit, args.repeat
+            )
+            proj_ms, proj_kib = measure(
+                projected, session_factory, list_id, limit, args.repeat
+            )
+            print(
+                f"{limit:>6} {full_ms:>8.2f} {proj_ms:>8.2f} "
+                f"{full_ms / proj_ms:>7.1f}x {full_kib:>9.0f} {proj_kib:>9.0f}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark task search: SQLite FTS5 index versus a LIKE scan.
+
+A migrated SQLite database is filled with tasks whose titles and descriptions
+are drawn from a fixed vocabulary, then the same queries run through
+`SqliteFtsTaskSearchIndex` and `LikeTaskSearchIndex` (first page of
+`--limit` results). The best wall time per query is reported, along with the
+cost the index adds to writes (`create_many` with and without it).
+
+LIKE stops after the first `--limit` matches in creation order, while the
+index ranks every match; for words present in most tasks the scan can win.
+LIKE also matches substrings ("word1" finds "word10"), the index whole words.
+
+Usage:
+    poetry run python benchmarks/bench_search.py
+    poetry run python benchmarks/bench_search.py --sizes 10000 100000 1000000 --limit 20
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
+    TaskListRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.schema import upgrade_database
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.like import LikeTaskSearchIndex
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.sqlite_fts import SqliteFtsTaskSearchIndex
+
+WORDS = [f"word{n}" for n in range(5000)]
+BATCH = 10_000
+# (label, query) from rare to very common words
+QUERIES = [
+    ("rare", "word4999"),
+    ("medium", "word49"),
+    ("common", "word1"),
+    ("two terms", "word1 word2"),
+]
+
+
+def make_tasks(task_list_id, count: int, rng: random.Random):
+    # Zipf-like: low-numbered words are frequent, high-numbered ones rare
+    weights = [1 / (n + 1) for n in range(len(WORDS))]
+    return [
+        Task(
+            task_list_id=task_list_id,
+            title=" ".join(rng.choices(WORDS, weights, k=4)),
+            description=" ".join(rng.choices(WORDS, weights, k=30)),
+        )
+        for _ in range(count)
+    ]
+
+
+def populate(session_factory, size: int, index: bool) -> float:
+    """Insert `size` tasks, keeping the FTS index in sync if `index`.
+
+    Returns the seconds spent in `create_many`.
+    """
+    rng = random.Random(42)
+    spent = 0.0
+    with session_factory() as session:
+        tl = TaskListRepositoryRds(session).create(TaskList(name="search"))
+        search = SqliteFtsTaskSearchIndex(session) if index else None
+        repo = TaskRepositoryRds(session, search_index=search)
+        for start in range(0, size, BATCH):
+            tasks = make_tasks(tl.id, min(BATCH, size - start), rng)
+            begin = time.perf_counter()
+            repo.create_many(tasks)
+            spent += time.perf_counter() - begin
+        session.commit()
+    return spent
+
+
+def best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(size: int, limit: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engines = {}
+        write_s = {}
+        for index in (False, True):
+            engine = create_engine(f"sqlite:///{Path(tmp) / f'search-{index}.db'}")
+            upgrade_database(engine)
+            write_s[index] = populate(sessionmaker(bind=engine), size, index)
+            engines[index] = engine
+
+        print(
+            f"{size} tasks: create_many {write_s[False]:.2f}s without index, "
+            f"{write_s[True]:.2f}s with index"
+        )
+        with sessionmaker(bind=engines[True])() as session:
+            fts = SqliteFtsTaskSearchIndex(session)
+            like = LikeTaskSearchIndex(session)
+            for label, query in QUERIES:
+                hits = len(fts.search(query, limit=limit).items)
+                like_ms = best_ms(lambda: like.search(query, limit=limit), repeat)
+                fts_ms = best_ms(lambda: fts.search(query, limit=limit), repeat)
+                print(
+                    f"  {label:>10} {hits:>5} hits  like {like_ms:>9.2f} ms  "
+                    f"fts {fts_ms:>8.2f} ms  {like_ms / fts_ms:>7.1f}x"
+                )
+        for engine in engines.values():
+            engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.limit, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark task listing queries against table size, with and without indexes.
+
+For each table size the `tasks` table is filled with rows spread over many
+lists, then the repository queries used by `/tasks/by-list/{id}` are timed
+twice: without the secondary indexes ("before") and with them ("after").
+
+Usage:
+    poetry run python benchmarks/bench_task_indexes.py
+    poetry run python benchmarks/bench_task_indexes.py --sizes 10000 100000 1000000
+    poetry run python benchmarks/bench_task_indexes.py --database-url postgresql+psycopg://...
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, cast
+from uuid import uuid4
+
+from sqlalchemy import Table, create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list import TaskListModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+
+BATCH = 50_000
+
+# Rows are inserted through Core, bypassing the ORM
+TASK_LISTS = cast(Table, TaskListModel.__table__)
+TASKS = cast(Table, TaskModel.__table__)
+
+
+def populate(engine, size: int, lists: int):
+    """Insert `lists` task lists and `size` tasks spread evenly across them."""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    list_ids = [uuid4() for _ in range(lists)]
+    with engine.begin() as conn:
+        conn.execute(
+            insert(TASK_LISTS),
+            [
+                {"id": i, "name": f"list {n}", "created_at": base}
+                for n, i in enumerate(list_ids)
+            ],
+        )
+        for start in range(0, size, BATCH):
+            rows = [
+                {
+                    "id": uuid4(),
+                    "task_list_id": list_ids[n % lists],
+                    "title": f"task {n}",
+                    "description": None,
+                    "is_completed": n % 3 == 0,
+                    "created_at": base + timedelta(seconds=n),
+                    "completed_at": base + timedelta(seconds=n) if n % 3 == 0 else None,
+                }
+                for n in range(start, min(start + BATCH, size))
+            ]
+            conn.execute(insert(TASKS), rows)
+    return list_ids[lists // 2]
+
+
+def time_queries(SessionLocal, task_list_id, repeat: int):
+    """Return median milliseconds for the first page and a deep keyset page."""
+    timings: Dict[str, List[float]] = {"first_page": [], "deep_page": []}
+    with SessionLocal() as session:
+        repo = TaskRepositoryRds(session)
+        # Walk to a page in the middle of the list once to get a deep cursor
+        cursor = None
+        for _ in range(5):
+            page = repo.page_by_task_list(task_list_id, cursor=cursor, limit=100)
+            cursor = page.next_cursor
+        for _ in range(repeat):
+            start = time.perf_counter()
+            repo.page_by_task_list(task_list_id, limit=100)
+            timings["first_page"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            repo.page_by_task_list(task_list_id, cursor=cursor, limit=100)
+            timings["deep_page"].append(time.perf_counter() - start)
+            session.expunge_all()
+    return {k: statistics.median(v) * 1000 for k, v in timings.items()}
+
+
+def run(database_url: str, size: int, lists: int, repeat: int):
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    indexes = [ix for table in Base.metadata.sorted_tables for ix in table.indexes]
+    for index in indexes:
+        index.drop(bind=engine)
+    task_list_id = populate(engine, size, lists)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+    before = time_queries(SessionLocal, task_list_id, repeat)
+    for index in indexes:
+        index.create(bind=engine)
+    after = time_queries(SessionLocal, task_list_id, repeat)
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+    return before, after
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--lists", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>10} {'query':>11} {'before ms':>10} {'after ms':>10} {'speedup':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        for size in args.sizes:
+            before, after = run(database_url, size, args.lists, args.repeat)
+            for query in before:
+                speedup = before[query] / after[query] if after[query] else float("inf")
+                print(
+                    f"{size:>10} {query:>11} {before[query]:>10.3f} "
+                    f"{after[query]:>10.3f} {speedup:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Helpers shared by the benchmarks: a local uvicorn server and JSON results."""
+
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import httpx
+
+ENV_PREFIX = "{{ cookiecutter.__package_slug | upper }}_"
+APP = "{{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }}:create_app"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(
+    port: int,
+    settings: Mapping[str, str],
+    extra_args: Sequence[str] = (),
+) -> subprocess.Popen:
+    """Start the app with uvicorn; `settings` are Settings fields, unprefixed."""
+    env = dict(os.environ)
+    env.update({ENV_PREFIX + name: value for name, value in settings.items()})
+    cmd = [sys.executable, "-m", "uvicorn", APP, "--factory", "--port", str(port)]
+    cmd += ["--log-level", "warning", *extra_args]
+    return subprocess.Popen(cmd, env=env)
+
+
+def start_workers(
+    port: int, settings: Mapping[str, str], workers: int
+) -> subprocess.Popen:
+    """Start the app through `python -m {{ cookiecutter.__package_slug }}` with `workers` processes."""
+    env = dict(os.environ)
+    env.update({ENV_PREFIX + name: value for name, value in settings.items()})
+    cmd = [sys.executable, "-m", "{{ cookiecutter.__package_slug }}", "--port", str(port)]
+    cmd += ["--workers", str(workers), "--log-level", "warning"]
+    return subprocess.Popen(cmd, env=env)
+
+
+def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(base_url + "/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+def percentile_ms(ordered: Sequence[float], p: float) -> float:
+    """Nearest-rank percentile `p` (0-100) of sorted seconds, in ms."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(len(ordered) * p / 100))
+    return ordered[rank - 1] * 1000
+
+
+def write_results(
+    suite: str,
+    config: Mapping[str, Any],
+    results: Mapping[str, Mapping[str, float]],
+    output: Optional[Path] = None,
+) -> Path:
+    """Write a results file that `benchmarks.compare` can diff; return its path.
+
+    `results` maps each benchmark name to its metrics. Metric names end in
+    the unit, which also tells compare whether lower (`_us`, `_ms`) or higher
+    (`_per_s`, `rps`) is better.
+    """
+    path = output or RESULTS_DIR / f"{suite}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document: Dict[str, Any] = {
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": dict(config),
+        "results": {name: dict(metrics) for name, metrics in results.items()},
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+    return path
@@ -0,0 +1,71 @@
+"""Compare two benchmark results files and flag regressions.
+
+Metrics are matched by benchmark and name. Names ending in `_us` or `_ms` are
+better when lower, `_per_s` and `rps` when higher; counts such as `requests`
+and `errors` are shown but never judged. Exits with status 1 when any
+metric is worse than the baseline by more than `--threshold` percent.
+
+Usage:
+    poetry run python -m benchmarks.compare baseline/micro.json benchmarks/results/micro.json
+    poetry run python -m benchmarks.compare old.json new.json --threshold 5
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+def direction(metric: str) -> Optional[int]:
+    """+1 when higher is better, -1 when lower is, None when not judged."""
+    if metric.endswith(("_per_s", "rps")):
+        return 1
+    if metric.endswith(("_us", "_ms")):
+        return -1
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    if baseline["suite"] != current["suite"]:
+        sys.exit(
+            f"cannot compare suite {baseline['suite']!r} with {current['suite']!r}"
+        )
+
+    regressions = 0
+    print(
+        f"{'benchmark':<32} {'metric':<10} {'baseline':>12} {'current':>12} "
+        f"{'change':>8}"
+    )
+    for name, metrics in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<32} (new)")
+            continue
+        for metric, value in metrics.items():
+            if metric not in before:
+                continue
+            old = before[metric]
+            change = (value - old) / old * 100 if old else 0.0
+            sign = direction(metric)
+            worse = sign is not None and -sign * change > args.threshold
+            regressions += worse
+            flag = "  REGRESSION" if worse else ""
+            print(
+                f"{name:<32} {metric:<10} {old:>12.2f} {value:>12.2f} "
+                f"{change:>+7.1f}%{flag}"
+            )
+    if regressions:
+        sys.exit(f"{regressions} metric(s) regressed by more than {args.threshold}%")
+
+
+if __name__ == "__main__":
+    main()
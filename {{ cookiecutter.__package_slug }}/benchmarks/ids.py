@@ -0,0 +1,186 @@
+"""Insert and lookup cost of task ids: UUIDv4 as hex text versus UUIDv7 as bytes.
+
+For each id scheme a fresh SQLite file (with the SQLite profile's pragmas)
+gets a table shaped like `tasks`: the id primary key, a task list id and the
+`(task_list_id, created_at, id)` pagination index. `--rows` rows are inserted
+in batches of `--batch`, then `--lookups` ids sampled evenly over the table
+are fetched one by one on a new connection, in random order.
+
+The schemes cross the generator with the column type, so the two effects can
+be told apart: `uuid4/char32` is the storage before migration 0007,
+`uuid7/blob` the default now. Random v4 keys insert into random pages of the
+primary key index, so once it outgrows the page cache most inserts read and
+rewrite a page from disk; v7 keys append to its right edge. Bytes instead of
+32 hex characters shrink the table and both indexes.
+
+`insert_rows_per_s` covers the whole load, `tail_insert_rows_per_s` its last
+tenth, when the index is largest. The gap grows with the table: the default
+size fits in the page cache, run with `--rows 10000000` to see it at 10M rows
+(allow tens of minutes per scheme). Results are written to
+`benchmarks/results/ids.json`.
+
+Usage:
+    poetry run python -m benchmarks.ids
+    poetry run python -m benchmarks.ids --rows 10000000 --batch 50000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    bindparam,
+    create_engine,
+    insert,
+    select,
+)
+
+from benchmarks.common import percentile_ms, write_results
+from {{ cookiecutter.__package_slug }}.domain.shared.ids import uuid7
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.sqlite import apply_sqlite_pragmas, sqlite_pragmas
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.types import CompactUuid
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+# name -> (id generator, column type)
+SCHEMES = {
+    "uuid4/char32": (uuid4, Uuid),
+    "uuid4/blob": (uuid4, CompactUuid),
+    "uuid7/char32": (uuid7, Uuid),
+    "uuid7/blob": (uuid7, CompactUuid),
+}
+LISTS = 1000
+
+
+def tasks_table(id_type) -> Table:
+    table = Table(
+        "tasks",
+        MetaData(),
+        Column("id", id_type, primary_key=True),
+        Column("task_list_id", id_type, nullable=False),
+        Column("title", String(200), nullable=False),
+        Column("created_at", DateTime(timezone=True), nullable=False),
+    )
+    Index(
+        "ix_tasks_task_list_id_created_at_id",
+        table.c.task_list_id,
+        table.c.created_at,
+        table.c.id,
+    )
+    return table
+
+
+def measure(scheme: str, args: argparse.Namespace, path: Path) -> Dict[str, float]:
+    generate, id_type = SCHEMES[scheme]
+    table = tasks_table(id_type)
+    url = f"sqlite:///{path}"
+    pragmas = sqlite_pragmas(Settings(SQLITE_CACHE_SIZE_KIB=args.cache_kib))
+
+    engine = create_engine(url)
+    apply_sqlite_pragmas(engine, pragmas)
+    table.metadata.create_all(engine)
+    list_ids = [generate() for _ in range(LISTS)]
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    every = max(1, args.rows // args.lookups)
+    sample: List = []
+    batch_seconds: List[float] = []
+    for start in range(0, args.rows, args.batch):
+        rows = []
+        for n in range(start, min(start + args.batch, args.rows)):
+            row_id = generate()
+            if n % every == 0:
+                sample.append(row_id)
+            rows.append(
+                {
+                    "id": row_id,
+                    "task_list_id": list_ids[n % LISTS],
+                    "title": f"task {n}",
+                    "created_at": base + timedelta(milliseconds=n),
+                }
+            )
+        begin = time.perf_counter()
+        with engine.begin() as connection:
+            connection.execute(insert(table), rows)
+        batch_seconds.append(time.perf_counter() - begin)
+    engine.dispose()
+
+    # A new engine, so lookups start from an empty page cache
+    engine = create_engine(url)
+    apply_sqlite_pragmas(engine, pragmas)
+    random.Random(42).shuffle(sample)
+    lookup = select(table.c.title).where(table.c.id == bindparam("id"))
+    latencies = []
+    with engine.connect() as connection:
+        for row_id in sample:
+            begin = time.perf_counter()
+            found: str = connection.execute(lookup, {"id": row_id}).scalar_one()
+            latencies.append(time.perf_counter() - begin)
+            assert found
+    engine.dispose()
+    latencies.sort()
+
+    tail = batch_seconds[-max(1, len(batch_seconds) // 10) :]
+    tail_rows = min(args.rows, len(tail) * args.batch)
+    return {
+        "insert_rows_per_s": args.rows / sum(batch_seconds),
+        "tail_insert_rows_per_s": tail_rows / sum(tail),
+        "lookup_p50_us": percentile_ms(latencies, 50) * 1000,
+        "lookup_p95_us": percentile_ms(latencies, 95) * 1000,
+        "file_mib": path.stat().st_size / 2**20,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument(
+        "--cache-kib",
+        type=int,
+        default=Settings.model_fields["SQLITE_CACHE_SIZE_KIB"].default,
+        help="SQLite page cache; shrink it to leave the cache with fewer rows",
+    )
+    parser.add_argument(
+        "--schemes", nargs="+", choices=list(SCHEMES), default=list(SCHEMES)
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'scheme':>13} {'insert/s':>10} {'tail/s':>10} "
+        f"{'p50 us':>8} {'p95 us':>8} {'MiB':>8}"
+    )
+    results = {}
+    for scheme in args.schemes:
+        with tempfile.TemporaryDirectory() as tmp:
+            r = measure(scheme, args, Path(tmp) / "ids.db")
+        print(
+            f"{scheme:>13} {r['insert_rows_per_s']:>10.0f} "
+            f"{r['tail_insert_rows_per_s']:>10.0f} {r['lookup_p50_us']:>8.1f} "
+            f"{r['lookup_p95_us']:>8.1f} {r['file_mib']:>8.1f}"
+        )
+        results[scheme] = r
+    config = {
+        "rows": args.rows,
+        "batch": args.batch,
+        "lookups": args.lookups,
+        "cache_kib": args.cache_kib,
+    }
+    path = write_results("ids", config, results, args.output)
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Import time of the application module, checked against a budget.
+
+`python -X importtime -c "import <module>"` runs `--repeat` times in fresh
+interpreters (bytecode already compiled by a first, unrecorded run). The
+median cumulative import time of the module is compared with `--budget-ms`,
+and the modules that cost the most on their own are listed so a regression
+can be traced to the import that introduced it. Importing the module must
+not build the app (servers call `create_app`) nor touch the database, so
+an unreachable DATABASE_URL is set. Results go to
+`benchmarks/results/importtime.json`.
+
+Exits with status 1 when the median exceeds the budget.
+
+Usage:
+    poetry run python -m benchmarks.importtime
+    poetry run python -m benchmarks.importtime --budget-ms 800 --repeat 10 --top 25
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.common import ENV_PREFIX, write_results
+
+APP_MODULE = "{{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }}"
+# A path SQLite cannot open: any connection attempt at import fails loudly
+UNREACHABLE_DATABASE_URL = "sqlite:////nonexistent/importtime.db"
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """Run one import; return {module: (self us, cumulative us)}."""
+    env = dict(os.environ)
+    env[ENV_PREFIX + "DATABASE_URL"] = UNREACHABLE_DATABASE_URL
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr}")
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=APP_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    import_times(args.module)  # compile bytecode, warm the file cache
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    totals = [run[args.module][1] / 1000 for run in runs]
+    median_ms = statistics.median(totals)
+
+    own_ms = {
+        name: statistics.median(run[name][0] for run in runs) / 1000
+        for name in runs[0]
+        if all(name in run for run in runs)
+    }
+    print(f"{'self ms':>8}  module")
+    for name, ms in sorted(own_ms.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"{ms:>8.1f}  {name}")
+    print(
+        f"\nimport {args.module}: median {median_ms:.0f} ms "
+        f"(min {min(totals):.0f}, max {max(totals):.0f}), "
+        f"budget {args.budget_ms:.0f} ms"
+    )
+
+    results = {args.module: {"import_ms": median_ms}}
+    config = {"module": args.module, "repeat": args.repeat, "budget_ms": args.budget_ms}
+    path = write_results("importtime", config, results, args.output)
+    print(f"results written to {path}")
+    if median_ms > args.budget_ms:
+        print(f"over budget by {median_ms - args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""HTTP load generator: a create/list/complete mix against a local uvicorn.
+
+Unless `--url` points at a running server, the application is started with
+uvicorn on a fresh SQLite database (or `--database-url`). `--lists` task lists
+are seeded with `--seed` tasks each, then `--concurrency` clients issue
+requests drawn from `--mix` for `--duration` seconds after a `--warmup`.
+Latency percentiles (p50/p95/p99) and throughput are reported per operation
+and overall, and written to `benchmarks/results/load.json` for
+`benchmarks.compare`.
+
+Operations:
+    create    POST /tasks/
+    list      GET /tasks/by-list/{id}?limit=50
+    complete  POST /tasks/{id}/complete on a task created earlier
+    summary   GET /task-lists/summary
+
+Usage:
+    poetry run python -m benchmarks.load
+    poetry run python -m benchmarks.load --concurrency 64 --duration 30 --mix create=1,list=8,complete=1
+    poetry run python -m benchmarks.load --url http://127.0.0.1:8000 --output /tmp/load.json
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.common import (
+    free_port,
+    percentile_ms,
+    start_server,
+    wait_ready,
+    write_results,
+)
+
+OPERATIONS = ("create", "list", "complete", "summary")
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class LoadRun:
+    """Clients sharing one connection pool and the ids they have created."""
+
+    def __init__(self, client: httpx.AsyncClient, list_ids: List[str], seed: int):
+        self._client = client
+        self._list_ids = list_ids
+        self._task_ids: List[str] = []
+        self._rng = random.Random(seed)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def seed(self, tasks_per_list: int) -> None:
+        for list_id in self._list_ids:
+            for start in range(0, tasks_per_list, 500):
+                items = [
+                    {"task_list_id": list_id, "title": f"seed {n}"}
+                    for n in range(start, min(start + 500, tasks_per_list))
+                ]
+                r = await self._client.post("/tasks/bulk", json={"items": items})
+                r.raise_for_status()
+                self._task_ids += [x["task"]["id"] for x in r.json()["results"]]
+
+    async def request(self, operation: str) -> httpx.Response:
+        list_id = self._rng.choice(self._list_ids)
+        if operation == "create":
+            payload = {"task_list_id": list_id, "title": "load"}
+            r = await self._client.post("/tasks/", json=payload)
+            if r.status_code == 200:
+                self._task_ids.append(r.json()["id"])
+            return r
+        if operation == "list":
+            url = f"/tasks/by-list/{list_id}"
+            return await self._client.get(url, params={"limit": 50})
+        if operation == "complete" and self._task_ids:
+            task_id = self._rng.choice(self._task_ids)
+            return await self._client.post(f"/tasks/{task_id}/complete")
+        return await self._client.get("/task-lists/summary")
+
+    async def client(
+        self, mix: Dict[str, float], until: float, record_from: float
+    ) -> None:
+        names, weights = list(mix), list(mix.values())
+        while (now := time.monotonic()) < until:
+            operation = self._rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                r = await self.request(operation)
+                ok = r.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - start
+            if now >= record_from:
+                self.latencies[operation].append(elapsed)
+                if not ok:
+                    self.errors[operation] += 1
+
+
+def summarize(latencies: List[float], errors: int, duration: float) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": len(ordered) / duration,
+        "p50_ms": percentile_ms(ordered, 50),
+        "p95_ms": percentile_ms(ordered, 95),
+        "p99_ms": percentile_ms(ordered, 99),
+    }
+
+
+async def drive(base_url: str, args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+        list_ids = []
+        for n in range(args.lists):
+            r = await client.post("/task-lists/", json={"name": f"load {n}"})
+            r.raise_for_status()
+            list_ids.append(r.json()["id"])
+        run = LoadRun(client, list_ids, seed=42)
+        await run.seed(args.seed)
+
+        record_from = time.monotonic() + args.warmup
+        until = record_from + args.duration
+        await asyncio.gather(
+            *(run.client(args.mix, until, record_from) for _ in range(args.concurrency))
+        )
+
+    results = {
+        op: summarize(run.latencies[op], run.errors[op], args.duration)
+        for op in OPERATIONS
+        if run.latencies[op]
+    }
+    everything = [x for op in OPERATIONS for x in run.latencies[op]]
+    results["all"] = summarize(everything, sum(run.errors.values()), args.duration)
+    return results
+
+
+def run_against_local_server(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'load.db'}"
+        settings = {"DATABASE_URL": database_url}
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(port, settings, args.uvicorn_arg)
+        try:
+            wait_ready(base_url)
+            return asyncio.run(drive(base_url, args))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="benchmark a running server")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument(
+        "--uvicorn-arg", action="append", default=[], help="extra uvicorn option"
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=200, help="tasks per list")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=parse_mix("create=2,list=6,complete=2")
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    if args.url:
+        results = asyncio.run(drive(args.url.rstrip("/"), args))
+    else:
+        results = run_against_local_server(args)
+
+    print(
+        f"{'operation':>9} {'requests':>9} {'errors':>7} {'rps':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:>9} {r['requests']:>9} {r['errors']:>7} {r['rps']:>9.1f} "
+            f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f}"
+        )
+    config = {
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "warmup": args.warmup,
+        "lists": args.lists,
+        "seed": args.seed,
+        "mix": args.mix,
+        "uvicorn_args": args.uvicorn_arg,
+    }
+    path = write_results("load", config, results, args.output)
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Micro-benchmarks of the per-request building blocks.
+
+Times entity mapping (`TaskModel.to_domain` / `from_domain`), response
+serialization (`TaskOut.from_domain`, `dump_json_many`) and the main
+`TaskRepositoryRds` operations against an in-memory SQLite database. Each
+benchmark runs `--number` operations per round and keeps the best of
+`--repeat` rounds; results are written to `benchmarks/results/micro.json`
+for `benchmarks.compare`.
+
+Usage:
+    poetry run python -m benchmarks.micro
+    poetry run python -m benchmarks.micro --number 2000 --repeat 7 --output /tmp/micro.json
+"""
+
+import argparse
+import itertools
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.common import write_results
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
+    TaskListRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
+
+PAGE = 50
+BULK = 100
+# (name, operations per call, setup returning the callable to time)
+Benchmark = Tuple[str, int, Callable[[], Callable[[], object]]]
+
+
+def make_task(task_list_id, n: int) -> Task:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return Task(
+        task_list_id=task_list_id,
+        title=f"task {n}",
+        description="x" * 200,
+        created_at=base + timedelta(seconds=n),
+    )
+
+
+def mapping_benchmarks() -> List[Benchmark]:
+    task = make_task(uuid4(), 0)
+    model = TaskModel.from_domain(task)
+    page = [make_task(task.task_list_id, n) for n in range(PAGE)]
+    return [
+        ("task.from_domain", 1, lambda: lambda: TaskModel.from_domain(task)),
+        ("task.to_domain", 1, lambda: model.to_domain),
+        ("task_out.from_domain", 1, lambda: lambda: TaskOut.from_domain(task)),
+        (
+            f"task_out.dump_json_many[{PAGE}]",
+            PAGE,
+            lambda: lambda: TaskOut.dump_json_many(page),
+        ),
+    ]
+
+
+def repository_benchmarks(session: Session) -> List[Benchmark]:
+    lists = TaskListRepositoryRds(session)
+    repo = TaskRepositoryRds(session)
+    tl = lists.create(TaskList(name="micro"))
+    counter = itertools.count()
+    seeded = repo.create_many([make_task(tl.id, next(counter)) for _ in range(1000)])
+    session.commit()
+    ids = itertools.cycle([t.id for t in seeded])
+
+    def create():
+        repo.create(make_task(tl.id, next(counter)))
+        session.commit()
+
+    def create_many():
+        repo.create_many([make_task(tl.id, next(counter)) for _ in range(BULK)])
+        session.commit()
+
+    def get():
+        session.expunge_all()
+        repo.get(next(ids))
+
+    def page():
+        session.expunge_all()
+        repo.page_by_task_list(tl.id, limit=PAGE)
+
+    def complete():
+        repo.complete(next(ids), completed_at=datetime.now(timezone.utc))
+        session.commit()
+
+    return [
+        ("repo.create", 1, lambda: create),
+        (f"repo.create_many[{BULK}]", BULK, lambda: create_many),
+        ("repo.get", 1, lambda: get),
+        (f"repo.page_by_task_list[{PAGE}]", PAGE, lambda: page),
+        ("repo.complete", 1, lambda: complete),
+    ]
+
+
+def best_us_per_op(
+    fn: Callable[[], object], ops: int, number: int, repeat: int
+) -> float:
+    calls = max(1, number // ops)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / (calls * ops) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000, help="operations per round")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="only names containing this")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'benchmark':<32} {'us/op':>10} {'ops/s':>12}")
+    with sessionmaker(bind=engine)() as session:
+        for name, ops, setup in mapping_benchmarks() + repository_benchmarks(session):
+            if args.filter not in name:
+                continue
+            us = best_us_per_op(setup(), ops, args.number, args.repeat)
+            results[name] = {"op_us": us}
+            print(f"{name:<32} {us:>10.2f} {1e6 / us:>12.0f}")
+    engine.dispose()
+    path = write_results(
+        "micro", {"number": args.number, "repeat": args.repeat}, results, args.output
+    )
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
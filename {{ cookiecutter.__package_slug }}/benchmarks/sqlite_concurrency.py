@@ -0,0 +1,176 @@
+"""Concurrent reads and writes on a SQLite file, with and without the profile.
+
+For each setting of `SQLITE_PROFILE` a fresh database is migrated and seeded
+with `--lists` task lists of `--seed` tasks. `--threads` threads (standing in
+for the threadpool serving requests) then run for `--duration` seconds, each
+unit of work in its own session from the container's session router, like a
+request: a read pages 50 tasks of a list through the read path, a write
+completes one task and creates another through the write path. Reads are
+`--read-ratio` of the work.
+
+Without the profile every unit shares one pool in rollback-journal mode:
+readers and writers block each other on the file lock, every commit is
+synced to disk, and writers that wait longer than the driver's 5 s timeout
+fail with "database is locked" (counted as errors). With it, writes queue
+for the single writer connection and reads proceed in parallel under WAL.
+The gain depends on the disk's sync cost and on the CPUs available. Throughput, p95 latency and errors are reported and written
+to `benchmarks/results/sqlite_concurrency.json`.
+
+Usage:
+    poetry run python -m benchmarks.sqlite_concurrency
+    poetry run python -m benchmarks.sqlite_concurrency --threads 32 --read-ratio 0.5
+"""
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dependency_injector import providers
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.common import percentile_ms, write_results
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.infrastructure.container import Container
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
+    TaskListRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+
+def seed(container: Container, lists: int, tasks_per_list: int):
+    """Create the task lists and their tasks; return (list ids, task ids)."""
+    with container.session_factory()() as session:
+        list_ids, task_ids = [], []
+        for n in range(lists):
+            tl = TaskListRepositoryRds(session).create(TaskList(name=f"list {n}"))
+            tasks = [
+                Task(task_list_id=tl.id, title=f"seed {i}")
+                for i in range(tasks_per_list)
+            ]
+            created = TaskRepositoryRds(session).create_many(tasks)
+            list_ids.append(tl.id)
+            task_ids += [t.id for t in created]
+        session.commit()
+    return list_ids, task_ids
+
+
+class Worker(threading.Thread):
+    def __init__(self, container, list_ids, task_ids, read_ratio, until, seed) -> None:
+        super().__init__()
+        self._router = container.session_router()
+        self._list_ids = list_ids
+        self._task_ids = task_ids
+        self._read_ratio = read_ratio
+        self._until = until
+        self._rng = random.Random(seed)
+        self.latencies: Dict[str, List[float]] = {"read": [], "write": []}
+        self.errors = 0
+
+    def read(self) -> None:
+        with self._router.for_read()() as session:
+            list_id = self._rng.choice(self._list_ids)
+            TaskRepositoryRds(session).page_by_task_list(list_id, limit=50)
+            session.commit()
+
+    def write(self) -> None:
+        with self._router.for_write()() as session:
+            repo = TaskRepositoryRds(session)
+            task_id = self._rng.choice(self._task_ids)
+            task = repo.get(task_id)
+            assert task is not None, "seeded tasks are never deleted"
+            repo.complete(task_id, completed_at=datetime.now(timezone.utc))
+            repo.create(Task(task_list_id=task.task_list_id, title="write"))
+            session.commit()
+
+    def run(self) -> None:
+        while time.monotonic() < self._until:
+            kind = "read" if self._rng.random() < self._read_ratio else "write"
+            start = time.perf_counter()
+            try:
+                getattr(self, kind)()
+            except OperationalError:
+                self.errors += 1
+                continue
+            self.latencies[kind].append(time.perf_counter() - start)
+
+
+def measure(profile: bool, args: argparse.Namespace) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        container = Container()
+        settings = Settings(
+            DATABASE_URL=f"sqlite:///{Path(tmp) / 'concurrency.db'}",
+            SQLITE_PROFILE=profile,
+        )
+        container.settings.override(providers.Object(settings))
+        container.init_database()
+        list_ids, task_ids = seed(container, args.lists, args.seed)
+
+        until = time.monotonic() + args.duration
+        workers = [
+            Worker(container, list_ids, task_ids, args.read_ratio, until, n)
+            for n in range(args.threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        for engine in [container.engine(), *container.replica_engines()]:
+            engine.dispose()
+
+    reads = sorted(x for w in workers for x in w.latencies["read"])
+    writes = sorted(x for w in workers for x in w.latencies["write"])
+    return {
+        "ops_per_s": (len(reads) + len(writes)) / args.duration,
+        "reads_per_s": len(reads) / args.duration,
+        "writes_per_s": len(writes) / args.duration,
+        "read_p95_ms": percentile_ms(reads, 95),
+        "write_p95_ms": percentile_ms(writes, 95),
+        "errors": float(sum(w.errors for w in workers)),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--read-ratio", type=float, default=0.8)
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=500, help="tasks per list")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'profile':>7} {'ops/s':>8} {'reads/s':>8} {'writes/s':>8} "
+        f"{'read p95':>9} {'write p95':>9} {'errors':>7}"
+    )
+    results = {}
+    for profile in (False, True):
+        r = measure(profile, args)
+        print(
+            f"{'on' if profile else 'off':>7} {r['ops_per_s']:>8.1f} "
+            f"{r['reads_per_s']:>8.1f} {r['writes_per_s']:>8.1f} "
+            f"{r['read_p95_ms']:>9.2f} {r['write_p95_ms']:>9.2f} {r['errors']:>7.0f}"
+        )
+        results[f"profile={'on' if profile else 'off'}"] = r
+    config = {
+        "threads": args.threads,
+        "duration": args.duration,
+        "read_ratio": args.read_ratio,
+        "lists": args.lists,
+        "seed": args.seed,
+    }
+    path = write_results("sqlite_concurrency", config, results, args.output)
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
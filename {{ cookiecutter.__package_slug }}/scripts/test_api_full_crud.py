@@ -0,0 +1,101 @@
+"""Exercise every API endpoint against a running server.
+
+Start the API first (`make start`), then run `make test-api`. Each step
+prints its status; the script exits with status 1 on the first unexpected
+response.
+
+Usage:
+    poetry run python scripts/test_api_full_crud.py
+    poetry run python scripts/test_api_full_crud.py --base-url http://127.0.0.1:8000 --verbose
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Optional
+
+import httpx
+
+
+class Flow:
+    def __init__(self, client: httpx.Client, verbose: bool) -> None:
+        self._client = client
+        self._verbose = verbose
+        self.steps = 0
+
+    def call(
+        self, method: str, url: str, expected: int = 200, **kwargs: Any
+    ) -> httpx.Response:
+        r = self._client.request(method, url, **kwargs)
+        self.steps += 1
+        ok = r.status_code == expected
+        print(f"{'✅' if ok else '❌'} {method:<5} {url} -> {r.status_code}")
+        if self._verbose or not ok:
+            body = r.text
+            if r.headers.get("content-type", "").startswith("application/json"):
+                body = json.dumps(r.json(), indent=2, ensure_ascii=False)
+            print(body[:2000])
+        if not ok:
+            sys.exit(f"expected {expected} from {method} {url}")
+        return r
+
+
+def run(base_url: str, verbose: bool) -> int:
+    with httpx.Client(base_url=base_url, timeout=30) as client:
+        flow = Flow(client, verbose)
+        flow.call("GET", "/health")
+
+        tl = flow.call("POST", "/task-lists/", json={"name": "CRUD flow"}).json()
+        other = flow.call("POST", "/task-lists/", json={"name": "CRUD other"}).json()
+        flow.call("GET", "/task-lists/", params={"limit": 5})
+
+        payload = {"task_list_id": tl["id"], "title": "report", "description": "q3"}
+        task = flow.call("POST", "/tasks/", json=payload).json()
+        items = [{"task_list_id": tl["id"], "title": f"bulk {i}"} for i in range(3)]
+        bulk = flow.call("POST", "/tasks/bulk", json={"items": items}).json()
+        bulk_ids = [r["task"]["id"] for r in bulk["results"]]
+
+        r = flow.call("GET", f"/tasks/by-list/{tl['id']}", params={"limit": 2})
+        cursor: Optional[str] = r.headers.get("X-Next-Cursor")
+        if cursor:
+            flow.call("GET", f"/tasks/by-list/{tl['id']}", params={"cursor": cursor})
+        etag = r.headers.get("ETag")
+        if etag:
+            flow.call(
+                "GET",
+                f"/tasks/by-list/{tl['id']}",
+                expected=304,
+                params={"limit": 2},
+                headers={"If-None-Match": etag},
+            )
+
+        flow.call("PATCH", f"/tasks/{task['id']}", json={"title": "write the report"})
+        flow.call("PATCH", f"/tasks/{bulk_ids[0]}", json={"task_list_id": other["id"]})
+        flow.call("POST", f"/tasks/{task['id']}/complete")
+        flow.call("POST", "/tasks/complete", json={"task_ids": bulk_ids[1:2]})
+        flow.call("POST", f"/task-lists/{tl['id']}/complete-all")
+
+        flow.call("GET", "/task-lists/summary")
+        flow.call("GET", "/tasks/search", params={"q": "report"})
+        flow.call("GET", f"/tasks/by-list/{tl['id']}/export", params={"format": "csv"})
+
+        missing = "00000000-0000-0000-0000-000000000000"
+        flow.call("POST", f"/tasks/{missing}/complete", expected=404)
+        flow.call("POST", "/tasks/", expected=422, json={"task_list_id": tl["id"]})
+    return flow.steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    try:
+        steps = run(args.base_url.rstrip("/"), args.verbose)
+    except httpx.TransportError as exc:
+        sys.exit(f"cannot reach {args.base_url}: {exc} (is `make start` running?)")
+    print(f"🎉 {steps} requests succeeded")
+
+
+if __name__ == "__main__":
+    main()
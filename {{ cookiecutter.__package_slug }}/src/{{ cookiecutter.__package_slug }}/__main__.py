@@ -0,0 +1,87 @@
+"""Run the API server: `python -m {{ cookiecutter.__package_slug }}`.
+
+Options override the SERVER_* settings, which are read from the environment.
+"""
+
+import os
+from typing import Any, Optional, Union
+
+import click
+
+from {{ cookiecutter.__package_slug }}.infrastructure.container import Container
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+from {{ cookiecutter.__package_slug }}.infrastructure.web.server import APP, multi_worker_warnings, uvicorn_options
+
+
+class WorkersType(click.ParamType):
+    """A worker count of at least 1, or "auto" for one per CPU."""
+
+    name = "integer|auto"
+
+    def convert(
+        self,
+        value: Any,
+        param: Optional[click.Parameter],
+        ctx: Optional[click.Context],
+    ) -> Union[int, str]:
+        if value == "auto":
+            return value
+        return click.IntRange(min=1).convert(value, param, ctx)
+
+
+@click.command()
+@click.option("--host", help="Bind address [SERVER_HOST].")
+@click.option("--port", type=int, help="Bind port [SERVER_PORT].")
+@click.option(
+    "--workers",
+    type=WorkersType(),
+    help='Worker processes, or "auto" for one per CPU [SERVER_WORKERS, default: 1].',
+)
+@click.option(
+    "--loop",
+    type=click.Choice(["auto", "asyncio", "uvloop"]),
+    help="Event loop [SERVER_LOOP].",
+)
+@click.option(
+    "--http",
+    type=click.Choice(["auto", "h11", "httptools"]),
+    help="HTTP parser [SERVER_HTTP].",
+)
+@click.option("--log-level", default="info", show_default=True)
+def main(
+    host: Optional[str],
+    port: Optional[int],
+    workers: Union[int, str, None],
+    loop: Optional[str],
+    http: Optional[str],
+    log_level: str,
+) -> None:
+    """Migrate the database once, then serve the API with N workers."""
+    import uvicorn
+
+    container = Container()
+    overrides = {
+        "SERVER_HOST": host,
+        "SERVER_PORT": port,
+        "SERVER_WORKERS": workers,
+        "SERVER_LOOP": loop,
+        "SERVER_HTTP": http,
+    }
+    settings = container.settings().model_copy(
+        update={k: v for k, v in overrides.items() if v is not None}
+    )
+    # Migrate here once instead of in every worker's lifespan, where they
+    # would race to upgrade the same schema
+    if settings.DATABASE_MIGRATE_ON_STARTUP:
+        container.init_database()
+        container.engine().dispose()
+        prefix = Settings.model_config.get("env_prefix", "")
+        os.environ[prefix + "DATABASE_MIGRATE_ON_STARTUP"] = "false"
+    options = uvicorn_options(settings)
+    for warning in multi_worker_warnings(settings, options["workers"]):
+        click.echo(f"warning: {warning}", err=True)
+    uvicorn.run(APP, factory=True, log_level=log_level, **options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from typing import Any, Awaitable, Callable, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class Runner(Protocol):
+    """Runs a blocking domain call on behalf of an async caller.
+
+    The web layer decides where the call executes: a worker thread for the
+    sync persistence stack, or a greenlet bound to an `AsyncSession` for the
+    async one. Each use-case call is one hop through the runner, so a
+    request that calls two use cases pays for two thread handoffs.
+    """
+
+    def __call__(
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> Awaitable[T]: ...
+
+
+async def run_inline(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Call `fn` directly, blocking the event loop while it runs.
+
+    Meant for tests and scripts without a running server; the web layer
+    passes `run_in_threadpool` or an `AsyncSession` runner instead.
+    """
+    return fn(*args, **kwargs)
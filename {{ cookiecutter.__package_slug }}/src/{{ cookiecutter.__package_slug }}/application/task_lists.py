@@ -1,23 +1,68 @@
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
+from {{ cookiecutter.__package_slug }}.application.runner import Runner
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_summary import TaskListSummary
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_with_tasks import TaskListWithTasks
 from {{ cookiecutter.__package_slug }}.domain.services.task_list_service import (
     TaskListService as DomainTaskListService,
 )
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
 
 
 class TaskListUseCases:
     """Application use cases for TaskList.
 
     Coordinates request/response boundaries and delegates domain logic to
-    the `TaskListService`.
+    the `TaskListService`. Calls are awaitable; `run` decides where the
+    blocking domain and persistence work executes, one hop per call.
     """
 
-    def __init__(self, service: DomainTaskListService) -> None:
+    def __init__(self, service: DomainTaskListService, run: Runner) -> None:
         self._service = service
+        self._run = run
 
-    def create(self, name: str) -> TaskList:
-        return self._service.create(name)
+    async def create(self, name: str) -> TaskList:
+        return await self._run(self._service.create, name)
 
-    def list(self, *, offset: int = 0, limit: int = 100) -> List[TaskList]:
-        return self._service.list(offset=offset, limit=limit)
+    async def get(self, task_list_id: UUID) -> Optional[TaskList]:
+        return await self._run(self._service.get, task_list_id)
+
+    async def list(self, *, offset: int = 0, limit: int = 100) -> List[TaskList]:
+        return await self._run(self._service.list, offset=offset, limit=limit)
+
+    async def page(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskList]:
+        return await self._run(self._service.page, cursor=cursor, limit=limit)
+
+    async def page_summaries(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskListSummary]:
+        return await self._run(self._service.page_summaries, cursor=cursor, limit=limit)
+
+    async def get_with_tasks(
+        self, task_list_id: UUID, *, tasks_limit: int = 100
+    ) -> Optional[TaskListWithTasks]:
+        return await self._run(
+            self._service.get_with_tasks, task_list_id, tasks_limit=tasks_limit
+        )
+
+    async def page_with_tasks(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        tasks_limit: int = 100,
+    ) -> Page[TaskListWithTasks]:
+        return await self._run(
+            self._service.page_with_tasks,
+            cursor=cursor,
+            limit=limit,
+            tasks_limit=tasks_limit,
+        )
+
+    async def watermark(self) -> Watermark:
+        return await self._run(self._service.watermark)
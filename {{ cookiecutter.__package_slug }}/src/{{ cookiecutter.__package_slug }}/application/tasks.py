@@ -1,29 +1,113 @@
-from typing import List
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from uuid import UUID
 
+from {{ cookiecutter.__package_slug }}.application.runner import Runner
 from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_completion import TaskCompletion
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
 from {{ cookiecutter.__package_slug }}.domain.services.task_service import TaskService as DomainTaskService
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
 
 
 class TaskUseCases:
     """Application use cases for Task.
 
     Coordinates request/response boundaries and delegates domain logic to
-    the `TaskService`.
+    the `TaskService`. Calls are awaitable; `run` decides where the blocking
+    domain and persistence work executes, one hop per call.
     """
 
-    def __init__(self, service: DomainTaskService) -> None:
+    def __init__(self, service: DomainTaskService, run: Runner) -> None:
         self._service = service
+        self._run = run
 
-    def add(
+    async def add(
         self, task_list_id: UUID, title: str, description: str | None = None
     ) -> Task:
-        return self._service.add(task_list_id, title, description)
+        return await self._run(self._service.add, task_list_id, title, description)
 
-    def complete(self, task_id: UUID) -> Task:
-        return self._service.complete(task_id)
+    async def add_many(
+        self, items: Iterable[Tuple[UUID, str, Optional[str]]]
+    ) -> List[Optional[Task]]:
+        return await self._run(self._service.add_many, items)
 
-    def list(
+    async def complete(self, task_id: UUID) -> Task:
+        return await self._run(self._service.complete, task_id)
+
+    async def complete_many(
+        self, task_ids: Sequence[UUID]
+    ) -> Dict[UUID, Optional[TaskCompletion]]:
+        return await self._run(self._service.complete_many, task_ids)
+
+    async def complete_all(self, task_list_id: UUID) -> List[Task]:
+        return await self._run(self._service.complete_all, task_list_id)
+
+    async def patch(self, task_id: UUID, changes: Mapping[str, Any]) -> Task:
+        return await self._run(self._service.patch, task_id, changes)
+
+    async def list(
         self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
     ) -> List[Task]:
-        return self._service.list(task_list_id, offset=offset, limit=limit)
+        return await self._run(
+            self._service.list, task_list_id, offset=offset, limit=limit
+        )
+
+    async def page(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[Task]:
+        return await self._run(
+            self._service.page, task_list_id, cursor=cursor, limit=limit
+        )
+
+    async def list_summaries(
+        self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
+    ) -> List[TaskSummary]:
+        return await self._run(
+            self._service.list_summaries, task_list_id, offset=offset, limit=limit
+        )
+
+    async def page_summaries(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        return await self._run(
+            self._service.page_summaries, task_list_id, cursor=cursor, limit=limit
+        )
+
+    async def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        return await self._run(self._service.search, query, cursor=cursor, limit=limit)
+
+    async def stream(
+        self, task_list_id: UUID, *, batch_size: int = 1000
+    ) -> AsyncIterator[List[Task]]:
+        """Yield chunks of a list's tasks, fetching each one through `run`.
+
+        The underlying cursor stays open between chunks, so the caller must
+        keep the session alive until iteration ends.
+        """
+        chunks = await self._run(
+            self._service.stream, task_list_id, batch_size=batch_size
+        )
+        try:
+            while True:
+                chunk = await self._run(next, chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            await self._run(chunks.close)
+
+    async def watermark(self, task_list_id: UUID) -> Watermark:
+        return await self._run(self._service.watermark, task_list_id)
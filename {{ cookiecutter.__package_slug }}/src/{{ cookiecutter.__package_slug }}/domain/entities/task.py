@@ -1,20 +1,26 @@
 from datetime import datetime, timezone
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import Annotated, Any, Dict, Mapping, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+
+from {{ cookiecutter.__package_slug }}.domain.shared.ids import new_id
+
+# Fields a partial update may change; the rest are set by the domain
+PATCHABLE_FIELDS = frozenset({"task_list_id", "title", "description", "is_completed"})
 
 
 class Task(BaseModel):
     """Domain entity representing a single task within a task list."""
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     task_list_id: UUID
     title: str = Field(min_length=1, max_length=200)
     description: Optional[str] = Field(default=None, max_length=1000)
     is_completed: bool = False
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     @model_validator(mode="after")
     def _sync_completed_at(self) -> "Task":
@@ -30,3 +36,23 @@ class Task(BaseModel):
         if not self.is_completed:
             self.is_completed = True
             self.completed_at = datetime.now(timezone.utc)
+            self.updated_at = self.completed_at
+
+    @classmethod
+    def validate_changes(cls, changes: Mapping[str, Any]) -> Dict[str, Any]:
+        """Validate a partial update against the field constraints.
+
+        Raises ValueError for fields outside PATCHABLE_FIELDS and
+        ValidationError for invalid values. `completed_at` is not accepted;
+        it follows `is_completed` as in `_sync_completed_at`.
+        """
+        unknown = set(changes) - PATCHABLE_FIELDS
+        if unknown:
+            names = ", ".join(sorted(unknown))
+            raise ValueError(f"Fields cannot be changed: {names}")
+        validated: Dict[str, Any] = {}
+        for name, value in changes.items():
+            field = cls.model_fields[name]
+            adapter: TypeAdapter[Any] = TypeAdapter(Annotated[field.annotation, field])
+            validated[name] = adapter.validate_python(value)
+        return validated
@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+
+
+class TaskCompletion(NamedTuple):
+    """A task after a complete request, and whether that request completed it.
+
+    `changed` is False when the task was already completed, so callers can
+    tell a real transition from a repeated request.
+    """
+
+    task: Task
+    changed: bool
@@ -1,14 +1,16 @@
 from datetime import datetime, timezone
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from {{ cookiecutter.__package_slug }}.domain.shared.ids import new_id
+
 
 class TaskList(BaseModel):
     """Domain entity representing a list of tasks."""
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     name: str = Field(min_length=1, max_length=120)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime] = None
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class TaskListSummary(BaseModel):
+    """Read model of a task list with its task counts."""
+
+    id: UUID
+    name: str
+    created_at: datetime
+    total: int = 0
+    completed: int = 0
+    # Latest change to the list or any of its tasks
+    last_activity_at: Optional[datetime] = None
+
+    @property
+    def open(self) -> int:
+        return self.total - self.completed
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+
+
+class TaskListWithTasks(BaseModel):
+    """Read model of a task list with its first tasks in creation order."""
+
+    id: UUID
+    name: str
+    created_at: datetime
+    tasks: List[Task] = []
+    # Whether the list holds more tasks than were loaded with it
+    has_more_tasks: bool = False
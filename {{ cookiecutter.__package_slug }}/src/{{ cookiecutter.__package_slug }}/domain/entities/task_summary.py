@@ -0,0 +1,15 @@
+from typing import NamedTuple
+from uuid import UUID
+
+
+class TaskSummary(NamedTuple):
+    """Read-only projection of a Task for listings.
+
+    Carries only the columns list views show, so repositories can fetch it
+    as a plain row without loading descriptions or timestamps.
+    """
+
+    id: UUID
+    task_list_id: UUID
+    title: str
+    is_completed: bool
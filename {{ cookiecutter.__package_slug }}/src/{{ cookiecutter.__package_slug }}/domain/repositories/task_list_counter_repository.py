@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Iterable, Protocol, runtime_checkable
+from uuid import UUID
+
+
+@runtime_checkable
+class TaskListCounterRepository(Protocol):
+    """Abstraction for the materialized per-list task counters.
+
+    Counters back `TaskListRepository.page_summaries` when enabled and are
+    written in the same transaction as the task changes they reflect, as
+    `increment` deltas; `refresh` and `rebuild` recount from the tasks.
+    """
+
+    def increment(
+        self, task_list_id: UUID, *, total: int = 0, completed: int = 0, at: datetime
+    ) -> None: ...
+
+    def refresh(self, task_list_ids: Iterable[UUID]) -> None: ...
+
+    def rebuild(self) -> None: ...
@@ -2,6 +2,10 @@ from typing import List, Optional, Protocol, runtime_checkable
 from uuid import UUID
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_summary import TaskListSummary
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_with_tasks import TaskListWithTasks
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
 
 
 @runtime_checkable
@@ -12,6 +16,28 @@ class TaskListRepository(Protocol):
 
     def list(self, *, offset: int = 0, limit: int = 100) -> List[TaskList]: ...
 
+    def page(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskList]: ...
+
+    def page_summaries(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskListSummary]: ...
+
+    def get_with_tasks(
+        self, task_list_id: UUID, *, tasks_limit: int = 100
+    ) -> Optional[TaskListWithTasks]: ...
+
+    def page_with_tasks(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        tasks_limit: int = 100,
+    ) -> Page[TaskListWithTasks]: ...
+
+    def watermark(self) -> Watermark: ...
+
     def create(self, task_list: TaskList) -> TaskList: ...
 
     def update(self, task_list: TaskList) -> TaskList: ...
@@ -1,7 +1,23 @@
-from typing import List, Optional, Protocol, runtime_checkable
+from datetime import datetime
+from typing import (
+    Any,
+    Collection,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    runtime_checkable,
+)
 from uuid import UUID
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_completion import TaskCompletion
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
 
 
 @runtime_checkable
@@ -14,8 +30,74 @@ class TaskRepository(Protocol):
         self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
     ) -> List[Task]: ...
 
+    def page_by_task_list(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[Task]: ...
+
+    def stream_by_task_list(
+        self, task_list_id: UUID, *, batch_size: int = 1000
+    ) -> Generator[List[Task], None, None]:
+        """Yield all tasks of a list in `(created_at, id)` order, in chunks.
+
+        Memory stays bounded by `batch_size` whatever the size of the list.
+        """
+        ...
+
+    def watermark_by_task_list(self, task_list_id: UUID) -> Watermark: ...
+
+    def list_summaries_by_task_list(
+        self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
+    ) -> List[TaskSummary]: ...
+
+    def page_summaries_by_task_list(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]: ...
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]: ...
+
     def create(self, task: Task) -> Task: ...
 
+    def create_many(self, tasks: Sequence[Task]) -> List[Task]: ...
+
+    def existing_task_list_ids(self, task_list_ids: Collection[UUID]) -> Set[UUID]:
+        """Those of `task_list_ids` naming a stored task list, in one query."""
+        ...
+
     def update(self, task: Task) -> Task: ...
 
+    def complete(
+        self, task_id: UUID, *, completed_at: datetime
+    ) -> Optional[TaskCompletion]:
+        """Mark a task completed in one atomic write; None if it does not exist.
+
+        Idempotent: an already completed task is returned unchanged, with
+        `changed=False`.
+        """
+        ...
+
+    def complete_many(
+        self, task_ids: Sequence[UUID], *, completed_at: datetime
+    ) -> List[TaskCompletion]:
+        """Complete many tasks with set-based writes; returns those that exist."""
+        ...
+
+    def complete_by_task_list(
+        self, task_list_id: UUID, *, completed_at: datetime
+    ) -> List[Task]:
+        """Complete all open tasks of a list; returns the tasks it completed."""
+        ...
+
+    def patch(
+        self, task_id: UUID, changes: Mapping[str, Any], *, now: datetime
+    ) -> Optional[Task]:
+        """Apply validated field changes in one atomic write; None if missing.
+
+        Setting `is_completed` keeps `completed_at` in line with it (see
+        `Task._sync_completed_at`); `now` stamps `updated_at` and a new
+        completion.
+        """
+        ...
+
     def delete(self, task_id: UUID) -> bool: ...
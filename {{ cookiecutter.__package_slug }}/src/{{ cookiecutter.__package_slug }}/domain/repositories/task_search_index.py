@@ -0,0 +1,16 @@
+from typing import Iterable, Optional, Protocol, runtime_checkable
+from uuid import UUID
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+
+
+@runtime_checkable
+class TaskSearchIndex(Protocol):
+    """Abstraction for full-text search over task titles and descriptions."""
+
+    def refresh(self, task_ids: Iterable[UUID]) -> None: ...
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]: ...
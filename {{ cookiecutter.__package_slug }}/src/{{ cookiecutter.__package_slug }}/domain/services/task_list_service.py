@@ -1,19 +1,29 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_summary import TaskListSummary
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_with_tasks import TaskListWithTasks
 from {{ cookiecutter.__package_slug }}.domain.repositories.task_list_repository import TaskListRepository
+from {{ cookiecutter.__package_slug }}.domain.shared.changes import ChangeEvent, ChangePublisher
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
 
 
 class TaskListService:
     """Domain service for operations on TaskList aggregates.
 
     This encapsulates business rules around creating and listing task lists,
-    relying only on the repository interface.
+    relying only on the repository interface. When `changes` is given, new
+    lists are published to it.
     """
 
-    def __init__(self, repo: TaskListRepository) -> None:
+    def __init__(
+        self, repo: TaskListRepository, changes: Optional[ChangePublisher] = None
+    ) -> None:
         self._repo = repo
+        self._changes = changes
 
     def create(self, name: str) -> TaskList:
         """Create a new task list with the provided name.
@@ -21,8 +31,55 @@ class TaskListService:
         Ensures timestamps are set using UTC.
         """
         entity = TaskList(name=name, created_at=datetime.now(timezone.utc))
-        return self._repo.create(entity)
+        created = self._repo.create(entity)
+        if self._changes is not None:
+            self._changes.publish(
+                [
+                    ChangeEvent(
+                        type="task_list.created",
+                        task_list_id=created.id,
+                        task_list=created,
+                    )
+                ]
+            )
+        return created
+
+    def get(self, task_list_id: UUID) -> Optional[TaskList]:
+        """Return the task list with this id, or None."""
+        return self._repo.get(task_list_id)
 
     def list(self, *, offset: int = 0, limit: int = 100) -> List[TaskList]:
         """Return a paginated collection of task lists."""
         return self._repo.list(offset=offset, limit=limit)
+
+    def page(self, *, cursor: Optional[str] = None, limit: int = 100) -> Page[TaskList]:
+        """Return a keyset-paginated window of task lists."""
+        return self._repo.page(cursor=cursor, limit=limit)
+
+    def page_summaries(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskListSummary]:
+        """Return task lists with their task counts, keyset-paginated."""
+        return self._repo.page_summaries(cursor=cursor, limit=limit)
+
+    def get_with_tasks(
+        self, task_list_id: UUID, *, tasks_limit: int = 100
+    ) -> Optional[TaskListWithTasks]:
+        """Return the task list with its first `tasks_limit` tasks, or None."""
+        return self._repo.get_with_tasks(task_list_id, tasks_limit=tasks_limit)
+
+    def page_with_tasks(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        tasks_limit: int = 100,
+    ) -> Page[TaskListWithTasks]:
+        """Return task lists with their first tasks, keyset-paginated."""
+        return self._repo.page_with_tasks(
+            cursor=cursor, limit=limit, tasks_limit=tasks_limit
+        )
+
+    def watermark(self) -> Watermark:
+        """Return the cheap change marker of the task list collection."""
+        return self._repo.watermark()
@@ -1,20 +1,61 @@
+from collections import Counter
 from datetime import datetime, timezone
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from uuid import UUID
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_completion import TaskCompletion
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_list_counter_repository import (
+    TaskListCounterRepository,
+)
 from {{ cookiecutter.__package_slug }}.domain.repositories.task_repository import TaskRepository
+from {{ cookiecutter.__package_slug }}.domain.shared.changes import ChangeEvent, ChangePublisher, ChangeType
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
+
+
+# Task fields the per-list counters depend on
+COUNTED_FIELDS = frozenset({"task_list_id", "is_completed"})
+
+
+def _stamped_at(task: Task, now: datetime) -> bool:
+    """Whether a write at `now` changed the task (it then set `updated_at`)."""
+    stamp = task.updated_at
+    if stamp is None:
+        return False
+    # SQLite hands timestamps back without their UTC offset
+    return (stamp if stamp.tzinfo else stamp.replace(tzinfo=timezone.utc)) == now
 
 
 class TaskService:
     """Domain service for operations on Task entities.
 
     Provides orchestration for adding, completing and listing tasks while
-    deferring persistence to the repository interface.
+    deferring persistence to the repository interface. When `counters` is
+    given, the per-list task counters are kept up to date with every write;
+    when `changes` is given, every write is published to it.
     """
 
-    def __init__(self, repo: TaskRepository) -> None:
+    def __init__(
+        self,
+        repo: TaskRepository,
+        counters: Optional[TaskListCounterRepository] = None,
+        changes: Optional[ChangePublisher] = None,
+    ) -> None:
         self._repo = repo
+        self._counters = counters
+        self._changes = changes
 
     def add(
         self, task_list_id: UUID, title: str, description: str | None = None
@@ -26,21 +67,176 @@ class TaskService:
             description=description,
             created_at=datetime.now(timezone.utc),
         )
-        return self._repo.create(entity)
+        created = self._repo.create(entity)
+        if self._counters is not None:
+            self._counters.increment(task_list_id, total=1, at=entity.created_at)
+        self._publish("task.created", [created])
+        return created
+
+    def add_many(
+        self, items: Iterable[Tuple[UUID, str, Optional[str]]]
+    ) -> List[Optional[Task]]:
+        """Create and persist many tasks given `(task_list_id, title, description)`.
+
+        Entities are validated before anything is written, so an invalid item
+        raises ValidationError and nothing is persisted. Items whose task list
+        does not exist are skipped; the result holds the created task for each
+        item, or None for the skipped ones.
+        """
+        entities = [
+            Task(
+                task_list_id=task_list_id,
+                title=title,
+                description=description,
+                created_at=datetime.now(timezone.utc),
+            )
+            for task_list_id, title, description in items
+        ]
+        lists = self._repo.existing_task_list_ids({t.task_list_id for t in entities})
+        valid = [t for t in entities if t.task_list_id in lists]
+        created = self._repo.create_many(valid)
+        if self._counters is not None and created:
+            at = max(t.created_at for t in valid)
+            per_list = Counter(t.task_list_id for t in created)
+            for task_list_id, added in per_list.items():
+                self._counters.increment(task_list_id, total=added, at=at)
+        self._publish("task.created", created)
+        stored = iter(created)
+        return [next(stored) if t.task_list_id in lists else None for t in entities]
 
     def complete(self, task_id: UUID) -> Task:
-        """Mark a task as completed and persist the change.
+        """Mark a task as completed in a single repository write.
 
-        Raises KeyError if the task does not exist.
+        Completing an already completed task is a no-op: nothing is counted
+        or published. Raises KeyError if the task does not exist.
         """
-        existing = self._repo.get(task_id)
-        if existing is None:
+        now = datetime.now(timezone.utc)
+        result = self._repo.complete(task_id, completed_at=now)
+        if result is None:
             raise KeyError("Task not found")
-        existing.mark_completed()
-        return self._repo.update(existing)
+        if result.changed:
+            self._count_completed([result.task], now)
+            self._publish("task.completed", [result.task])
+        return result.task
+
+    def complete_many(
+        self, task_ids: Sequence[UUID]
+    ) -> Dict[UUID, Optional[TaskCompletion]]:
+        """Complete many tasks at once, with the same rules as `complete`.
+
+        Returns each requested id (duplicates collapsed, order kept) mapped to
+        its completion, or None if it does not exist. Only tasks this call
+        completed are counted and published.
+        """
+        unique = list(dict.fromkeys(task_ids))
+        now = datetime.now(timezone.utc)
+        results = self._repo.complete_many(unique, completed_at=now)
+        changed = [r.task for r in results if r.changed]
+        self._count_completed(changed, now)
+        self._publish("task.completed", changed)
+        by_id = {r.task.id: r for r in results}
+        return {task_id: by_id.get(task_id) for task_id in unique}
+
+    def complete_all(self, task_list_id: UUID) -> List[Task]:
+        """Complete every open task of a list and return the tasks completed."""
+        now = datetime.now(timezone.utc)
+        completed = self._repo.complete_by_task_list(task_list_id, completed_at=now)
+        if self._counters is not None and completed:
+            # Only open tasks were updated, so the delta is exact
+            self._counters.increment(task_list_id, completed=len(completed), at=now)
+        self._publish("task.completed", completed)
+        return completed
+
+    def patch(self, task_id: UUID, changes: Mapping[str, Any]) -> Task:
+        """Apply a partial update in a single repository write.
+
+        Raises ValueError/ValidationError for invalid changes and KeyError if
+        the task does not exist.
+        """
+        values = Task.validate_changes(changes)
+        previous: Optional[Task] = None
+        if self._counters is not None and COUNTED_FIELDS & values.keys():
+            previous = self._repo.get(task_id)
+        now = datetime.now(timezone.utc)
+        task = self._repo.patch(task_id, values, now=now)
+        if task is None:
+            raise KeyError("Task not found")
+        if self._counters is not None and _stamped_at(task, now):
+            self._count_patch(previous or task, task, now)
+        self._publish("task.updated", [task])
+        return task
 
     def list(
         self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
     ) -> List[Task]:
         """Return a paginated collection of tasks for a given list."""
         return self._repo.list_by_task_list(task_list_id, offset=offset, limit=limit)
+
+    def page(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[Task]:
+        """Return a keyset-paginated window of tasks for a given list."""
+        return self._repo.page_by_task_list(task_list_id, cursor=cursor, limit=limit)
+
+    def list_summaries(
+        self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
+    ) -> List[TaskSummary]:
+        """Return list view rows for a list, offset-paginated."""
+        return self._repo.list_summaries_by_task_list(
+            task_list_id, offset=offset, limit=limit
+        )
+
+    def page_summaries(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        """Return list view rows for a list, keyset-paginated."""
+        return self._repo.page_summaries_by_task_list(
+            task_list_id, cursor=cursor, limit=limit
+        )
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        """Return tasks matching `query` in titles or descriptions, ranked."""
+        return self._repo.search(query, cursor=cursor, limit=limit)
+
+    def stream(
+        self, task_list_id: UUID, *, batch_size: int = 1000
+    ) -> Generator[List[Task], None, None]:
+        """Yield every task of a list in creation order, `batch_size` at a time."""
+        return self._repo.stream_by_task_list(task_list_id, batch_size=batch_size)
+
+    def watermark(self, task_list_id: UUID) -> Watermark:
+        """Return the cheap change marker of a list's tasks."""
+        return self._repo.watermark_by_task_list(task_list_id)
+
+    def _count_completed(self, tasks: Sequence[Task], at: datetime) -> None:
+        if self._counters is not None and tasks:
+            per_list = Counter(t.task_list_id for t in tasks)
+            for task_list_id, completed in per_list.items():
+                self._counters.increment(task_list_id, completed=completed, at=at)
+
+    def _count_patch(self, previous: Task, task: Task, at: datetime) -> None:
+        # Deltas keep the write O(1); `refresh` recounts a list if they drift
+        counters = self._counters
+        if counters is None:
+            return
+        if previous.task_list_id != task.task_list_id:
+            counters.increment(
+                previous.task_list_id,
+                total=-1,
+                completed=-int(previous.is_completed),
+                at=at,
+            )
+            counters.increment(
+                task.task_list_id, total=1, completed=int(task.is_completed), at=at
+            )
+        else:
+            completed = int(task.is_completed) - int(previous.is_completed)
+            counters.increment(task.task_list_id, completed=completed, at=at)
+
+    def _publish(self, type: ChangeType, tasks: Iterable[Task]) -> None:
+        if self._changes is not None:
+            events = [ChangeEvent.for_task(type, task) for task in tasks]
+            if events:
+                self._changes.publish(events)
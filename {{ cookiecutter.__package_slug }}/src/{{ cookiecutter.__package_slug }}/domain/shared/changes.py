@@ -0,0 +1,38 @@
+from typing import Literal, Optional, Protocol, Sequence, runtime_checkable
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+
+ChangeType = Literal[
+    "task_list.created",
+    "task.created",
+    "task.completed",
+    "task.updated",
+]
+
+
+class ChangeEvent(BaseModel):
+    """A change to a task list or task, carrying the entity as written."""
+
+    type: ChangeType
+    task_list_id: UUID
+    task: Optional[Task] = None
+    task_list: Optional[TaskList] = None
+
+    @classmethod
+    def for_task(cls, type: ChangeType, task: Task) -> "ChangeEvent":
+        return cls(type=type, task_list_id=task.task_list_id, task=task)
+
+
+@runtime_checkable
+class ChangePublisher(Protocol):
+    """Receives the changes made by the domain services.
+
+    Implementations decide when subscribers see them, typically only once
+    the surrounding transaction has committed.
+    """
+
+    def publish(self, events: Sequence[ChangeEvent]) -> None: ...
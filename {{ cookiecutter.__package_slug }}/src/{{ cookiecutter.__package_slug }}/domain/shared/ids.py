@@ -0,0 +1,61 @@
+import os
+import threading
+import time
+from typing import Callable, Dict
+from uuid import UUID, uuid4
+
+IdGenerator = Callable[[], UUID]
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    The first 48 bits are the unix time in milliseconds, so new rows land at
+    the right edge of the primary key index instead of a random page. Ids
+    made in the same millisecond carry a 12-bit counter seeded at random and
+    stay increasing within the process; the remaining 62 bits are random.
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            # The top bit is left clear so a busy millisecond has room to count
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Borrow the next millisecond rather than repeat a value
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(
+        int=(ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+
+
+_generator: IdGenerator = uuid7
+
+
+def new_id() -> UUID:
+    """Id for a new entity, from the generator set with `set_id_generator`."""
+    return _generator()
+
+
+def set_id_generator(generator: IdGenerator) -> None:
+    """Replace the generator used for new entity ids (`uuid7` by default)."""
+    global _generator
+    _generator = generator
+
+
+# Generators selectable by name (the ID_GENERATOR setting)
+ID_GENERATORS: Dict[str, IdGenerator] = {"uuid7": uuid7, "uuid4": uuid4}
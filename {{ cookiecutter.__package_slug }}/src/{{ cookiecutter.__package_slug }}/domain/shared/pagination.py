@@ -0,0 +1,70 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class Page(BaseModel, Generic[T]):
+    """A window of results plus the opaque cursor for the next window.
+
+    `next_cursor` is None when there are no more results.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def _encode(key: str, id: UUID) -> str:
+    raw = f"{key}|{id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode(cursor: str) -> Tuple[str, UUID]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    key, id_hex = raw.split("|", 1)
+    return key, UUID(hex=id_hex)
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encode a `(created_at, id)` keyset position as an opaque string."""
+    return _encode(created_at.isoformat(), id)
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Raises InvalidCursorError if the cursor is malformed.
+    """
+    try:
+        created_at, id = _decode(cursor)
+        return datetime.fromisoformat(created_at), id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+def encode_rank_cursor(rank: float, id: UUID) -> str:
+    """Encode a `(rank, id)` keyset position of ranked results."""
+    # repr() round-trips floats exactly
+    return _encode(repr(rank), id)
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    """Decode a cursor produced by `encode_rank_cursor`.
+
+    Raises InvalidCursorError if the cursor is malformed.
+    """
+    try:
+        rank, id = _decode(cursor)
+        return float(rank), id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Watermark(BaseModel):
+    """Cheap summary of a collection's state, used as a cache validator.
+
+    `version` changes whenever a row is added, removed, completed or
+    renamed; `last_modified` is the latest timestamp seen in the collection.
+    """
+
+    count: int = 0
+    last_modified: Optional[datetime] = None
+    version: str = ""
@@ -0,0 +1,69 @@
+import secrets
+from typing import Callable, Iterable, Optional, Set, TypeVar
+
+from pydantic import TypeAdapter
+
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.backends import CacheBackend
+
+T = TypeVar("T")
+
+
+class CachedRepositoryBase:
+    """Cache-aside plumbing shared by the caching repository decorators.
+
+    Single entities are cached under their own key and deleted on write.
+    Listings are cached under a *scope* (e.g. the tasks of one task list)
+    whose generation token is part of every listing key; replacing the token
+    invalidates all pages of that scope at once without enumerating them.
+    """
+
+    def __init__(self, cache: CacheBackend, *, ttl: Optional[float] = 30.0) -> None:
+        self._cache = cache
+        self._ttl = ttl
+        self._pending_keys: Set[str] = set()
+        self._pending_scopes: Set[str] = set()
+
+    def _cached(self, key: str, fetch: Callable[[], T], adapter: TypeAdapter[T]) -> T:
+        """Read `key` through the cache; a None result is not cached."""
+        raw = self._cache.get(key)
+        if raw is not None:
+            return adapter.validate_json(raw)
+        value = fetch()
+        if value is not None:
+            self._cache.set(key, adapter.dump_json(value), self._ttl)
+        return value
+
+    def _scope_key(self, scope: str, *parts: object) -> str:
+        generation_key = f"gen:{scope}"
+        generation = self._cache.get(generation_key)
+        if generation is None:
+            # Missing (never set or evicted): start a fresh generation so
+            # pages cached under an earlier one can never be read again
+            generation = secrets.token_hex(8).encode()
+            self._cache.set(generation_key, generation)
+        return ":".join([scope, generation.decode(), *map(str, parts)])
+
+    def _invalidate(
+        self, *, keys: Iterable[str] = (), scopes: Iterable[str] = ()
+    ) -> None:
+        keys, scopes = set(keys), set(scopes)
+        self._pending_keys |= keys
+        self._pending_scopes |= scopes
+        self._evict(keys, scopes)
+
+    def _evict(self, keys: Set[str], scopes: Set[str]) -> None:
+        if keys:
+            self._cache.delete(*keys)
+        for scope in scopes:
+            self._cache.set(f"gen:{scope}", secrets.token_hex(8).encode())
+
+    def replay_invalidations(self) -> None:
+        """Invalidate again what this unit of work wrote; call after commit.
+
+        A concurrent reader may have cached the pre-commit state between the
+        write and the commit; evicting again once the data is visible closes
+        that window.
+        """
+        keys, scopes = self._pending_keys, self._pending_scopes
+        self._pending_keys, self._pending_scopes = set(), set()
+        self._evict(keys, scopes)
@@ -0,0 +1,112 @@
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_summary import TaskListSummary
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_with_tasks import TaskListWithTasks
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_list_repository import TaskListRepository
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.backends import CacheBackend
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.repository import CachedRepositoryBase
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.task_repository_cached import task_list_scope
+
+_TASK_LIST: TypeAdapter[Optional[TaskList]] = TypeAdapter(Optional[TaskList])
+_TASK_LISTS: TypeAdapter[List[TaskList]] = TypeAdapter(List[TaskList])
+_TASK_LIST_PAGE: TypeAdapter[Page[TaskList]] = TypeAdapter(Page[TaskList])
+_WATERMARK: TypeAdapter[Watermark] = TypeAdapter(Watermark)
+
+_SCOPE = "task-lists"
+
+
+def _task_list_key(task_list_id: UUID) -> str:
+    return f"task-list:{task_list_id}"
+
+
+class TaskListRepositoryCached(CachedRepositoryBase, TaskListRepository):
+    """Cache-aside decorator for any TaskListRepository.
+
+    Any write evicts the task list and all cached listing pages; deleting a
+    list also evicts the cached pages of its tasks.
+    """
+
+    def __init__(
+        self,
+        inner: TaskListRepository,
+        cache: CacheBackend,
+        *,
+        ttl: Optional[float] = 30.0,
+    ) -> None:
+        super().__init__(cache, ttl=ttl)
+        self._inner = inner
+
+    def get(self, task_list_id: UUID) -> Optional[TaskList]:
+        return self._cached(
+            _task_list_key(task_list_id),
+            lambda: self._inner.get(task_list_id),
+            _TASK_LIST,
+        )
+
+    def list(self, *, offset: int = 0, limit: int = 100) -> List[TaskList]:
+        return self._cached(
+            self._scope_key(_SCOPE, "list", offset, limit),
+            lambda: self._inner.list(offset=offset, limit=limit),
+            _TASK_LISTS,
+        )
+
+    def page(self, *, cursor: Optional[str] = None, limit: int = 100) -> Page[TaskList]:
+        return self._cached(
+            self._scope_key(_SCOPE, "page", cursor or "", limit),
+            lambda: self._inner.page(cursor=cursor, limit=limit),
+            _TASK_LIST_PAGE,
+        )
+
+    def page_summaries(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskListSummary]:
+        # Not cached: task writes do not invalidate the task-lists scope
+        return self._inner.page_summaries(cursor=cursor, limit=limit)
+
+    def get_with_tasks(
+        self, task_list_id: UUID, *, tasks_limit: int = 100
+    ) -> Optional[TaskListWithTasks]:
+        # Not cached, like page_summaries
+        return self._inner.get_with_tasks(task_list_id, tasks_limit=tasks_limit)
+
+    def page_with_tasks(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        tasks_limit: int = 100,
+    ) -> Page[TaskListWithTasks]:
+        return self._inner.page_with_tasks(
+            cursor=cursor, limit=limit, tasks_limit=tasks_limit
+        )
+
+    def watermark(self) -> Watermark:
+        return self._cached(
+            self._scope_key(_SCOPE, "watermark"),
+            self._inner.watermark,
+            _WATERMARK,
+        )
+
+    def create(self, task_list: TaskList) -> TaskList:
+        created = self._inner.create(task_list)
+        self._invalidate(keys=[_task_list_key(created.id)], scopes=[_SCOPE])
+        return created
+
+    def update(self, task_list: TaskList) -> TaskList:
+        updated = self._inner.update(task_list)
+        self._invalidate(keys=[_task_list_key(updated.id)], scopes=[_SCOPE])
+        return updated
+
+    def delete(self, task_list_id: UUID) -> bool:
+        deleted = self._inner.delete(task_list_id)
+        self._invalidate(
+            keys=[_task_list_key(task_list_id)],
+            scopes=[_SCOPE, task_list_scope(task_list_id)],
+        )
+        return deleted
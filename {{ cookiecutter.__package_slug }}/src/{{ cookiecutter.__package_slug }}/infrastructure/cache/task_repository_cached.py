@@ -0,0 +1,207 @@
+from datetime import datetime
+from typing import Any, Collection, Generator, List, Mapping, Optional, Sequence, Set
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_completion import TaskCompletion
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_repository import TaskRepository
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.backends import CacheBackend
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.repository import CachedRepositoryBase
+
+_TASK: TypeAdapter[Optional[Task]] = TypeAdapter(Optional[Task])
+_TASKS: TypeAdapter[List[Task]] = TypeAdapter(List[Task])
+_TASK_PAGE: TypeAdapter[Page[Task]] = TypeAdapter(Page[Task])
+_SUMMARIES: TypeAdapter[List[TaskSummary]] = TypeAdapter(List[TaskSummary])
+_SUMMARY_PAGE: TypeAdapter[Page[TaskSummary]] = TypeAdapter(Page[TaskSummary])
+_WATERMARK: TypeAdapter[Watermark] = TypeAdapter(Watermark)
+
+
+def _task_key(task_id: UUID) -> str:
+    return f"task:{task_id}"
+
+
+def task_list_scope(task_list_id: UUID) -> str:
+    """Cache scope of the listings of one task list's tasks."""
+    return f"tasks-of:{task_list_id}"
+
+
+class TaskRepositoryCached(CachedRepositoryBase, TaskRepository):
+    """Cache-aside decorator for any TaskRepository.
+
+    Writes evict the task and every cached page of its task list (old and
+    new list when a task moves).
+    """
+
+    def __init__(
+        self, inner: TaskRepository, cache: CacheBackend, *, ttl: Optional[float] = 30.0
+    ) -> None:
+        super().__init__(cache, ttl=ttl)
+        self._inner = inner
+
+    def get(self, task_id: UUID) -> Optional[Task]:
+        return self._cached(
+            _task_key(task_id),
+            lambda: self._inner.get(task_id),
+            _TASK,
+        )
+
+    def list_by_task_list(
+        self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
+    ) -> List[Task]:
+        key = self._scope_key(task_list_scope(task_list_id), "list", offset, limit)
+        return self._cached(
+            key,
+            lambda: self._inner.list_by_task_list(
+                task_list_id, offset=offset, limit=limit
+            ),
+            _TASKS,
+        )
+
+    def page_by_task_list(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[Task]:
+        key = self._scope_key(
+            task_list_scope(task_list_id), "page", cursor or "", limit
+        )
+        return self._cached(
+            key,
+            lambda: self._inner.page_by_task_list(
+                task_list_id, cursor=cursor, limit=limit
+            ),
+            _TASK_PAGE,
+        )
+
+    def list_summaries_by_task_list(
+        self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
+    ) -> List[TaskSummary]:
+        key = self._scope_key(task_list_scope(task_list_id), "summaries", offset, limit)
+        return self._cached(
+            key,
+            lambda: self._inner.list_summaries_by_task_list(
+                task_list_id, offset=offset, limit=limit
+            ),
+            _SUMMARIES,
+        )
+
+    def page_summaries_by_task_list(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        key = self._scope_key(
+            task_list_scope(task_list_id), "summary-page", cursor or "", limit
+        )
+        return self._cached(
+            key,
+            lambda: self._inner.page_summaries_by_task_list(
+                task_list_id, cursor=cursor, limit=limit
+            ),
+            _SUMMARY_PAGE,
+        )
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        # Not cached: results span lists, so no list scope covers them
+        return self._inner.search(query, cursor=cursor, limit=limit)
+
+    def stream_by_task_list(
+        self, task_list_id: UUID, *, batch_size: int = 1000
+    ) -> Generator[List[Task], None, None]:
+        # Exports are read once; caching them would only evict hot entries
+        return self._inner.stream_by_task_list(task_list_id, batch_size=batch_size)
+
+    def watermark_by_task_list(self, task_list_id: UUID) -> Watermark:
+        return self._cached(
+            self._scope_key(task_list_scope(task_list_id), "watermark"),
+            lambda: self._inner.watermark_by_task_list(task_list_id),
+            _WATERMARK,
+        )
+
+    def create(self, task: Task) -> Task:
+        created = self._inner.create(task)
+        self._invalidate(
+            keys=[_task_key(created.id)], scopes=[task_list_scope(created.task_list_id)]
+        )
+        return created
+
+    def create_many(self, tasks: Sequence[Task]) -> List[Task]:
+        created = self._inner.create_many(tasks)
+        self._invalidate(
+            keys=[_task_key(t.id) for t in created],
+            scopes={task_list_scope(t.task_list_id) for t in created},
+        )
+        return created
+
+    def existing_task_list_ids(self, task_list_ids: Collection[UUID]) -> Set[UUID]:
+        return self._inner.existing_task_list_ids(task_list_ids)
+
+    def update(self, task: Task) -> Task:
+        # The stored row is loaded by the inner update anyway, so this does
+        # not add a query for session-backed repositories
+        previous = self._inner.get(task.id)
+        updated = self._inner.update(task)
+        scopes = {task_list_scope(updated.task_list_id)}
+        if previous is not None:
+            scopes.add(task_list_scope(previous.task_list_id))
+        self._invalidate(keys=[_task_key(task.id)], scopes=scopes)
+        return updated
+
+    def complete(
+        self, task_id: UUID, *, completed_at: datetime
+    ) -> Optional[TaskCompletion]:
+        result = self._inner.complete(task_id, completed_at=completed_at)
+        if result is not None and result.changed:
+            self._invalidate(
+                keys=[_task_key(task_id)],
+                scopes=[task_list_scope(result.task.task_list_id)],
+            )
+        return result
+
+    def complete_many(
+        self, task_ids: Sequence[UUID], *, completed_at: datetime
+    ) -> List[TaskCompletion]:
+        results = self._inner.complete_many(task_ids, completed_at=completed_at)
+        changed = [r.task for r in results if r.changed]
+        self._invalidate(
+            keys=[_task_key(t.id) for t in changed],
+            scopes={task_list_scope(t.task_list_id) for t in changed},
+        )
+        return results
+
+    def complete_by_task_list(
+        self, task_list_id: UUID, *, completed_at: datetime
+    ) -> List[Task]:
+        tasks = self._inner.complete_by_task_list(
+            task_list_id, completed_at=completed_at
+        )
+        self._invalidate(
+            keys=[_task_key(t.id) for t in tasks],
+            scopes=[task_list_scope(task_list_id)],
+        )
+        return tasks
+
+    def patch(
+        self, task_id: UUID, changes: Mapping[str, Any], *, now: datetime
+    ) -> Optional[Task]:
+        # Only a move between lists needs the old list, so only then look it up
+        previous = self._inner.get(task_id) if "task_list_id" in changes else None
+        task = self._inner.patch(task_id, changes, now=now)
+        scopes = set()
+        for source in (previous, task):
+            if source is not None:
+                scopes.add(task_list_scope(source.task_list_id))
+        self._invalidate(keys=[_task_key(task_id)], scopes=scopes)
+        return task
+
+    def delete(self, task_id: UUID) -> bool:
+        previous = self._inner.get(task_id)
+        deleted = self._inner.delete(task_id)
+        scopes = (
+            [task_list_scope(previous.task_list_id)] if previous is not None else []
+        )
+        self._invalidate(keys=[_task_key(task_id)], scopes=scopes)
+        return deleted
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Optional,
+    Protocol,
+    Set,
+    runtime_checkable,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sent to a subscriber in place of the messages it missed (it fell behind or
+# the broker lost its connection); it should reload whatever it displays.
+RESET = b'{"type":"reset"}'
+
+
+@runtime_checkable
+class ChangeBroker(Protocol):
+    """Fans change feed messages out to every subscriber.
+
+    `publish` may be called from any thread; `subscribe` is used from the
+    event loop and yields messages until the context is left.
+    """
+
+    def publish(self, message: bytes) -> None: ...
+
+    def subscribe(self) -> AsyncContextManager[AsyncIterator[bytes]]: ...
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int) -> None:
+        self.loop = loop
+        self._queue: "asyncio.Queue[bytes]" = asyncio.Queue(max_pending)
+
+    def push(self, message: bytes) -> None:
+        # Runs on the subscriber's loop. A subscriber that cannot keep up gets
+        # a single RESET instead of an ever growing backlog.
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(RESET)
+
+    async def messages(self) -> AsyncIterator[bytes]:
+        while True:
+            yield await self._queue.get()
+
+
+class LocalChangeBroker(ChangeBroker):
+    """In-process broker; only subscribers of this process see the messages.
+
+    Enough for a single worker and for tests. Each subscriber has its own
+    bounded queue so a slow client never delays publishers or other clients.
+    """
+
+    def __init__(self, max_pending: int = 1000) -> None:
+        self._max_pending = max_pending
+        self._subscribers: Set[_Subscriber] = set()
+        self._lock = threading.Lock()
+
+    def publish(self, message: bytes) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.push, message)
+            except RuntimeError:  # its loop is closed
+                with self._lock:
+                    self._subscribers.discard(subscriber)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[AsyncIterator[bytes]]:
+        subscriber = _Subscriber(asyncio.get_running_loop(), self._max_pending)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            yield subscriber.messages()
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+
+class RedisChangeBroker(ChangeBroker):
+    """Broker shared by all workers through a Redis pub/sub channel.
+
+    Each process holds a single Redis subscription, started with its first
+    subscriber, and fans the messages out through a LocalChangeBroker; open
+    feeds therefore cost no extra Redis connections. Messages published while
+    the subscription is down are lost and subscribers are sent RESET.
+    """
+
+    def __init__(
+        self, client: Any, async_client: Any, channel: str = "changes"
+    ) -> None:
+        self._client = client
+        self._async_client = async_client
+        self._channel = channel
+        self._local = LocalChangeBroker()
+        self._listener: Optional["asyncio.Task[None]"] = None
+
+    @classmethod
+    def from_url(cls, url: str, channel: str = "changes") -> "RedisChangeBroker":
+        try:
+            import redis  # type: ignore[import-untyped]
+            import redis.asyncio  # type: ignore[import-untyped]
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "CHANGE_FEED_BACKEND=redis requires the 'redis' package"
+            ) from exc
+        return cls(
+            redis.Redis.from_url(url), redis.asyncio.Redis.from_url(url), channel
+        )
+
+    def publish(self, message: bytes) -> None:
+        self._client.publish(self._channel, message)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[AsyncIterator[bytes]]:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+        async with self._local.subscribe() as messages:
+            yield messages
+
+    async def _listen(self) -> None:
+        delay = 0.5
+        while True:
+            try:
+                pubsub = self._async_client.pubsub()
+                await pubsub.subscribe(self._channel)
+                delay = 0.5
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._local.publish(message["data"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "Change feed subscription lost, retrying in %.1fs",
+                    delay,
+                    exc_info=True,
+                )
+                self._local.publish(RESET)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
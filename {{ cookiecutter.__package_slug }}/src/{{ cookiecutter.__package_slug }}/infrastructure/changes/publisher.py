@@ -0,0 +1,50 @@
+import logging
+from typing import Iterable, List, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.shared.changes import ChangeEvent, ChangePublisher
+from {{ cookiecutter.__package_slug }}.infrastructure.changes.brokers import ChangeBroker
+
+logger = logging.getLogger(__name__)
+
+
+class TransactionalChangePublisher(ChangePublisher):
+    """Holds back the events of a session until it commits.
+
+    Subscribers only ever see changes that were persisted: events are sent to
+    the broker after the commit and dropped on rollback. Sending is best
+    effort: a broker error is logged rather than raised from `commit()`, since
+    the write has already been persisted, and the event is not retried.
+    """
+
+    def __init__(self, broker: ChangeBroker, session: Session) -> None:
+        self._broker = broker
+        self._pending: List[ChangeEvent] = []
+        event.listen(session, "after_commit", lambda _: self.flush())
+        event.listen(session, "after_rollback", lambda _: self._pending.clear())
+
+    def publish(self, events: Sequence[ChangeEvent]) -> None:
+        self._pending.extend(events)
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        for change in pending:
+            try:
+                self._broker.publish(change.model_dump_json().encode())
+            except Exception:
+                logger.warning(
+                    "Change %s not published to the feed", change.type, exc_info=True
+                )
+
+
+class FanOutChangePublisher(ChangePublisher):
+    """Hands the same events to several publishers, in order."""
+
+    def __init__(self, publishers: Iterable[ChangePublisher]) -> None:
+        self._publishers = list(publishers)
+
+    def publish(self, events: Sequence[ChangeEvent]) -> None:
+        for publisher in self._publishers:
+            publisher.publish(events)
@@ -1,20 +1,276 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
 from dependency_injector import containers, providers
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.changes.brokers import (
+    ChangeBroker,
+    LocalChangeBroker,
+    RedisChangeBroker,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.relay import OutboxRelay
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.sinks import (
+    ChangeBrokerOutboxSink,
+    LoggingOutboxSink,
+    OutboxSink,
+)
 from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
-from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.tracing.provider import create_tracer_provider, get_tracer
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.routing import (
+    SessionRouter,
+    make_sqlite_read_only,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.schema import upgrade_database
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.factory import detect_search_backend
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.sqlite import (
+    apply_sqlite_pragmas,
+    begin_immediate,
+    sqlite_pragmas,
+    uses_sqlite_profile,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+    from {{ cookiecutter.__package_slug }}.infrastructure.metrics.prometheus import AppMetrics
+
+# Pool defaults per backend, overridable through Settings. Postgres recycles
+# connections before typical load balancer idle timeouts and pings on checkout
+# so dropped connections are replaced instead of failing the request.
+DIALECT_POOL_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "postgresql": {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 10.0,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "statement_timeout_ms": 30_000,
+    },
+    "sqlite": {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30.0,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+        "statement_timeout_ms": None,
+    },
+}
 
+_POOL_SETTINGS = {
+    "pool_size": "DATABASE_POOL_SIZE",
+    "max_overflow": "DATABASE_MAX_OVERFLOW",
+    "pool_timeout": "DATABASE_POOL_TIMEOUT",
+    "pool_recycle": "DATABASE_POOL_RECYCLE",
+    "pool_pre_ping": "DATABASE_POOL_PRE_PING",
+    "statement_timeout_ms": "DATABASE_STATEMENT_TIMEOUT_MS",
+}
 
-def _create_engine_for_url(database_url: str):
-    """Create a SQLAlchemy engine with dialect-specific options.
 
-    - For sqlite, we must pass check_same_thread=False.
-    - For Postgres (and others), use default options.
+def _engine_options(
+    database_url: str,
+    settings: Optional[Settings] = None,
+    *,
+    use_async: bool = False,
+    read_only: bool = False,
+) -> Dict[str, Any]:
+    """Return `create_engine` keyword arguments for `database_url`.
+
+    Values set in `settings` win over `DIALECT_POOL_DEFAULTS`. In-memory
+    SQLite keeps SQLAlchemy's single-connection pool and gets no pool options.
+    `read_only` makes Postgres sessions default to read-only transactions.
+    Under the SQLite profile the writable engine gets a single connection:
+    its pool is the queue writers wait in.
     """
-    if database_url.startswith("sqlite"):
-        return create_engine(database_url, connect_args={"check_same_thread": False})
-    return create_engine(database_url)
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    connect_args: Dict[str, Any] = {}
+    if backend == "sqlite":
+        connect_args["check_same_thread"] = False
+        if url.database in (None, "", ":memory:"):
+            return {"connect_args": connect_args}
+
+    defaults = DIALECT_POOL_DEFAULTS.get(backend, DIALECT_POOL_DEFAULTS["postgresql"])
+    options = dict(defaults)
+    if settings is not None:
+        for option, field in _POOL_SETTINGS.items():
+            value = getattr(settings, field)
+            if value is not None:
+                options[option] = value
+
+    if settings is not None and not read_only:
+        if uses_sqlite_profile(database_url, settings):
+            options.update(pool_size=1, max_overflow=0)
+
+    statement_timeout_ms = options.pop("statement_timeout_ms")
+    if backend == "postgresql":
+        pg_options = []
+        if statement_timeout_ms:
+            pg_options.append(f"-c statement_timeout={int(statement_timeout_ms)}")
+        if read_only:
+            pg_options.append("-c default_transaction_read_only=on")
+        if pg_options:
+            connect_args["options"] = " ".join(pg_options)
+    options["poolclass"] = (
+        InstrumentedAsyncAdaptedQueuePool if use_async else InstrumentedQueuePool
+    )
+    options["connect_args"] = connect_args
+    return options
+
+
+def _create_engine_for_url(
+    database_url: str, settings: Optional[Settings] = None, *, read_only: bool = False
+):
+    """Create a SQLAlchemy engine with dialect-specific pool options."""
+    engine = create_engine(
+        database_url, **_engine_options(database_url, settings, read_only=read_only)
+    )
+    _configure_sqlite(engine, database_url, settings, read_only=read_only)
+    return engine
+
+
+def _configure_sqlite(
+    engine: Engine,
+    database_url: str,
+    settings: Optional[Settings],
+    *,
+    read_only: bool,
+) -> None:
+    """Install the SQLite profile's connection hooks on a SQLite engine."""
+    if engine.dialect.name != "sqlite":
+        return
+    if settings is not None and uses_sqlite_profile(database_url, settings):
+        apply_sqlite_pragmas(engine, sqlite_pragmas(settings))
+        if not read_only:
+            begin_immediate(engine)
+    if read_only:
+        make_sqlite_read_only(engine)
+
+
+# Asyncio drivers used for each backend when DATABASE_ASYNC is enabled
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+psycopg"}
+
+
+def _async_database_url(database_url: str) -> str:
+    """Return `database_url` rewritten to use the backend's asyncio driver."""
+    url = make_url(database_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is not None:
+        url = url.set(drivername=driver)
+    return url.render_as_string(hide_password=False)
+
+
+def _create_async_engine_for_url(
+    database_url: str, settings: Optional[Settings] = None, *, read_only: bool = False
+) -> AsyncEngine:
+    """Create an AsyncEngine for the async variant of `database_url`."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_url = _async_database_url(database_url)
+    engine = create_async_engine(
+        async_url,
+        **_engine_options(async_url, settings, use_async=True, read_only=read_only),
+    )
+    _configure_sqlite(engine.sync_engine, async_url, settings, read_only=read_only)
+    return engine
+
+
+def _read_urls(settings: Settings) -> List[str]:
+    """URLs that serve reads: the replicas or, under the SQLite profile, the
+    primary's own file through read-only connections."""
+    if settings.READ_REPLICA_URLS:
+        return list(settings.READ_REPLICA_URLS)
+    if uses_sqlite_profile(settings.DATABASE_URL, settings):
+        return [settings.DATABASE_URL]
+    return []
+
+
+def _create_replica_engines(settings: Settings) -> List[Engine]:
+    """Create one read-only engine per URL that serves reads."""
+    return [
+        _create_engine_for_url(url, settings, read_only=True)
+        for url in _read_urls(settings)
+    ]
+
+
+def _create_async_replica_engines(settings: Settings) -> List[AsyncEngine]:
+    return [
+        _create_async_engine_for_url(url, settings, read_only=True)
+        for url in _read_urls(settings)
+    ]
+
+
+def _replica_session_factories(engines: Sequence[Engine]) -> List[sessionmaker]:
+    return [sessionmaker(autocommit=False, autoflush=False, bind=e) for e in engines]
+
+
+def _create_async_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+
+
+def _async_replica_session_factories(
+    engines: Sequence[AsyncEngine],
+) -> List[async_sessionmaker]:
+    return [_create_async_session_factory(e) for e in engines]
+
+
+def _create_metrics() -> AppMetrics:
+    # prometheus_client is only loaded when metrics are enabled
+    from {{ cookiecutter.__package_slug }}.infrastructure.metrics.prometheus import AppMetrics
+
+    return AppMetrics()
+
+
+def _create_cache_backend(settings: Settings) -> Optional[CacheBackend]:
+    """Build the repository read cache selected by `Settings.CACHE_BACKEND`."""
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.CACHE_URL:
+            raise ValueError("CACHE_BACKEND=redis requires CACHE_URL")
+        return RedisCacheBackend.from_url(settings.CACHE_URL)
+    return None
+
+
+def _create_change_broker(settings: Settings) -> ChangeBroker:
+    """Build the change feed broker selected by `Settings.CHANGE_FEED_BACKEND`."""
+    if settings.CHANGE_FEED_BACKEND == "redis":
+        if not settings.CHANGE_FEED_URL:
+            raise ValueError("CHANGE_FEED_BACKEND=redis requires CHANGE_FEED_URL")
+        return RedisChangeBroker.from_url(settings.CHANGE_FEED_URL)
+    return LocalChangeBroker()
+
+
+def _create_outbox_sink(settings: Settings, broker: ChangeBroker) -> OutboxSink:
+    """Build the outbox relay's sink selected by `Settings.OUTBOX_SINK`."""
+    if settings.OUTBOX_SINK == "changes":
+        return ChangeBrokerOutboxSink(broker)
+    return LoggingOutboxSink()
+
+
+def _create_outbox_relay(
+    settings: Settings, session_factory: sessionmaker, sink: OutboxSink
+) -> OutboxRelay:
+    return OutboxRelay(
+        session_factory,
+        sink,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        max_backoff=settings.OUTBOX_MAX_BACKOFF_SECONDS,
+    )
 
 
 class Container(containers.DeclarativeContainer):
@@ -27,6 +283,7 @@ class Container(containers.DeclarativeContainer):
     engine = providers.Singleton(
         _create_engine_for_url,
         database_url=providers.Callable(lambda s: s.DATABASE_URL, settings),
+        settings=settings,
     )
 
     session_factory = providers.Singleton(
@@ -37,6 +294,55 @@ class Container(containers.DeclarativeContainer):
     )
 
     session = providers.Factory(Session, bind=engine)
-    init_database = providers.Callable(
-        lambda e: Base.metadata.create_all(bind=e), engine
+
+    replica_engines = providers.Singleton(_create_replica_engines, settings)
+
+    session_router = providers.Singleton(
+        SessionRouter,
+        primary=session_factory,
+        replicas=providers.Callable(_replica_session_factories, replica_engines),
+        # Only real replicas lag behind the primary
+        sticky=providers.Callable(lambda s: bool(s.READ_REPLICA_URLS), settings),
+    )
+
+    async_engine = providers.Singleton(
+        _create_async_engine_for_url,
+        database_url=providers.Callable(lambda s: s.DATABASE_URL, settings),
+        settings=settings,
     )
+
+    async_session_factory = providers.Singleton(
+        _create_async_session_factory, async_engine
+    )
+
+    async_replica_engines = providers.Singleton(_create_async_replica_engines, settings)
+
+    async_session_router = providers.Singleton(
+        SessionRouter,
+        primary=async_session_factory,
+        replicas=providers.Callable(
+            _async_replica_session_factories, async_replica_engines
+        ),
+        sticky=providers.Callable(lambda s: bool(s.READ_REPLICA_URLS), settings),
+    )
+
+    cache = providers.Singleton(_create_cache_backend, settings)
+
+    change_broker = providers.Singleton(_create_change_broker, settings)
+
+    outbox_sink = providers.Singleton(_create_outbox_sink, settings, change_broker)
+
+    outbox_relay = providers.Singleton(
+        _create_outbox_relay, settings, session_factory, outbox_sink
+    )
+
+    metrics = providers.Singleton(_create_metrics)
+
+    tracer_provider = providers.Singleton(create_tracer_provider, settings)
+
+    tracer = providers.Singleton(get_tracer, tracer_provider)
+
+    init_database = providers.Callable(upgrade_database, engine)
+
+    # Resolved on first use, after init_database has migrated the schema
+    search_backend = providers.Singleton(detect_search_backend, engine)
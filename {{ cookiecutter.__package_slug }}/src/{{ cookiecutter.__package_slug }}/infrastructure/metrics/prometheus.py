@@ -0,0 +1,239 @@
+import os
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from sqlalchemy import Engine
+
+from {{ cookiecutter.__package_slug }}.infrastructure.metrics.queries import (
+    RequestStats,
+    instrument_engine,
+    operation_of,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.pool import pool_status
+
+_QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+
+class PoolCollector:
+    """Reads connection pool occupancy and checkout waits at scrape time."""
+
+    def __init__(self) -> None:
+        self._engines: Dict[str, Engine] = {}
+
+    def add(self, name: str, engine: Engine) -> None:
+        self._engines[name] = engine
+
+    def statuses(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for name, engine in self._engines.items():
+            yield name, pool_status(engine)
+
+    def collect(self) -> Iterator[Metric]:
+        gauges = {
+            "size": GaugeMetricFamily(
+                "db_pool_size", "Connections the pool keeps open", labels=["engine"]
+            ),
+            "checked_out": GaugeMetricFamily(
+                "db_pool_checked_out", "Connections in use", labels=["engine"]
+            ),
+            "overflow": GaugeMetricFamily(
+                "db_pool_overflow", "Connections open beyond size", labels=["engine"]
+            ),
+            "capacity": GaugeMetricFamily(
+                "db_pool_capacity", "Size plus max overflow", labels=["engine"]
+            ),
+        }
+        checkouts = CounterMetricFamily(
+            "db_pool_checkouts", "Connections checked out", labels=["engine"]
+        )
+        timeouts = CounterMetricFamily(
+            "db_pool_timeouts", "Checkouts that timed out", labels=["engine"]
+        )
+        wait_max = GaugeMetricFamily(
+            "db_pool_checkout_wait_max_seconds",
+            "Longest wait for a connection so far",
+            labels=["engine"],
+        )
+        for name, status in self.statuses():
+            for key, family in gauges.items():
+                if status.get(key) is not None:
+                    family.add_metric([name], status[key])
+            if "checkouts" in status:
+                checkouts.add_metric([name], status["checkouts"])
+                timeouts.add_metric([name], status["timeouts"])
+                wait_max.add_metric([name], status["checkout_wait_max_ms"] / 1000)
+        yield from gauges.values()
+        yield from (checkouts, timeouts, wait_max)
+
+
+class MultiprocessPoolMetrics:
+    """The `PoolCollector` metrics as values each worker writes itself.
+
+    A collector only runs in the process that serves the scrape, so with
+    PROMETHEUS_MULTIPROC_DIR set every worker publishes its own pools here
+    instead. Occupancy gauges are summed over live workers, the longest wait
+    is their maximum, and the checkout counters grow by what each worker
+    counted since its previous publish.
+    """
+
+    def __init__(self, pools: PoolCollector) -> None:
+        self._pools = pools
+        self._published: Dict[Tuple[str, str], int] = {}
+        labels = ["engine"]
+        # No registry: MultiProcessCollector reads the values back from disk
+        self.gauges = {
+            key: Gauge(name, doc, labels, registry=None, multiprocess_mode="livesum")
+            for key, name, doc in (
+                ("size", "db_pool_size", "Connections the pool keeps open"),
+                ("checked_out", "db_pool_checked_out", "Connections in use"),
+                ("overflow", "db_pool_overflow", "Connections open beyond size"),
+                ("capacity", "db_pool_capacity", "Size plus max overflow"),
+            )
+        }
+        self.counters = {
+            "checkouts": Counter(
+                "db_pool_checkouts", "Connections checked out", labels, registry=None
+            ),
+            "timeouts": Counter(
+                "db_pool_timeouts", "Checkouts that timed out", labels, registry=None
+            ),
+        }
+        self.wait_max = Gauge(
+            "db_pool_checkout_wait_max_seconds",
+            "Longest wait for a connection so far",
+            labels,
+            registry=None,
+            multiprocess_mode="livemax",
+        )
+
+    def publish(self) -> None:
+        for name, status in self._pools.statuses():
+            for key, gauge in self.gauges.items():
+                if status.get(key) is not None:
+                    gauge.labels(name).set(status[key])
+            if "checkouts" not in status:
+                continue
+            for key, counter in self.counters.items():
+                previous = self._published.get((name, key), 0)
+                if status[key] > previous:
+                    counter.labels(name).inc(status[key] - previous)
+                    self._published[name, key] = status[key]
+            self.wait_max.labels(name).set(status["checkout_wait_max_ms"] / 1000)
+
+
+class AppMetrics:
+    """The application's Prometheus metrics, in a registry of their own.
+
+    A registry per instance keeps several apps in one process (as in tests)
+    from clashing over metric names.
+    """
+
+    def __init__(self) -> None:
+        self.registry = CollectorRegistry()
+        self.pools = PoolCollector()
+        self.registry.register(self.pools)
+        self.multiprocess_pools: Optional[MultiprocessPoolMetrics] = None
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+            self.multiprocess_pools = MultiprocessPoolMetrics(self.pools)
+        route = ["method", "route"]
+        self.requests = Counter(
+            "http_requests",
+            "HTTP requests handled",
+            route + ["status"],
+            registry=self.registry,
+        )
+        self.request_seconds = Histogram(
+            "http_request_duration_seconds",
+            "Time to handle a request, database commit included",
+            route,
+            registry=self.registry,
+        )
+        self.in_progress = Gauge(
+            "http_requests_in_progress",
+            "Requests being handled",
+            ["method"],
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+        self.request_queries = Histogram(
+            "db_queries_per_request",
+            "Statements run for one request",
+            route,
+            buckets=_QUERY_COUNT_BUCKETS,
+            registry=self.registry,
+        )
+        self.request_query_seconds = Histogram(
+            "db_query_seconds_per_request",
+            "Time spent running statements for one request",
+            route,
+            buckets=_QUERY_BUCKETS,
+            registry=self.registry,
+        )
+        self.query_seconds = Histogram(
+            "db_query_duration_seconds",
+            "Time to run one statement",
+            ["operation"],
+            buckets=_QUERY_BUCKETS,
+            registry=self.registry,
+        )
+        self.commit_seconds = Histogram(
+            "db_commit_duration_seconds",
+            "Time to commit a request's session",
+            buckets=_QUERY_BUCKETS,
+            registry=self.registry,
+        )
+        self.over_budget = Counter(
+            "db_query_budget_exceeded",
+            "Requests that ran more statements than the query budget",
+            route,
+            registry=self.registry,
+        )
+
+    def instrument_engine(self, name: str, engine: Engine) -> None:
+        """Time `engine`'s statements and report its pool."""
+        instrument_engine(engine, self._observe_query)
+        self.pools.add(name, engine)
+
+    def _observe_query(self, statement: str, seconds: float) -> None:
+        self.query_seconds.labels(operation_of(statement)).observe(seconds)
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        stats: RequestStats,
+    ) -> None:
+        self.requests.labels(method, route, str(status)).inc()
+        self.request_seconds.labels(method, route).observe(seconds)
+        self.request_queries.labels(method, route).observe(stats.queries)
+        self.request_query_seconds.labels(method, route).observe(stats.query_seconds)
+        if stats.commit_seconds:
+            self.commit_seconds.observe(stats.commit_seconds)
+        if self.multiprocess_pools is not None:
+            self.multiprocess_pools.publish()
+
+    def exposition(self) -> Tuple[bytes, str]:
+        """Return the scrape body and its content type.
+
+        With PROMETHEUS_MULTIPROC_DIR set (several workers), the values of
+        every worker are aggregated from that directory instead; pool values
+        are those each worker published after its last request.
+        """
+        registry = self.registry
+        if self.multiprocess_pools is not None:
+            from prometheus_client import multiprocess
+
+            self.multiprocess_pools.publish()
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
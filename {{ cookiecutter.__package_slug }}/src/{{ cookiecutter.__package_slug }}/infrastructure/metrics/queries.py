@@ -0,0 +1,72 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Tuple
+
+from sqlalchemy import Engine, event
+
+# Statement kinds used as the `operation` label of per-query metrics
+OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+class RequestStats:
+    """Database work done on behalf of one request.
+
+    Filled in by the engine's cursor events and the session dependencies
+    from whichever thread or greenlet runs the request's queries, since
+    they all see the request's context.
+    """
+
+    __slots__ = ("queries", "query_seconds", "commit_seconds", "statements")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.commit_seconds = 0.0
+        self.statements: "Counter[str]" = Counter()
+
+    def most_repeated(self) -> Tuple[str, int]:
+        """The statement run most often and how many times it ran."""
+        if not self.statements:
+            return "", 0
+        return self.statements.most_common(1)[0]
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "current_request_stats", default=None
+)
+
+
+def record_commit(seconds: float) -> None:
+    """Add a session commit's duration to the current request, if any."""
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.commit_seconds += seconds
+
+
+def operation_of(statement: str) -> str:
+    verb = statement.lstrip()[:6].upper()
+    return verb if verb in OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: Engine, on_query: Callable[[str, float], None]) -> None:
+    """Time every statement `engine` runs.
+
+    `on_query(statement, seconds)` is called for each one, and the current
+    request's RequestStats, if any, are updated.
+    """
+
+    def before(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def after(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        seconds = time.perf_counter() - conn.info["query_started_at"].pop()
+        on_query(statement, seconds)
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.query_seconds += seconds
+            stats.statements[statement] += 1
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from typing import Sequence, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.shared.changes import ChangeEvent, ChangePublisher
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.outbox_event import OutboxEventModel
+
+
+class OutboxChangePublisher(ChangePublisher):
+    """Writes events to the outbox table in the session's own transaction.
+
+    The events are committed or rolled back together with the change that
+    caused them; the outbox relay delivers them afterwards.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def publish(self, events: Sequence[ChangeEvent]) -> None:
+        if not events:
+            return
+        now = datetime.now(timezone.utc)
+        self._session.execute(
+            insert(cast(Table, OutboxEventModel.__table__)),
+            [
+                {
+                    "type": change.type,
+                    "task_list_id": change.task_list_id,
+                    "payload": change.model_dump_json(),
+                    "created_at": now,
+                    "attempts": 0,
+                }
+                for change in events
+            ],
+        )
@@ -0,0 +1,137 @@
+import logging
+import signal
+import threading
+from typing import Optional, cast
+
+from sqlalchemy import Select, Table, delete, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.sinks import OutboxMessage, OutboxSink
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.outbox_event import OutboxEventModel
+
+logger = logging.getLogger(__name__)
+
+_TABLE = cast(Table, OutboxEventModel.__table__)
+
+
+class OutboxRelay:
+    """Drains the outbox table to a sink in batches of `batch_size` events.
+
+    Each batch is read, sent and deleted in one transaction. On Postgres the
+    rows are locked with `FOR UPDATE SKIP LOCKED`, so several relays share
+    the work without sending an event twice; on SQLite run a single relay.
+    When the sink fails the batch stays in place (its `attempts` go up) and
+    is retried after an exponential backoff, keeping events in order.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        sink: OutboxSink,
+        *,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._sink = sink
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_backoff = max_backoff
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def batch_query(self) -> Select:
+        # SQLite has no row locks and compiles FOR UPDATE away
+        return (
+            select(
+                _TABLE.c.id,
+                _TABLE.c.type,
+                _TABLE.c.task_list_id,
+                _TABLE.c.payload,
+                _TABLE.c.created_at,
+                _TABLE.c.attempts,
+            )
+            .order_by(_TABLE.c.id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+    def relay_once(self) -> int:
+        """Send one batch; return its size, 0 when the outbox is empty.
+
+        Raises the sink's error after recording the failed attempt.
+        """
+        error: Optional[Exception] = None
+        session: Session
+        with self._session_factory() as session, session.begin():
+            messages = [
+                OutboxMessage._make(row) for row in session.execute(self.batch_query())
+            ]
+            if not messages:
+                return 0
+            ids = [message.id for message in messages]
+            try:
+                self._sink.send(messages)
+            except Exception as exc:
+                error = exc
+                session.execute(
+                    update(_TABLE)
+                    .where(_TABLE.c.id.in_(ids))
+                    .values(attempts=_TABLE.c.attempts + 1)
+                )
+            else:
+                session.execute(delete(_TABLE).where(_TABLE.c.id.in_(ids)))
+        if error is not None:
+            raise error
+        return len(messages)
+
+    def run(self) -> None:
+        """Relay until `stop()`: full batches back to back, then poll.
+
+        Failures, from the sink or the database, back off exponentially from
+        `poll_interval` up to `max_backoff`.
+        """
+        backoff = 0.0
+        while not self._stop.is_set():
+            try:
+                sent = self.relay_once()
+            except Exception:
+                backoff = min(max(backoff * 2, self._poll_interval), self._max_backoff)
+                logger.exception("Outbox relay failed, retrying in %.1fs", backoff)
+                self._stop.wait(backoff)
+                continue
+            backoff = 0.0
+            if sent < self._batch_size:
+                self._stop.wait(self._poll_interval)
+
+    def start(self) -> None:
+        """Run the relay in a daemon thread of this process."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="outbox-relay", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def main() -> None:
+    """Run the relay configured by Settings in the foreground."""
+    from {{ cookiecutter.__package_slug }}.infrastructure.container import Container
+
+    logging.basicConfig(level=logging.INFO)
+    container = Container()
+    container.init_database()
+    relay = container.outbox_relay()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: relay.stop())
+    relay.run()
+
+
+if __name__ == "__main__":
+    main()
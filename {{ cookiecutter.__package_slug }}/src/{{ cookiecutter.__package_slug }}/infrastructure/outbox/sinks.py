@@ -0,0 +1,61 @@
+import logging
+from datetime import datetime
+from typing import List, NamedTuple, Protocol, Sequence, runtime_checkable
+from uuid import UUID
+
+from {{ cookiecutter.__package_slug }}.infrastructure.changes.brokers import ChangeBroker
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxMessage(NamedTuple):
+    """An outbox row as handed to a sink; `payload` is a ChangeEvent as JSON."""
+
+    id: int
+    type: str
+    task_list_id: UUID
+    payload: str
+    created_at: datetime
+    attempts: int
+
+
+@runtime_checkable
+class OutboxSink(Protocol):
+    """Destination of the events drained by the outbox relay.
+
+    `send` raises to have the whole batch retried later. Delivery is at least
+    once, so consumers should deduplicate on `OutboxMessage.id`.
+    """
+
+    def send(self, messages: Sequence[OutboxMessage]) -> None: ...
+
+
+class InMemoryOutboxSink(OutboxSink):
+    """Keeps every message it receives; for tests and local experiments."""
+
+    def __init__(self) -> None:
+        self.messages: List[OutboxMessage] = []
+
+    def send(self, messages: Sequence[OutboxMessage]) -> None:
+        self.messages.extend(messages)
+
+
+class LoggingOutboxSink(OutboxSink):
+    """Logs each message; a placeholder until a real consumer is wired in."""
+
+    def send(self, messages: Sequence[OutboxMessage]) -> None:
+        for message in messages:
+            logger.info(
+                "outbox event %s %s %s", message.id, message.type, message.payload
+            )
+
+
+class ChangeBrokerOutboxSink(OutboxSink):
+    """Forwards messages to a change feed broker, e.g. Redis pub/sub."""
+
+    def __init__(self, broker: ChangeBroker) -> None:
+        self._broker = broker
+
+    def send(self, messages: Sequence[OutboxMessage]) -> None:
+        for message in messages:
+            self._broker.publish(message.payload.encode())
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from sqlalchemy.orm import DeclarativeBase
 
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.types import CompactUuid
+
 
 class Base(DeclarativeBase):
-    pass
+    # `Mapped[UUID]` columns hold 16 bytes on SQLite too (see CompactUuid)
+    type_annotation_map = {UUID: CompactUuid}
@@ -0,0 +1,70 @@
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models import (  # noqa: F401
+    outbox_event,
+    task,
+    task_list,
+    task_list_counter,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.schema import include_object
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+config = context.config
+target_metadata = Base.metadata
+
+
+def _database_url() -> str:
+    return config.get_main_option("sqlalchemy.url") or Settings().DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of running it against a database."""
+    context.configure(
+        url=_database_url(),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations on a connection.
+
+    Reuses the connection passed by `upgrade_database` when available so the
+    application engine (and its dialect options) is used.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+
+    engine = engine_from_config(
+        {"sqlalchemy.url": _database_url()},
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with engine.begin() as connection:
+        _run(connection)
+
+
+def _run(connection) -> None:
+    # Batch mode lets ALTER-style operations work on SQLite
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
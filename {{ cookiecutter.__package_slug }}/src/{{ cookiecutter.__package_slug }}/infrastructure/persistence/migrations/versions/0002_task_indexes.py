@@ -0,0 +1,40 @@
+"""Add keyset and completion indexes on tasks and task lists.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tasks_task_list_id_created_at_id",
+        "tasks",
+        ["task_list_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_tasks_task_list_id_is_completed",
+        "tasks",
+        ["task_list_id", "is_completed"],
+    )
+    op.create_index("ix_task_lists_created_at_id", "task_lists", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_task_lists_created_at_id", table_name="task_lists")
+    op.drop_index("ix_tasks_task_list_id_is_completed", table_name="tasks")
+    op.drop_index("ix_tasks_task_list_id_created_at_id", table_name="tasks")
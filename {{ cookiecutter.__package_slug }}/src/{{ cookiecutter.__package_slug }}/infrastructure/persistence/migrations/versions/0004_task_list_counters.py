@@ -0,0 +1,49 @@
+"""Add materialized task counters per task list.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "task_list_counters",
+        sa.Column("task_list_id", sa.Uuid(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("completed", sa.Integer(), nullable=False),
+        sa.Column("last_activity_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["task_list_id"], ["task_lists.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("task_list_id"),
+    )
+    # Backfill from existing tasks; same aggregates as
+    # TaskListCounterRepositoryRds.rebuild
+    op.execute(
+        "INSERT INTO task_list_counters "
+        "(task_list_id, total, completed, last_activity_at) "
+        "SELECT task_list_id, COUNT(*), "
+        "SUM(CASE WHEN is_completed THEN 1 ELSE 0 END), "
+        "MAX(COALESCE(updated_at, completed_at, created_at)) "
+        "FROM tasks GROUP BY task_list_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("task_list_counters")
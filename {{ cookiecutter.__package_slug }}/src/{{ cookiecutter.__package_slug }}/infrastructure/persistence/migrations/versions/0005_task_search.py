@@ -0,0 +1,71 @@
+"""Add a full-text search index over task titles and descriptions.
+
+SQLite gets an FTS5 table plus a table mapping task ids to its rowids,
+Postgres a generated tsvector column with a GIN index. Other dialects (and
+SQLite builds without FTS5) get nothing and search with LIKE.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _sqlite_has_fts5() -> bool:
+    bind = op.get_bind()
+    return bool(
+        bind.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite" and _sqlite_has_fts5():
+        op.execute(
+            "CREATE TABLE task_search_docs ("
+            "doc_id INTEGER PRIMARY KEY, task_id CHAR(32) NOT NULL UNIQUE)"
+        )
+        op.execute(
+            "CREATE VIRTUAL TABLE task_search USING fts5("
+            "title, description, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        op.execute("INSERT INTO task_search_docs (task_id) SELECT id FROM tasks")
+        op.execute(
+            "INSERT INTO task_search (rowid, title, description) "
+            "SELECT d.doc_id, t.title, COALESCE(t.description, '') "
+            "FROM task_search_docs d JOIN tasks t ON t.id = d.task_id"
+        )
+    elif dialect == "postgresql":
+        op.execute(
+            "ALTER TABLE tasks ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', title), 'A') || "
+            "setweight(to_tsvector('simple', COALESCE(description, '')), 'B')"
+            ") STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        op.execute("DROP TABLE IF EXISTS task_search")
+        op.execute("DROP TABLE IF EXISTS task_search_docs")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+        op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
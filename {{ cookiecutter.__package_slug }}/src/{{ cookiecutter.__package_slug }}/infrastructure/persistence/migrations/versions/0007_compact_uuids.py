@@ -0,0 +1,96 @@
+"""Store UUID columns as 16-byte blobs on SQLite.
+
+SQLite kept them as CHAR(32) hex text; existing values are converted in
+place and the columns retyped to BLOB (see CompactUuid). Postgres already
+stores a native 16-byte uuid and is left alone.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+import sqlite3
+from typing import Sequence, Union, cast
+from uuid import UUID
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mapped UUID columns per table; task_lists first as the others reference it
+UUID_COLUMNS = {
+    "task_lists": ("id",),
+    "tasks": ("id", "task_list_id"),
+    "task_list_counters": ("task_list_id",),
+    "outbox_events": ("task_list_id",),
+}
+
+
+def _to_blob(value):
+    return UUID(value).bytes if isinstance(value, str) else value
+
+
+def _to_hex(value):
+    return UUID(bytes=bytes(value)).hex if isinstance(value, bytes) else value
+
+
+def _convert(function) -> None:
+    """Rewrite every UUID value with `function`, registered as uuid_convert."""
+    bind = op.get_bind()
+    # Only run on SQLite, whose pool hands out live sqlite3 connections
+    dbapi_connection = cast(sqlite3.Connection, bind.connection.dbapi_connection)
+    dbapi_connection.create_function("uuid_convert", 1, function, deterministic=True)
+    tables = list(UUID_COLUMNS.items())
+    if sa.inspect(bind).has_table("task_search_docs"):
+        tables.append(("task_search_docs", ("task_id",)))
+    for name, columns in tables:
+        table = sa.table(name, *(sa.column(c) for c in columns))
+        op.execute(
+            table.update().values(
+                {c: sa.func.uuid_convert(table.c[c]) for c in columns}
+            )
+        )
+
+
+def _retype(type_, existing_type, search_docs_type: str) -> None:
+    # Values are converted before the copy, so batch mode's CAST keeps them
+    for table, columns in UUID_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, type_=type_, existing_type=existing_type)
+    if sa.inspect(op.get_bind()).has_table("task_search_docs"):
+        # Raw SQL like migration 0005; doc_id is the FTS rowid and is kept
+        op.execute(
+            "CREATE TABLE task_search_docs_new ("
+            f"doc_id INTEGER PRIMARY KEY, task_id {search_docs_type} "
+            "NOT NULL UNIQUE)"
+        )
+        op.execute(
+            "INSERT INTO task_search_docs_new (doc_id, task_id) "
+            "SELECT doc_id, task_id FROM task_search_docs"
+        )
+        op.execute("DROP TABLE task_search_docs")
+        op.execute("ALTER TABLE task_search_docs_new RENAME TO task_search_docs")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _convert(_to_blob)
+    _retype(sa.LargeBinary(16), sa.Uuid(), "BLOB")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _convert(_to_hex)
+    _retype(sa.Uuid(), sa.LargeBinary(16), "CHAR(32)")
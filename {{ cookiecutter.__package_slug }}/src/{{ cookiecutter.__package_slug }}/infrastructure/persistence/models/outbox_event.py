@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+
+
+class OutboxEventModel(Base):
+    """Domain events written with the change that caused them.
+
+    Rows are inserted in the writer's transaction and deleted by the outbox
+    relay once its sink has accepted them; `id` gives the delivery order.
+    """
+
+    __tablename__ = "outbox_events"
+
+    # INTEGER PRIMARY KEY is what autoincrements on SQLite
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True
+    )
+    type: Mapped[str] = mapped_column(String(64), nullable=False)
+    task_list_id: Mapped[UUID] = mapped_column(nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    # Failed deliveries so far; the relay retries the batch in order
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
 from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
 
+if TYPE_CHECKING:
+    from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list import TaskListModel
+
 
 class TaskModel(Base):
     """SQLAlchemy ORM model for Task entity."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves keyset pagination per list; its leading column also covers
+        # lookups on the task_list_id foreign key.
+        Index(
+            "ix_tasks_task_list_id_created_at_id", "task_list_id", "created_at", "id"
+        ),
+        Index("ix_tasks_task_list_id_is_completed", "task_list_id", "is_completed"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True)
     task_list_id: Mapped[UUID] = mapped_column(
@@ -29,6 +40,12 @@ class TaskModel(Base):
     completed_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    task_list: Mapped["TaskListModel"] = relationship(
+        back_populates="tasks", viewonly=True, lazy="raise"
+    )
 
     @staticmethod
     def from_domain(entity: Task) -> "TaskModel":
@@ -40,6 +57,7 @@ class TaskModel(Base):
             is_completed=entity.is_completed,
             created_at=entity.created_at,
             completed_at=entity.completed_at,
+            updated_at=entity.updated_at,
         )
 
     def to_domain(self) -> Task:
@@ -51,4 +69,14 @@ class TaskModel(Base):
             is_completed=self.is_completed,
             created_at=self.created_at,
             completed_at=self.completed_at,
+            updated_at=self.updated_at,
         )
+
+
+# Columns of the TaskSummary projection, in field order
+SUMMARY_COLUMNS = (
+    TaskModel.id,
+    TaskModel.task_list_id,
+    TaskModel.title,
+    TaskModel.is_completed,
+)
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
 
+if TYPE_CHECKING:
+    from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+
 
 class TaskListModel(Base):
     """SQLAlchemy ORM model for TaskList aggregate."""
 
     __tablename__ = "task_lists"
+    __table_args__ = (Index("ix_task_lists_created_at_id", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -24,6 +28,15 @@ class TaskListModel(Base):
     updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Read only, and never loaded lazily: load it in batches for a page of
+    # lists (see TaskListRepositoryRds.page_with_tasks) instead of per list.
+    # Tasks are written through TaskRepositoryRds.
+    tasks: Mapped[List["TaskModel"]] = relationship(
+        back_populates="task_list",
+        order_by="(TaskModel.created_at, TaskModel.id)",
+        viewonly=True,
+        lazy="raise",
+    )
 
     @staticmethod
     def from_domain(entity: TaskList) -> "TaskListModel":
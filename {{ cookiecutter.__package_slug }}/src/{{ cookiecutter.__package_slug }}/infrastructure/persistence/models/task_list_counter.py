@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+
+
+class TaskListCounterModel(Base):
+    """Materialized task counts per task list.
+
+    A read model only: rows are derived from `tasks` and can be rebuilt at
+    any time. Lists without tasks may have no row.
+    """
+
+    __tablename__ = "task_list_counters"
+
+    task_list_id: Mapped[UUID] = mapped_column(
+        ForeignKey("task_lists.id", ondelete="CASCADE"), primary_key=True
+    )
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_activity_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe checkout counters for one connection pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+
+    def observe_checkout(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_seconds_total += seconds
+            self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+class _InstrumentedPoolMixin:
+    """Times `connect()` so callers can see how long checkouts wait.
+
+    The metrics object survives `recreate()` (e.g. after `engine.dispose()`).
+    """
+
+    metrics: PoolMetrics
+    max_overflow: int
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        self.max_overflow = kwargs.get("max_overflow", 10)
+
+    def connect(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self.metrics.observe_timeout()
+            raise
+        self.metrics.observe_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):  # type: ignore[no-untyped-def]
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool that records checkout wait metrics."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait metrics."""
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """Describe the engine's pool: occupancy, saturation and checkout waits.
+
+    `saturation` is the share of the pool's capacity (size + max overflow)
+    currently checked out; it is None for pools without a fixed capacity.
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if not isinstance(pool, QueuePool):
+        return status
+
+    checked_out = pool.checkedout()
+    capacity: Optional[int] = None
+    max_overflow = getattr(pool, "max_overflow", None)
+    if max_overflow is not None and max_overflow >= 0:
+        capacity = pool.size() + max_overflow
+    status.update(
+        size=pool.size(),
+        checked_out=checked_out,
+        checked_in=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        capacity=capacity,
+        saturation=round(checked_out / capacity, 4) if capacity else None,
+    )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        checkouts = metrics.checkouts
+        status.update(
+            checkouts=checkouts,
+            timeouts=metrics.timeouts,
+            checkout_wait_avg_ms=(
+                round(metrics.checkout_seconds_total / checkouts * 1000, 3)
+                if checkouts
+                else 0.0
+            ),
+            checkout_wait_max_ms=round(metrics.checkout_seconds_max * 1000, 3),
+        )
+    return status
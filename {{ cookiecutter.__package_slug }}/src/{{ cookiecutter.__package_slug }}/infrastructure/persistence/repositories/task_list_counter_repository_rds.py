@@ -0,0 +1,128 @@
+import importlib
+from datetime import datetime
+from typing import Any, Iterable, Optional, Union, cast
+from uuid import UUID
+
+from sqlalchemy import (
+    CursorResult,
+    Select,
+    Table,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_list_counter_repository import (
+    TaskListCounterRepository,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list_counter import (
+    TaskListCounterModel,
+)
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE. Their `insert` is looked up
+# on use: the engine has loaded its own dialect by then, while importing
+# the other one here would only slow down startup.
+_UPSERT_DIALECTS = frozenset({"postgresql", "sqlite"})
+
+
+def task_counts(
+    task_list_ids: Optional[Union[Iterable[UUID], Select]] = None,
+) -> Select:
+    """Per-list `(task_list_id, total, completed, last_activity_at)` from tasks.
+
+    A task's last activity is its latest write: completing or patching sets
+    `updated_at`, older rows fall back to `completed_at` and `created_at`.
+    """
+    stmt = select(
+        TaskModel.task_list_id,
+        func.count(),
+        func.coalesce(func.sum(case((TaskModel.is_completed, 1), else_=0)), 0),
+        func.max(
+            func.coalesce(
+                TaskModel.updated_at, TaskModel.completed_at, TaskModel.created_at
+            )
+        ),
+    ).group_by(TaskModel.task_list_id)
+    if task_list_ids is not None:
+        stmt = stmt.where(TaskModel.task_list_id.in_(task_list_ids))
+    return stmt
+
+
+class TaskListCounterRepositoryRds(TaskListCounterRepository):
+    """Relational DB repository for the task counters of each list."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def increment(
+        self, task_list_id: UUID, *, total: int = 0, completed: int = 0, at: datetime
+    ) -> None:
+        """Add to a list's counters with one upsert, creating its row if needed."""
+        table = cast(Table, TaskListCounterModel.__table__)
+        row = {
+            "task_list_id": task_list_id,
+            "total": total,
+            "completed": completed,
+            "last_activity_at": at,
+        }
+        dialect = self._session.get_bind().dialect.name
+        if dialect in _UPSERT_DIALECTS:
+            upsert = importlib.import_module(f"sqlalchemy.dialects.{dialect}").insert
+            stmt = upsert(table).values(row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.task_list_id],
+                set_={
+                    "total": table.c.total + stmt.excluded.total,
+                    "completed": table.c.completed + stmt.excluded.completed,
+                    "last_activity_at": stmt.excluded.last_activity_at,
+                },
+            )
+            self._session.execute(stmt)
+            return
+        result = self._session.execute(
+            update(table)
+            .where(table.c.task_list_id == task_list_id)
+            .values(
+                total=table.c.total + total,
+                completed=table.c.completed + completed,
+                last_activity_at=at,
+            )
+        )
+        # Session.execute is typed as returning a Result; DML gets a cursor
+        result = cast(CursorResult[Any], result)
+        if result.rowcount == 0:
+            self._session.execute(insert(table).values(row))
+
+    def refresh(self, task_list_ids: Iterable[UUID]) -> None:
+        """Recount the given lists from their tasks.
+
+        Costs a scan of each list's tasks and replaces their rows, so it is
+        for repairing drifted counters, not for the write path.
+        """
+        ids = list(task_list_ids)
+        if not ids:
+            return
+        table = cast(Table, TaskListCounterModel.__table__)
+        self._session.execute(delete(table).where(table.c.task_list_id.in_(ids)))
+        self._session.execute(
+            insert(table).from_select(
+                ["task_list_id", "total", "completed", "last_activity_at"],
+                task_counts(ids),
+            )
+        )
+
+    def rebuild(self) -> None:
+        """Recount every list; use after tasks changed outside TaskService."""
+        table = cast(Table, TaskListCounterModel.__table__)
+        self._session.execute(delete(table))
+        self._session.execute(
+            insert(table).from_select(
+                ["task_list_id", "total", "completed", "last_activity_at"],
+                task_counts(),
+            )
+        )
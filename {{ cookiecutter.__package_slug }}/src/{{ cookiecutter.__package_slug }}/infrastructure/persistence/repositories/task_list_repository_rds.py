@@ -1,29 +1,239 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.attributes import set_committed_value
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_summary import TaskListSummary
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_with_tasks import TaskListWithTasks
 from {{ cookiecutter.__package_slug }}.domain.repositories.task_list_repository import TaskListRepository
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page, decode_cursor, encode_cursor
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_counter_repository_rds import (
+    task_counts,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.watermark import (
+    as_utc,
+    build_watermark,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list import TaskListModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list_counter import (
+    TaskListCounterModel,
+)
 
 
 class TaskListRepositoryRds(TaskListRepository):
-    """Relational DB repository for TaskList using SQLAlchemy Session."""
+    """Relational DB repository for TaskList using SQLAlchemy Session.
 
-    def __init__(self, session: Session) -> None:
+    With `counters=True` task summaries read the materialized
+    `task_list_counters` table instead of aggregating the tasks.
+    """
+
+    def __init__(self, session: Session, *, counters: bool = False) -> None:
         self._session = session
+        self._counters = counters
 
     def get(self, task_list_id: UUID) -> Optional[TaskList]:
         model = self._session.get(TaskListModel, task_list_id)
         return model.to_domain() if model else None
 
     def list(self, *, offset: int = 0, limit: int = 100) -> List[TaskList]:
-        stmt = select(TaskListModel).offset(offset).limit(limit)
+        stmt = (
+            select(TaskListModel)
+            .order_by(TaskListModel.created_at, TaskListModel.id)
+            .offset(offset)
+            .limit(limit)
+        )
         rows = self._session.execute(stmt).scalars().all()
         return [m.to_domain() for m in rows]
 
+    def page(self, *, cursor: Optional[str] = None, limit: int = 100) -> Page[TaskList]:
+        """Keyset-paginate task lists ordered by `(created_at, id)`.
+
+        Raises InvalidCursorError if the cursor is malformed.
+        """
+        rows = self._page_models(cursor, limit)
+        items = [m.to_domain() for m in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and items:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return Page(items=items, next_cursor=next_cursor)
+
+    def _page_models(
+        self, cursor: Optional[str], limit: int
+    ) -> Sequence[TaskListModel]:
+        """Task lists after `cursor`, one more than `limit` if there are more."""
+        stmt = select(TaskListModel)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(TaskListModel.created_at, TaskListModel.id)
+                > decode_cursor(cursor)
+            )
+        stmt = stmt.order_by(TaskListModel.created_at, TaskListModel.id).limit(
+            limit + 1
+        )
+        return self._session.execute(stmt).scalars().all()
+
+    def get_with_tasks(
+        self, task_list_id: UUID, *, tasks_limit: int = 100
+    ) -> Optional[TaskListWithTasks]:
+        """Return the task list with its first `tasks_limit` tasks, or None."""
+        model = self._session.get(TaskListModel, task_list_id)
+        if model is None:
+            return None
+        return self._with_tasks([model], tasks_limit)[0]
+
+    def page_with_tasks(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        tasks_limit: int = 100,
+    ) -> Page[TaskListWithTasks]:
+        """Keyset-paginate task lists, each with its first `tasks_limit` tasks.
+
+        Two statements whatever the page size: the page of lists, then the
+        tasks of all of them. Raises InvalidCursorError if the cursor is
+        malformed.
+        """
+        rows = self._page_models(cursor, limit)
+        items = self._with_tasks(rows[:limit], tasks_limit)
+        next_cursor = None
+        if len(rows) > limit and items:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return Page(items=items, next_cursor=next_cursor)
+
+    def _with_tasks(
+        self, models: Sequence[TaskListModel], tasks_limit: int
+    ) -> List[TaskListWithTasks]:
+        """Load the first tasks of every list in `models` with one query.
+
+        `selectinload` cannot cap the tasks per list, so they are ranked
+        within their list by a window function and filtered on the rank; the
+        result fills each model's `tasks` relationship.
+        """
+        by_list: Dict[UUID, List[TaskModel]] = {m.id: [] for m in models}
+        if by_list:
+            position = (
+                func.row_number()
+                .over(
+                    partition_by=TaskModel.task_list_id,
+                    order_by=(TaskModel.created_at, TaskModel.id),
+                )
+                .label("position")
+            )
+            ranked = (
+                select(TaskModel, position)
+                .where(TaskModel.task_list_id.in_(list(by_list)))
+                .subquery()
+            )
+            task = aliased(TaskModel, ranked)
+            # One extra task per list tells whether it has more
+            stmt = (
+                select(task)
+                .where(ranked.c.position <= tasks_limit + 1)
+                .order_by(ranked.c.task_list_id, ranked.c.position)
+            )
+            for row in self._session.execute(stmt).scalars():
+                by_list[row.task_list_id].append(row)
+        items = []
+        for model in models:
+            loaded = by_list[model.id]
+            set_committed_value(model, "tasks", loaded[:tasks_limit])
+            items.append(
+                TaskListWithTasks(
+                    id=model.id,
+                    name=model.name,
+                    created_at=model.created_at,
+                    tasks=[t.to_domain() for t in model.tasks],
+                    has_more_tasks=len(loaded) > tasks_limit,
+                )
+            )
+        return items
+
+    def page_summaries(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskListSummary]:
+        """Keyset-paginate task lists with their task counts in one query.
+
+        The page of lists is selected first and only its tasks are
+        aggregated (or its counter rows joined). Raises InvalidCursorError if
+        the cursor is malformed.
+        """
+        lists = select(
+            TaskListModel.id,
+            TaskListModel.name,
+            TaskListModel.created_at,
+            TaskListModel.updated_at,
+        )
+        if cursor is not None:
+            lists = lists.where(
+                tuple_(TaskListModel.created_at, TaskListModel.id)
+                > decode_cursor(cursor)
+            )
+        # Fetch one extra row to know whether another page exists
+        page = (
+            lists.order_by(TaskListModel.created_at, TaskListModel.id)
+            .limit(limit + 1)
+            .subquery()
+        )
+        if self._counters:
+            counts = select(TaskListCounterModel).subquery()
+        else:
+            # Restrict the aggregate to the page so only its tasks are read
+            counts = task_counts(select(page.c.id)).subquery()
+        task_list_id, total, completed, last_activity_at = counts.c
+        stmt = (
+            select(
+                page,
+                func.coalesce(total, 0),
+                func.coalesce(completed, 0),
+                last_activity_at,
+            )
+            .outerjoin(counts, task_list_id == page.c.id)
+            .order_by(page.c.created_at, page.c.id)
+        )
+        rows = cast(Sequence[Tuple[Any, ...]], self._session.execute(stmt).all())
+        items = [self._summary(*row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and items:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return Page(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _summary(
+        id: UUID,
+        name: str,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+        total: int,
+        completed: int,
+        last_activity_at: Optional[datetime],
+    ) -> TaskListSummary:
+        activity = [created_at, updated_at, last_activity_at]
+        return TaskListSummary(
+            id=id,
+            name=name,
+            created_at=created_at,
+            total=total,
+            completed=completed,
+            last_activity_at=max(as_utc(at) for at in activity if at is not None),
+        )
+
+    def watermark(self) -> Watermark:
+        """Summarize all task lists with one aggregate query."""
+        stmt = select(
+            func.count(),
+            func.max(TaskListModel.created_at),
+            func.max(TaskListModel.updated_at),
+        )
+        count, last_created, last_updated = self._session.execute(stmt).one()
+        return build_watermark(count, last_created, last_updated)
+
     def create(self, task_list: TaskList) -> TaskList:
         """Persist a new TaskList and return the stored entity."""
         model = TaskListModel.from_domain(task_list)
@@ -1,19 +1,52 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    cast,
+)
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Table, case, func, insert, select, tuple_, update
 from sqlalchemy.orm import Session
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_completion import TaskCompletion
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
 from {{ cookiecutter.__package_slug }}.domain.repositories.task_repository import TaskRepository
-from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_search_index import TaskSearchIndex
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page, decode_cursor, encode_cursor
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.watermark import build_watermark
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import SUMMARY_COLUMNS, TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task_list import TaskListModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.like import LikeTaskSearchIndex
+
+# Fields the search index covers
+SEARCHABLE_FIELDS = frozenset({"title", "description"})
+
+# Rows per INSERT statement; keeps Postgres well under its bind parameter limit
+BULK_INSERT_BATCH_SIZE = 1000
 
 
 class TaskRepositoryRds(TaskRepository):
-    """Relational DB repository for Task using SQLAlchemy Session."""
+    """Relational DB repository for Task using SQLAlchemy Session.
+
+    Writes keep `search_index` in sync within the same transaction. Without
+    one, search falls back to a LIKE scan.
+    """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self, session: Session, *, search_index: Optional[TaskSearchIndex] = None
+    ) -> None:
         self._session = session
+        self._search = search_index or LikeTaskSearchIndex(session)
 
     def get(self, task_id: UUID) -> Optional[Task]:
         model = self._session.get(TaskModel, task_id)
@@ -25,20 +58,152 @@ class TaskRepositoryRds(TaskRepository):
         stmt = (
             select(TaskModel)
             .where(TaskModel.task_list_id == task_list_id)
+            .order_by(TaskModel.created_at, TaskModel.id)
             .offset(offset)
             .limit(limit)
         )
         rows = self._session.execute(stmt).scalars().all()
         return [m.to_domain() for m in rows]
 
+    def page_by_task_list(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[Task]:
+        """Keyset-paginate tasks of a list ordered by `(created_at, id)`.
+
+        Raises InvalidCursorError if the cursor is malformed.
+        """
+        stmt = select(TaskModel).where(TaskModel.task_list_id == task_list_id)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(TaskModel.created_at, TaskModel.id) > decode_cursor(cursor)
+            )
+        # Fetch one extra row to know whether another page exists
+        stmt = stmt.order_by(TaskModel.created_at, TaskModel.id).limit(limit + 1)
+        rows = self._session.execute(stmt).scalars().all()
+        items = [m.to_domain() for m in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and items:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return Page(items=items, next_cursor=next_cursor)
+
+    def stream_by_task_list(
+        self, task_list_id: UUID, *, batch_size: int = 1000
+    ) -> Generator[List[Task], None, None]:
+        """Stream a list's tasks from a server-side cursor.
+
+        `yield_per` fetches `batch_size` rows at a time (Postgres uses a
+        named cursor). Plain rows are read instead of ORM instances, so
+        nothing accumulates in the session's identity map.
+        """
+        stmt = (
+            select(*TaskModel.__table__.c)
+            .where(TaskModel.task_list_id == task_list_id)
+            .order_by(TaskModel.created_at, TaskModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = self._session.execute(stmt)
+        try:
+            for rows in result.partitions():
+                yield [Task(**row._mapping) for row in rows]
+        finally:
+            result.close()
+
+    def watermark_by_task_list(self, task_list_id: UUID) -> Watermark:
+        """Summarize a list's tasks with one aggregate query over its index."""
+        stmt = select(
+            func.count(),
+            func.count(TaskModel.completed_at),
+            func.max(TaskModel.created_at),
+            func.max(TaskModel.completed_at),
+            func.max(TaskModel.updated_at),
+        ).where(TaskModel.task_list_id == task_list_id)
+        return build_watermark(*self._session.execute(stmt).one())
+
+    def list_summaries_by_task_list(
+        self, task_list_id: UUID, *, offset: int = 0, limit: int = 100
+    ) -> List[TaskSummary]:
+        """Like `list_by_task_list` but selects only the summary columns."""
+        stmt = (
+            select(*SUMMARY_COLUMNS)
+            .where(TaskModel.task_list_id == task_list_id)
+            .order_by(TaskModel.created_at, TaskModel.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [TaskSummary._make(row) for row in self._session.execute(stmt)]
+
+    def page_summaries_by_task_list(
+        self, task_list_id: UUID, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        """Like `page_by_task_list` but returns plain summary rows.
+
+        Skips the description and the ORM identity map entirely; created_at
+        is fetched only to build the next cursor.
+        """
+        stmt = select(*SUMMARY_COLUMNS, TaskModel.created_at).where(
+            TaskModel.task_list_id == task_list_id
+        )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(TaskModel.created_at, TaskModel.id) > decode_cursor(cursor)
+            )
+        stmt = stmt.order_by(TaskModel.created_at, TaskModel.id).limit(limit + 1)
+        rows = self._session.execute(stmt).all()
+        items = [TaskSummary._make(row[:-1]) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and items:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        # Items are typed rows already; skip per-item validation
+        return Page[TaskSummary].model_construct(items=items, next_cursor=next_cursor)
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        """Full-text search over titles and descriptions, best matches first.
+
+        Raises InvalidCursorError if the cursor is malformed.
+        """
+        return self._search.search(query, cursor=cursor, limit=limit)
+
     def create(self, task: Task) -> Task:
         """Persist a new Task and return the stored entity."""
         model = TaskModel.from_domain(task)
         self._session.add(model)
         self._session.flush()
         self._session.refresh(model)
+        self._search.refresh([model.id])
         return model.to_domain()
 
+    def create_many(self, tasks: Sequence[Task]) -> List[Task]:
+        """Persist many Tasks in batches and return the stored entities.
+
+        Postgres gets one multi-row `INSERT ... RETURNING` per batch; other
+        dialects (SQLite) use a single executemany per batch. Rows bypass the
+        ORM unit of work, so the entities are not added to the identity map.
+        """
+        table = cast(Table, TaskModel.__table__)
+        use_returning = self._session.get_bind().dialect.name == "postgresql"
+        created: List[Task] = []
+        for start in range(0, len(tasks), BULK_INSERT_BATCH_SIZE):
+            batch = tasks[start : start + BULK_INSERT_BATCH_SIZE]
+            rows = [task.model_dump() for task in batch]
+            if use_returning:
+                stmt = insert(table).values(rows).returning(*table.c)
+                result = self._session.execute(stmt)
+                created.extend(Task(**row._mapping) for row in result)
+            else:
+                self._session.execute(insert(table), rows)
+                created.extend(batch)
+        self._search.refresh(task.id for task in created)
+        return created
+
+    def existing_task_list_ids(self, task_list_ids: Collection[UUID]) -> Set[UUID]:
+        if not task_list_ids:
+            return set()
+        stmt = select(TaskListModel.id).where(TaskListModel.id.in_(set(task_list_ids)))
+        return set(self._session.execute(stmt).scalars())
+
     def update(self, task: Task) -> Task:
         """Update an existing Task; raises KeyError if not found."""
         existing = self._session.get(TaskModel, task.id)
@@ -50,10 +215,111 @@ class TaskRepositoryRds(TaskRepository):
         existing.is_completed = task.is_completed
         existing.created_at = task.created_at
         existing.completed_at = task.completed_at
+        existing.updated_at = task.updated_at
         self._session.flush()
         self._session.refresh(existing)
+        self._search.refresh([existing.id])
         return existing.to_domain()
 
+    def complete(
+        self, task_id: UUID, *, completed_at: datetime
+    ) -> Optional[TaskCompletion]:
+        """Complete an open task with one `UPDATE ... RETURNING`.
+
+        Only an open row matches, so a returned row is a real transition.
+        Otherwise the task is read back to tell "already completed" from
+        "missing".
+        """
+        values = self._patch_values({"is_completed": True}, completed_at)
+        updated = self._update(
+            (TaskModel.id == task_id) & ~TaskModel.is_completed, values
+        )
+        if updated:
+            return TaskCompletion(updated[0], changed=True)
+        task = self.get(task_id)
+        return TaskCompletion(task, changed=False) if task is not None else None
+
+    def complete_many(
+        self, task_ids: Sequence[UUID], *, completed_at: datetime
+    ) -> List[TaskCompletion]:
+        """Complete the given tasks with one set-based UPDATE per batch.
+
+        Returns the tasks that exist, in no particular order; unknown ids are
+        skipped. Ids the UPDATE did not match are read back in one SELECT
+        per batch and returned with `changed=False` if they exist.
+        """
+        values = self._patch_values({"is_completed": True}, completed_at)
+        results: List[TaskCompletion] = []
+        for start in range(0, len(task_ids), BULK_INSERT_BATCH_SIZE):
+            batch = task_ids[start : start + BULK_INSERT_BATCH_SIZE]
+            where = TaskModel.id.in_(batch) & ~TaskModel.is_completed
+            updated = self._update(where, values)
+            results.extend(TaskCompletion(t, changed=True) for t in updated)
+            rest = set(batch) - {t.id for t in updated}
+            if rest:
+                stmt = select(TaskModel).where(TaskModel.id.in_(rest))
+                results.extend(
+                    TaskCompletion(m.to_domain(), changed=False)
+                    for m in self._session.execute(stmt).scalars()
+                )
+        return results
+
+    def complete_by_task_list(
+        self, task_list_id: UUID, *, completed_at: datetime
+    ) -> List[Task]:
+        """Complete every open task of a list with one UPDATE.
+
+        Returns only the tasks this call completed.
+        """
+        values = self._patch_values({"is_completed": True}, completed_at)
+        where = (TaskModel.task_list_id == task_list_id) & ~TaskModel.is_completed
+        return self._update(where, values)
+
+    def patch(
+        self, task_id: UUID, changes: Mapping[str, Any], *, now: datetime
+    ) -> Optional[Task]:
+        """Run one `UPDATE ... RETURNING` for `changes`.
+
+        Completion is only stamped on rows that are not completed yet, so
+        repeating it changes nothing, `updated_at` included.
+        """
+        if not changes:
+            return self.get(task_id)
+        values = self._patch_values(changes, now)
+        updated = self._update(TaskModel.id == task_id, values)
+        if updated and SEARCHABLE_FIELDS & changes.keys():
+            self._search.refresh([task_id])
+        return updated[0] if updated else None
+
+    @staticmethod
+    def _patch_values(changes: Mapping[str, Any], now: datetime) -> Dict[str, Any]:
+        """Build the SET clause for `changes`, keeping derived columns in line."""
+        values: Dict[str, Any] = dict(changes)
+        changed: Any = None
+        if "is_completed" in values:
+            # Mirrors Task._sync_completed_at in SQL
+            if values["is_completed"]:
+                values["completed_at"] = func.coalesce(TaskModel.completed_at, now)
+            else:
+                values["completed_at"] = None
+            changed = TaskModel.is_completed != values["is_completed"]
+        for name in values.keys() - {"is_completed", "completed_at"}:
+            column = getattr(TaskModel, name)
+            is_different = column.is_distinct_from(values[name])
+            changed = is_different if changed is None else changed | is_different
+        values["updated_at"] = case((changed, now), else_=TaskModel.updated_at)
+        return values
+
+    def _update(self, where: Any, values: Mapping[str, Any]) -> List[Task]:
+        stmt = (
+            update(TaskModel)
+            .where(where)
+            .values(**values)
+            .returning(TaskModel)
+            .execution_options(populate_existing=True)
+        )
+        return [m.to_domain() for m in self._session.execute(stmt).scalars()]
+
     def delete(self, task_id: UUID) -> bool:
         """Delete a Task by id and return True if it existed."""
         model = self._session.get(TaskModel, task_id)
@@ -64,4 +330,5 @@ class TaskRepositoryRds(TaskRepository):
         self._session.flush()
         # Remove from identity map so subsequent get() won't return cached instance
         self._session.expunge(model)
+        self._search.refresh([task_id])
         return True
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Union
+
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
+
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def build_watermark(count: int, *parts: Union[int, Optional[datetime]]) -> Watermark:
+    """Build a Watermark from a row count plus aggregate counters/timestamps."""
+    timestamps: List[datetime] = [as_utc(p) for p in parts if isinstance(p, datetime)]
+    version = ":".join(
+        [str(count)]
+        + [as_utc(p).isoformat() if isinstance(p, datetime) else str(p) for p in parts]
+    )
+    return Watermark(
+        count=count,
+        last_modified=max(timestamps) if timestamps else None,
+        version=version,
+    )
@@ -0,0 +1,48 @@
+import itertools
+from typing import Generic, List, Sequence, TypeVar
+
+from sqlalchemy import Engine, event
+
+F = TypeVar("F")
+
+
+class SessionRouter(Generic[F]):
+    """Pick a session factory for a unit of work: primary or a read replica.
+
+    Writes always use the primary. Reads rotate round-robin across the
+    replicas and fall back to the primary when none are configured.
+    `sticky` replicas may lag, so a client's reads return to the primary for
+    a while after it writes; read-only connections to the primary's own
+    SQLite file are not sticky.
+    """
+
+    def __init__(
+        self, primary: F, replicas: Sequence[F] = (), sticky: bool = True
+    ) -> None:
+        self._primary = primary
+        self._replicas: List[F] = list(replicas)
+        self._next = itertools.count()
+        self.sticky = sticky
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    def for_write(self) -> F:
+        return self._primary
+
+    def for_read(self) -> F:
+        if not self._replicas:
+            return self._primary
+        return self._replicas[next(self._next) % len(self._replicas)]
+
+
+def _sqlite_query_only(dbapi_connection, connection_record) -> None:  # type: ignore[no-untyped-def]
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+def make_sqlite_read_only(engine: Engine) -> None:
+    """Reject writes on every connection `engine` opens to a SQLite file."""
+    event.listen(engine, "connect", _sqlite_query_only)
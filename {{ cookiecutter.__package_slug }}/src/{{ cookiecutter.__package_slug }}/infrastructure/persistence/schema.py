@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from sqlalchemy import Engine, inspect
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# Databases created with `Base.metadata.create_all` before migrations existed
+# already contain the tables of this revision.
+BASELINE_REVISION = "0001"
+
+
+# Created with raw SQL by migration 0005 and not mapped on Base.metadata:
+# the SQLite FTS5 table (with its shadow tables) and the Postgres tsvector
+UNMAPPED_TABLE_PREFIX = "task_search"
+UNMAPPED_OBJECTS = frozenset({"search_vector", "ix_tasks_search_vector"})
+
+
+def include_object(
+    obj: Any, name: Optional[str], type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """Alembic `include_object` hook hiding the unmapped search objects."""
+    if not reflected or compare_to is not None or name is None:
+        return True
+    if type_ == "table" and name.startswith(UNMAPPED_TABLE_PREFIX):
+        return False
+    return name not in UNMAPPED_OBJECTS
+
+
+def alembic_config() -> Config:
+    """Build an Alembic config pointing at the packaged migrations."""
+    # Imported here: alembic is only needed when migrating, not to serve
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+def upgrade_database(engine: Engine, revision: str = "head") -> None:
+    """Bring the database schema up to `revision` using Alembic migrations.
+
+    Unversioned databases that already hold the baseline tables are stamped
+    first so their indexes and later changes are applied incrementally.
+    """
+    from alembic import command
+
+    config = alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        inspector = inspect(connection)
+        if not inspector.has_table("alembic_version") and inspector.has_table("tasks"):
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
@@ -0,0 +1,48 @@
+import re
+from typing import Any, List, Optional
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import (
+    Page,
+    decode_rank_cursor,
+    encode_rank_cursor,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import SUMMARY_COLUMNS, TaskModel
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(query: str) -> List[str]:
+    """Split a user query into words; operators and punctuation are dropped."""
+    return _TERM.findall(query)
+
+
+def ranked_page(
+    session: Session, hits: Select[Any], *, cursor: Optional[str], limit: int
+) -> Page[TaskSummary]:
+    """Keyset-paginate `hits` (`task_id`, `score`; lower is better) as summaries.
+
+    The page is cut from the hits before joining tasks, so only the returned
+    rows are looked up. Raises InvalidCursorError if the cursor is malformed.
+    """
+    ranked = hits.subquery()
+    page_q = select(ranked)
+    if cursor is not None:
+        position = decode_rank_cursor(cursor)
+        page_q = page_q.where(tuple_(ranked.c.score, ranked.c.task_id) > position)
+    page = page_q.order_by(ranked.c.score, ranked.c.task_id).limit(limit + 1).subquery()
+    stmt = (
+        select(*SUMMARY_COLUMNS, page.c.score)
+        .join(page, page.c.task_id == TaskModel.id)
+        .order_by(page.c.score, page.c.task_id)
+    )
+    rows = session.execute(stmt).all()
+    items = [TaskSummary._make(row[:-1]) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = rows[limit - 1]
+        next_cursor = encode_rank_cursor(last.score, last.id)
+    return Page[TaskSummary].model_construct(items=items, next_cursor=next_cursor)
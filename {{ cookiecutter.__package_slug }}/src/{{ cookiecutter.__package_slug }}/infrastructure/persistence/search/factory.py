@@ -0,0 +1,31 @@
+from typing import Callable, Dict
+
+from sqlalchemy import Engine, inspect
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_search_index import TaskSearchIndex
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.like import LikeTaskSearchIndex
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.postgres_fts import PostgresTaskSearchIndex
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.sqlite_fts import SqliteFtsTaskSearchIndex
+
+SEARCH_BACKENDS: Dict[str, Callable[[Session], TaskSearchIndex]] = {
+    "like": LikeTaskSearchIndex,
+    "sqlite_fts": SqliteFtsTaskSearchIndex,
+    "postgres": PostgresTaskSearchIndex,
+}
+
+
+def detect_search_backend(engine: Engine) -> str:
+    """Pick the search backend the migrated schema of `engine` supports.
+
+    Falls back to "like" on other dialects and on SQLite builds without
+    FTS5, where migration 0005 skips the index.
+    """
+    inspector = inspect(engine)
+    if engine.dialect.name == "sqlite" and inspector.has_table("task_search"):
+        return "sqlite_fts"
+    if engine.dialect.name == "postgresql":
+        columns = {c["name"] for c in inspector.get_columns("tasks")}
+        if "search_vector" in columns:
+            return "postgres"
+    return "like"
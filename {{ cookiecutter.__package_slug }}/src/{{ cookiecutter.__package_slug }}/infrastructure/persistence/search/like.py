@@ -0,0 +1,55 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_search_index import TaskSearchIndex
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page, decode_cursor, encode_cursor
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import SUMMARY_COLUMNS, TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.base import search_terms
+
+
+class LikeTaskSearchIndex(TaskSearchIndex):
+    """Fallback search scanning tasks with case-insensitive LIKE.
+
+    Needs no index, so there is nothing to refresh, but every query reads the
+    whole table. Results are not ranked; they come in creation order.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def refresh(self, task_ids: Iterable[UUID]) -> None:
+        return None
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        terms = search_terms(query)
+        if not terms:
+            return Page[TaskSummary](items=[])
+        stmt = select(*SUMMARY_COLUMNS, TaskModel.created_at).where(
+            and_(
+                *(
+                    or_(
+                        TaskModel.title.icontains(term, autoescape=True),
+                        TaskModel.description.icontains(term, autoescape=True),
+                    )
+                    for term in terms
+                )
+            )
+        )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(TaskModel.created_at, TaskModel.id) > decode_cursor(cursor)
+            )
+        stmt = stmt.order_by(TaskModel.created_at, TaskModel.id).limit(limit + 1)
+        rows = self._session.execute(stmt).all()
+        items = [TaskSummary._make(row[:-1]) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and items:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return Page[TaskSummary].model_construct(items=items, next_cursor=next_cursor)
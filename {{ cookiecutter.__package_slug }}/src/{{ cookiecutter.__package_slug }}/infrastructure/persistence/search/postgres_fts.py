@@ -0,0 +1,44 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_search_index import TaskSearchIndex
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.base import ranked_page, search_terms
+
+# Generated tsvector column with a GIN index, added by migration 0005
+_SEARCH_VECTOR = literal_column("tasks.search_vector", TSVECTOR)
+
+
+class PostgresTaskSearchIndex(TaskSearchIndex):
+    """Postgres full-text search on a generated `tsvector` column.
+
+    Postgres recomputes the column on every write, so `refresh` has nothing
+    to do. Ranked by `ts_rank_cd`; titles are weighted above descriptions.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def refresh(self, task_ids: Iterable[UUID]) -> None:
+        return None
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        terms = search_terms(query)
+        if not terms:
+            return Page[TaskSummary](items=[])
+        # Same semantics as the SQLite index: every term as a whole word
+        tsquery = func.to_tsquery("simple", " & ".join(terms))
+        hits = select(
+            TaskModel.id.label("task_id"),
+            # Negated so that, as with BM25, lower sorts first
+            (-func.ts_rank_cd(_SEARCH_VECTOR, tsquery)).label("score"),
+        ).where(_SEARCH_VECTOR.op("@@")(tsquery))
+        return ranked_page(self._session, hits, cursor=cursor, limit=limit)
@@ -0,0 +1,106 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+from {{ cookiecutter.__package_slug }}.domain.repositories.task_search_index import TaskSearchIndex
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import Page
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.task import TaskModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.base import ranked_page, search_terms
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.types import CompactUuid
+
+# Created by migration 0005, not by Base.metadata: FTS5 tables are virtual
+_metadata = MetaData()
+
+# Maps task ids to stable integer rowids of the FTS table
+task_search_docs = Table(
+    "task_search_docs",
+    _metadata,
+    Column("doc_id", Integer, primary_key=True),
+    Column("task_id", CompactUuid, nullable=False, unique=True),
+)
+
+task_search = Table(
+    "task_search",
+    _metadata,
+    Column("rowid", Integer, primary_key=True),
+    Column("title", Text),
+    Column("description", Text),
+)
+
+# Title matches weigh more than description matches
+_SCORE = literal_column("bm25(task_search, 10.0, 1.0)", Float)
+
+# Task ids per statement while refreshing
+REFRESH_BATCH_SIZE = 500
+
+
+class SqliteFtsTaskSearchIndex(TaskSearchIndex):
+    """SQLite FTS5 index over task titles and descriptions, ranked by BM25.
+
+    The repository calls `refresh` after each write in the same transaction,
+    so the index never sees uncommitted or rolled back changes.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def refresh(self, task_ids: Iterable[UUID]) -> None:
+        """Re-index the given tasks; ids of deleted tasks are dropped."""
+        ids = list(task_ids)
+        for start in range(0, len(ids), REFRESH_BATCH_SIZE):
+            self._refresh(ids[start : start + REFRESH_BATCH_SIZE])
+
+    def _refresh(self, ids: list) -> None:
+        docs = task_search_docs.c
+        old = select(docs.doc_id).where(docs.task_id.in_(ids))
+        self._session.execute(delete(task_search).where(task_search.c.rowid.in_(old)))
+        self._session.execute(delete(task_search_docs).where(docs.task_id.in_(ids)))
+        self._session.execute(
+            insert(task_search_docs).from_select(
+                ["task_id"], select(TaskModel.id).where(TaskModel.id.in_(ids))
+            )
+        )
+        self._session.execute(
+            insert(task_search).from_select(
+                ["rowid", "title", "description"],
+                select(
+                    docs.doc_id,
+                    TaskModel.title,
+                    func.coalesce(TaskModel.description, ""),
+                )
+                .join(TaskModel, TaskModel.id == docs.task_id)
+                .where(docs.task_id.in_(ids)),
+            )
+        )
+
+    def search(
+        self, query: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[TaskSummary]:
+        terms = search_terms(query)
+        if not terms:
+            return Page[TaskSummary](items=[])
+        # Quoted terms are matched as literal words; all of them must occur
+        match = " ".join(f'"{term}"' for term in terms)
+        hits = (
+            select(task_search_docs.c.task_id, _SCORE.label("score"))
+            .select_from(task_search)
+            .join(task_search_docs, task_search_docs.c.doc_id == task_search.c.rowid)
+            .where(text("task_search MATCH :match").bindparams(match=match))
+        )
+        return ranked_page(self._session, hits, cursor=cursor, limit=limit)
@@ -0,0 +1,70 @@
+from typing import Any, Dict
+
+from sqlalchemy import Engine, event, make_url
+
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+
+def is_sqlite_file(database_url: str) -> bool:
+    """Whether `database_url` is a SQLite database on disk."""
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def uses_sqlite_profile(database_url: str, settings: Settings) -> bool:
+    """Whether `Settings.SQLITE_PROFILE` applies: a SQLite database on disk."""
+    return settings.SQLITE_PROFILE and is_sqlite_file(database_url)
+
+
+def sqlite_pragmas(settings: Settings) -> Dict[str, Any]:
+    """PRAGMA values set on every connection, in order.
+
+    WAL lets readers run alongside the writer, and with it
+    `synchronous=NORMAL` syncs at checkpoints instead of on every commit
+    (durable against crashes of the process, not of the OS). A negative
+    `cache_size` is in KiB.
+    """
+    return {
+        "journal_mode": "WAL",
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KIB,
+    }
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """Set `pragmas` on each connection `engine` opens."""
+    statements = [f"PRAGMA {name} = {value}" for name, value in pragmas.items()]
+
+    def on_connect(dbapi_connection, connection_record) -> None:  # type: ignore[no-untyped-def]
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+    event.listen(engine, "connect", on_connect)
+
+
+def begin_immediate(engine: Engine) -> None:
+    """Start every transaction on `engine` with `BEGIN IMMEDIATE`.
+
+    The driver's own deferred BEGIN takes the write lock only at the first
+    write: two transactions that both read first then deadlock on the
+    upgrade, and one fails with "database is locked" without waiting for
+    `busy_timeout`. Taking the lock up front makes writers wait in turn.
+    """
+
+    def on_connect(dbapi_connection, connection_record) -> None:  # type: ignore[no-untyped-def]
+        # Stop the driver from issuing BEGIN itself
+        dbapi_connection.isolation_level = None
+
+    def on_begin(conn) -> None:  # type: ignore[no-untyped-def]
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "begin", on_begin)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import Dialect, LargeBinary, Uuid
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+class CompactUuid(TypeDecorator[UUID]):
+    """UUID column stored in 16 bytes on every dialect.
+
+    Postgres has a native 16-byte `uuid` type. On SQLite, `Uuid` falls back
+    to CHAR(32) hex text; here the raw bytes go into a BLOB instead, which
+    halves the key in the table and in every index that repeats it.
+    """
+
+    impl = Uuid
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(LargeBinary(16))
+        return dialect.type_descriptor(Uuid())
+
+    # sqlite3 takes and returns bytes for BLOBs as they are, so the
+    # conversions below replace LargeBinary's processors rather than wrap them
+    def bind_processor(self, dialect: Dialect) -> Optional[Callable[[Any], Any]]:
+        if dialect.name != "sqlite":
+            return super().bind_processor(dialect)
+
+        def process(value: Any) -> Optional[bytes]:
+            if value is None:
+                return None
+            if not isinstance(value, UUID):
+                value = UUID(str(value))
+            return value.bytes
+
+        return process
+
+    def result_processor(
+        self, dialect: Dialect, coltype: Any
+    ) -> Optional[Callable[[Any], Any]]:
+        if dialect.name != "sqlite":
+            return super().result_processor(dialect, coltype)
+
+        def process(value: Any) -> Optional[UUID]:
+            return None if value is None else UUID(bytes=bytes(value))
+
+        return process
@@ -1,4 +1,7 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Annotated, Any, List, Literal, Optional, Union
+
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -9,3 +12,120 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str = "sqlite:///./{{ cookiecutter.__package_slug }}.db"
+    # Serve requests with AsyncEngine/AsyncSession (aiosqlite / psycopg async)
+    # instead of the threadpool-bound sync stack.
+    DATABASE_ASYNC: bool = False
+    # Apply pending migrations when the app starts (its lifespan), not when it
+    # is imported. Turn off where migrations run as a separate deploy step;
+    # `python -m {{ cookiecutter.__package_slug }}` migrates once and turns it off for its workers.
+    DATABASE_MIGRATE_ON_STARTUP: bool = True
+
+    # Connection pool tuning; unset values fall back to per-dialect defaults
+    # (see `infrastructure.container.DIALECT_POOL_DEFAULTS`).
+    DATABASE_POOL_SIZE: Optional[int] = None
+    DATABASE_MAX_OVERFLOW: Optional[int] = None
+    DATABASE_POOL_TIMEOUT: Optional[float] = None
+    DATABASE_POOL_RECYCLE: Optional[int] = None
+    DATABASE_POOL_PRE_PING: Optional[bool] = None
+    DATABASE_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    # Pool saturation (checked out / capacity) at which /health reports degraded
+    DATABASE_POOL_SATURATION_WARNING: float = 0.9
+
+    # SQLite profile for databases on disk: WAL journal, synchronous mode,
+    # memory-mapped I/O, page cache and busy timeout set on every connection.
+    # Writes are serialized through a single connection that starts with
+    # BEGIN IMMEDIATE; GET requests read concurrently through a pool of
+    # read-only connections to the same file. Off by default: enable it for
+    # databases that several threads or worker processes write to.
+    SQLITE_PROFILE: bool = False
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024
+
+    # Read replicas for GET/HEAD requests, comma separated or a JSON list.
+    # Writes always go to DATABASE_URL.
+    READ_REPLICA_URLS: Annotated[List[str], NoDecode] = []
+    # After a write, the client's reads stay on the primary for this long so
+    # it sees its own changes despite replication lag.
+    READ_REPLICA_STICKY_SECONDS: float = 5.0
+
+    # Generator of new task and task list ids: "uuid7" (time ordered, so
+    # inserts append to the primary key index) or "uuid4" (fully random).
+    ID_GENERATOR: Literal["uuid7", "uuid4"] = "uuid7"
+
+    # Repository read cache: "none", "memory" (per process LRU) or "redis"
+    # (shared by all workers, needs the redis package and CACHE_URL).
+    CACHE_BACKEND: Literal["none", "memory", "redis"] = "none"
+    CACHE_URL: Optional[str] = None
+    CACHE_TTL_SECONDS: float = 30.0
+    CACHE_MAX_ENTRIES: int = 10_000
+
+    # Serve GET /task-lists/summary from the task_list_counters table kept up
+    # to date by TaskService instead of counting tasks on every request.
+    TASK_LIST_COUNTERS: bool = False
+
+    # Change feed broker behind GET /changes/: "local" (subscribers of this
+    # process only) or "redis" (shared by all workers, needs CHANGE_FEED_URL).
+    CHANGE_FEED_BACKEND: Literal["local", "redis"] = "local"
+    CHANGE_FEED_URL: Optional[str] = None
+
+    # Transactional outbox: when enabled, every change is also written to the
+    # outbox_events table in the request's transaction. The relay
+    # (`python -m {{ cookiecutter.__package_slug }}.infrastructure.outbox.relay`) drains it to OUTBOX_SINK:
+    # "log" or "changes" (the change feed broker, useful with redis). With
+    # "changes" the relay is the feed's only source: requests no longer
+    # publish to it directly, and changes show up once the relay runs.
+    OUTBOX_ENABLED: bool = False
+    OUTBOX_SINK: Literal["log", "changes"] = "log"
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_MAX_BACKOFF_SECONDS: float = 60.0
+
+    # Prometheus metrics at GET /metrics. Requests running more statements
+    # than METRICS_QUERY_BUDGET are logged as likely N+1 queries (0: never).
+    METRICS_ENABLED: bool = True
+    METRICS_QUERY_BUDGET: int = 20
+
+    # OpenTelemetry spans for requests, use cases, services, repositories and
+    # SQL statements (needs the opentelemetry-sdk package). Exporter: "none"
+    # (no instrumentation at all), "console", "file" (one JSON span per line in
+    # TRACING_FILE) or "otlp" (configured by the OTEL_EXPORTER_OTLP_* variables).
+    # TRACING_SAMPLE_RATIO of new traces are recorded; an incoming
+    # `traceparent` header's sampling decision is kept.
+    TRACING_EXPORTER: Literal["none", "console", "file", "otlp"] = "none"
+    TRACING_FILE: Optional[str] = None
+    TRACING_SAMPLE_RATIO: float = Field(default=1.0, ge=0.0, le=1.0)
+    TRACING_SERVICE_NAME: str = "{{ cookiecutter.__package_slug }}"
+
+    # `python -m {{ cookiecutter.__package_slug }}` server. SERVER_WORKERS defaults to 1: the local change
+    # feed and memory cache are per process (see `multi_worker_warnings`);
+    # "auto" starts one worker per CPU available to the process.
+    # "auto" loop/http use uvloop/httptools when installed (the
+    # `speedups` dependency group). SERVER_THREADPOOL_SIZE caps the threads
+    # that run sync endpoints and domain calls in each worker (anyio's default
+    # is 40); keep it within the connection pool size. Workers are recycled
+    # after SERVER_MAX_REQUESTS requests, plus up to SERVER_MAX_REQUESTS_JITTER
+    # so they do not all restart at once.
+    SERVER_HOST: str = "127.0.0.1"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[Union[Literal["auto"], Annotated[int, Field(ge=1)]]] = None
+    SERVER_LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    SERVER_HTTP: Literal["auto", "h11", "httptools"] = "auto"
+    SERVER_THREADPOOL_SIZE: Optional[int] = Field(default=None, ge=1)
+    SERVER_KEEP_ALIVE_SECONDS: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_MAX_REQUESTS: Optional[int] = Field(default=None, ge=1)
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+
+    @field_validator("READ_REPLICA_URLS", mode="before")
+    @classmethod
+    def _split_urls(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            value = value.strip()
+            if value.startswith("["):
+                import json
+
+                return json.loads(value)
+            return [url.strip() for url in value.split(",") if url.strip()]
+        return value
@@ -0,0 +1,66 @@
+import os
+from typing import Any, Optional
+
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+
+def _span_line(span: Any) -> str:
+    return span.to_json(indent=None) + os.linesep
+
+
+def create_tracer_provider(settings: Settings) -> Optional[Any]:
+    """Build the TracerProvider selected by `Settings.TRACING_EXPORTER`.
+
+    Returns None when tracing is off. Each app gets its own provider instead
+    of the process-wide one, so several apps (as in tests) do not share
+    exporters. Traces are sampled at TRACING_SAMPLE_RATIO unless the caller's
+    `traceparent` header already decided.
+    """
+    if settings.TRACING_EXPORTER == "none":
+        return None
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "TRACING_EXPORTER requires the 'opentelemetry-sdk' package"
+        ) from exc
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+    )
+    if settings.TRACING_EXPORTER == "console":
+        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+    elif settings.TRACING_EXPORTER == "file":
+        if not settings.TRACING_FILE:
+            raise ValueError("TRACING_EXPORTER=file requires TRACING_FILE")
+        out = open(settings.TRACING_FILE, "a", encoding="utf-8")
+        exporter = ConsoleSpanExporter(out=out, formatter=_span_line)
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+    else:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "TRACING_EXPORTER=otlp requires the "
+                "'opentelemetry-exporter-otlp-proto-http' package"
+            ) from exc
+        # Endpoint and headers come from the standard OTEL_EXPORTER_OTLP_* vars
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    return provider
+
+
+def get_tracer(provider: Optional[Any]) -> Optional[Any]:
+    """The application's tracer from `provider`, None without one."""
+    if provider is None:
+        return None
+    return provider.get_tracer("{{ cookiecutter.__package_slug }}")
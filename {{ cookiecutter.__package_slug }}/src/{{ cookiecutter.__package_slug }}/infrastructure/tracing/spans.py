@@ -0,0 +1,107 @@
+import functools
+import inspect
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Optional, TypeVar
+
+from sqlalchemy import Engine, event
+
+from {{ cookiecutter.__package_slug }}.infrastructure.metrics.queries import operation_of
+
+T = TypeVar("T")
+
+
+def span(tracer: Optional[Any], name: str) -> ContextManager[Any]:
+    """A span named `name` under the current one, or nothing without a tracer."""
+    if tracer is None:
+        return nullcontext()
+    return tracer.start_as_current_span(name)
+
+
+class TracedProxy:
+    """Wraps every public method of `target` in a span named `Class.method`.
+
+    Used around use cases, services and repositories, which keep working
+    unchanged: attribute lookups fall through to `target`. Coroutine methods
+    get their span across the await; generator methods are passed through
+    untraced, as their work happens after the call returns.
+    """
+
+    def __init__(self, target: Any, tracer: Any) -> None:
+        self._target = target
+        self._tracer = tracer
+        self._prefix = type(target).__name__
+        self._methods: Dict[str, Callable[..., Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        wrapped = self._methods.get(name)
+        if wrapped is None:
+            wrapped = self._methods[name] = self._wrap(name, attr)
+        return wrapped
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = f"{self._prefix}.{name}"
+        tracer = self._tracer
+        if inspect.isgeneratorfunction(method) or inspect.isasyncgenfunction(method):
+            return method
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def traced_async(*args: Any, **kwargs: Any) -> Any:
+                with tracer.start_as_current_span(span_name):
+                    return await method(*args, **kwargs)
+
+            return traced_async
+
+        @functools.wraps(method)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            with tracer.start_as_current_span(span_name):
+                return method(*args, **kwargs)
+
+        return traced
+
+
+def traced(target: T, tracer: Optional[Any]) -> T:
+    """`target` wrapped in a TracedProxy, or `target` itself without a tracer."""
+    if tracer is None:
+        return target
+    return TracedProxy(target, tracer)  # type: ignore[return-value]
+
+
+def trace_engine(engine: Engine, tracer: Any) -> None:
+    """Record one client span per statement `engine` runs.
+
+    Spans start in the caller's context, so they nest under the repository
+    method that issued the statement.
+    """
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+
+    system = engine.dialect.name
+
+    def before(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        sql_span = tracer.start_span(
+            operation_of(statement),
+            kind=SpanKind.CLIENT,
+            attributes={"db.system": system, "db.statement": statement},
+        )
+        conn.info.setdefault("query_spans", []).append(sql_span)
+
+    def after(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        spans = conn.info.get("query_spans")
+        if spans:
+            spans.pop().end()
+
+    def on_error(context: Any) -> None:
+        conn = context.connection
+        spans = conn.info.get("query_spans") if conn is not None else None
+        if spans:
+            sql_span = spans.pop()
+            sql_span.record_exception(context.original_exception)
+            sql_span.set_status(Status(StatusCode.ERROR))
+            sql_span.end()
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    event.listen(engine, "handle_error", on_error)
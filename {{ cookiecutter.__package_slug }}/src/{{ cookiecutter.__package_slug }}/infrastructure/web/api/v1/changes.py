@@ -0,0 +1,32 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Request
+from fastapi.sse import EventSourceResponse, ServerSentEvent
+
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+# Reconnect delay suggested to EventSource clients, in milliseconds
+RETRY_MS = 2000
+
+
+@router.get(
+    "/",
+    response_class=EventSourceResponse,
+    summary="Stream committed changes as server-sent events",
+)
+async def stream(request: Request) -> AsyncIterator[ServerSentEvent]:
+    """Push every committed change to task lists and tasks.
+
+    Each message's data is a JSON object whose `type` is `task_list.created`,
+    `task.created`, `task.completed` or `task.updated`, with the entity as
+    written under `task_list` or `task`. A `reset` message means changes were
+    missed and the client should reload. Nothing is replayed on reconnect, so
+    clients should also reload whenever the stream reopens.
+    """
+    broker = request.app.container.change_broker()  # type: ignore[attr-defined]
+    async with broker.subscribe() as messages:
+        # Sent once subscribed: every change committed from now on follows
+        yield ServerSentEvent(comment="subscribed", retry=RETRY_MS)
+        async for message in messages:
+            yield ServerSentEvent(raw_data=message.decode())
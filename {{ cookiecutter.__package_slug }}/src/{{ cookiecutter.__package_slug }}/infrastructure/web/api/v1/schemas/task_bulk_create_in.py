@@ -0,0 +1,16 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+# Upper bound on items per request to keep a single transaction reasonable
+MAX_BULK_ITEMS = 10_000
+
+
+class TaskBulkCreateIn(BaseModel):
+    """Input payload to create many Tasks at once.
+
+    Items are validated one by one against `TaskCreateIn` so a bad item is
+    reported in the results instead of rejecting the whole request.
+    """
+
+    items: List[Dict[str, Any]] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
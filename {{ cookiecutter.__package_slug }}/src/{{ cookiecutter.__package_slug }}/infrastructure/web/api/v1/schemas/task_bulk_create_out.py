@@ -0,0 +1,21 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
+
+
+class TaskBulkItemResult(BaseModel):
+    """Outcome for one item of a bulk create request."""
+
+    index: int
+    task: Optional[TaskOut] = None
+    errors: List[Dict[str, Any]] = []
+
+
+class TaskBulkCreateOut(BaseModel):
+    """Output model for the bulk create endpoint."""
+
+    created: int
+    failed: int
+    results: List[TaskBulkItemResult]
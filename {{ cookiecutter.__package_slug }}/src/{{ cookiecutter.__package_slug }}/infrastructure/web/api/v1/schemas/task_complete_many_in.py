@@ -0,0 +1,12 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_bulk_create_in import MAX_BULK_ITEMS
+
+
+class TaskCompleteManyIn(BaseModel):
+    """Input payload to complete many tasks in one request."""
+
+    task_ids: List[UUID] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
@@ -0,0 +1,22 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
+
+
+class TaskCompleteResult(BaseModel):
+    """Outcome for one id of a batch complete request."""
+
+    id: str
+    status: Literal["completed", "already_completed", "not_found"]
+    task: Optional[TaskOut] = None
+
+
+class TaskCompleteManyOut(BaseModel):
+    """Output model for the batch complete endpoint."""
+
+    completed: int
+    already_completed: int
+    not_found: int
+    results: List[TaskCompleteResult]
@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
+
+
+class TaskListCompleteAllOut(BaseModel):
+    """Output model for completing every open task of a list."""
+
+    task_list_id: str
+    completed: int
+    tasks: List[TaskOut]
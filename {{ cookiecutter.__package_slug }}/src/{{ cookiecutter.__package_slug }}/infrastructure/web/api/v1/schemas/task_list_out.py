@@ -1,8 +1,21 @@
-from pydantic import BaseModel
+from typing import Iterable, List
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
 
 
+class _TaskListOutRow(TypedDict):
+    # Same JSON shape as TaskListOut
+    id: UUID
+    name: str
+
+
+_ROWS: TypeAdapter[List[_TaskListOutRow]] = TypeAdapter(List[_TaskListOutRow])
+
+
 class TaskListOut(BaseModel):
     """Output model for TaskList endpoints."""
 
@@ -12,3 +25,11 @@ class TaskListOut(BaseModel):
     @staticmethod
     def from_domain(entity: TaskList) -> "TaskListOut":
         return TaskListOut(id=str(entity.id), name=entity.name)
+
+    @staticmethod
+    def dump_json_many(entities: Iterable[TaskList]) -> bytes:
+        """Serialize entities as a JSON array of TaskListOut objects.
+
+        Fast path for list responses; see `TaskOut.dump_json_many`.
+        """
+        return _ROWS.dump_json([{"id": e.id, "name": e.name} for e in entities])
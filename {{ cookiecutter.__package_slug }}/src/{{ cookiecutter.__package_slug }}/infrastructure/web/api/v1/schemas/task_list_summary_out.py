@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_summary import TaskListSummary
+
+
+class TaskListSummaryOut(BaseModel):
+    """Output model for a task list with its task counts."""
+
+    id: str
+    name: str
+    total: int
+    open: int
+    completed: int
+    last_activity_at: Optional[datetime] = None
+
+    @staticmethod
+    def from_domain(entity: TaskListSummary) -> "TaskListSummaryOut":
+        return TaskListSummaryOut(
+            id=str(entity.id),
+            name=entity.name,
+            total=entity.total,
+            open=entity.open,
+            completed=entity.completed,
+            last_activity_at=entity.last_activity_at,
+        )
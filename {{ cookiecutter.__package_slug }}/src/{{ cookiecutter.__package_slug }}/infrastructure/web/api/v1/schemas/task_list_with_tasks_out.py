@@ -0,0 +1,32 @@
+from typing import Iterable, List
+
+from pydantic import BaseModel, TypeAdapter
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list_with_tasks import TaskListWithTasks
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
+
+
+class TaskListWithTasksOut(BaseModel):
+    """Output model for a task list with its first tasks (`?include=tasks`)."""
+
+    id: str
+    name: str
+    tasks: List[TaskOut]
+    # More tasks are paged with GET /tasks/by-list/{id}
+    has_more_tasks: bool
+
+    @staticmethod
+    def from_domain(entity: TaskListWithTasks) -> "TaskListWithTasksOut":
+        return TaskListWithTasksOut(
+            id=str(entity.id),
+            name=entity.name,
+            tasks=[TaskOut.from_domain(t) for t in entity.tasks],
+            has_more_tasks=entity.has_more_tasks,
+        )
+
+    @staticmethod
+    def dump_json_many(entities: Iterable[TaskListWithTasks]) -> bytes:
+        return _MANY.dump_json([TaskListWithTasksOut.from_domain(e) for e in entities])
+
+
+_MANY: TypeAdapter[List[TaskListWithTasksOut]] = TypeAdapter(List[TaskListWithTasksOut])
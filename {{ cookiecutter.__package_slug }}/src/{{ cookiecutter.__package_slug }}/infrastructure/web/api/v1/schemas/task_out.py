@@ -1,6 +1,22 @@
-from pydantic import BaseModel
+from typing import Iterable, List, Union
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_summary import TaskSummary
+
+
+class _TaskOutRow(TypedDict):
+    # Same JSON shape as TaskOut; UUIDs serialize to their canonical strings
+    id: UUID
+    task_list_id: UUID
+    title: str
+    is_completed: bool
+
+
+_ROWS: TypeAdapter[List[_TaskOutRow]] = TypeAdapter(List[_TaskOutRow])
 
 
 class TaskOut(BaseModel):
@@ -19,3 +35,22 @@ class TaskOut(BaseModel):
             title=entity.title,
             is_completed=entity.is_completed,
         )
+
+    @staticmethod
+    def dump_json_many(entities: Iterable[Union[Task, TaskSummary]]) -> bytes:
+        """Serialize entities as a JSON array of TaskOut objects.
+
+        Fast path for list responses: plain dicts go through one pydantic
+        serializer call, without building and validating a TaskOut per row.
+        """
+        return _ROWS.dump_json(
+            [
+                {
+                    "id": e.id,
+                    "task_list_id": e.task_list_id,
+                    "title": e.title,
+                    "is_completed": e.is_completed,
+                }
+                for e in entities
+            ]
+        )
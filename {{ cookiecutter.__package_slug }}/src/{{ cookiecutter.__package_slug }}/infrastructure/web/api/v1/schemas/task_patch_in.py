@@ -0,0 +1,12 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TaskPatchIn(BaseModel):
+    """Partial update of a Task; only the fields sent are changed."""
+
+    task_list_id: UUID | None = None
+    title: str | None = Field(default=None, min_length=1, max_length=200)
+    description: str | None = Field(default=None, max_length=1000)
+    is_completed: bool | None = None
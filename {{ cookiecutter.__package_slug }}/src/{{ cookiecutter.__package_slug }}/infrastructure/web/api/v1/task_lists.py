@@ -1,30 +1,182 @@
-from typing import List
+from typing import List, Literal, Optional, Union
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from {{ cookiecutter.__package_slug }}.application.task_lists import TaskListUseCases
+from {{ cookiecutter.__package_slug }}.application.tasks import TaskUseCases
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import InvalidCursorError
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_list_complete_all_out import (
+    TaskListCompleteAllOut,
+)
 from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_list_create_in import TaskListCreateIn
 from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_list_out import TaskListOut
-from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.services import get_task_list_use_cases
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_list_summary_out import (
+    TaskListSummaryOut,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_list_with_tasks_out import (
+    TaskListWithTasksOut,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
+from {{ cookiecutter.__package_slug }}.infrastructure.web.conditional import conditional_response
+from {{ cookiecutter.__package_slug }}.infrastructure.web.serialization import json_response
+from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.services import (
+    get_task_list_use_cases,
+    get_task_use_cases,
+)
 
 
 router = APIRouter(prefix="/task-lists", tags=["task-lists"])
 
+# Upper bound of `tasks_limit`, the tasks returned per list with ?include=tasks
+MAX_TASKS_LIMIT = 1000
+
 
 @router.post("/", response_model=TaskListOut, summary="Create a task list")
-def create(
+async def create(
     payload: TaskListCreateIn,
     use_cases: TaskListUseCases = Depends(get_task_list_use_cases),
 ) -> TaskListOut:
-    created = use_cases.create(payload.name)
+    created = await use_cases.create(payload.name)
     return TaskListOut.from_domain(created)
 
 
-@router.get("/", response_model=List[TaskListOut], summary="List task lists")
-def list_(
+@router.get(
+    "/",
+    response_model=Union[List[TaskListOut], List[TaskListWithTasksOut]],
+    summary="List task lists",
+)
+async def list_(
+    request: Request,
+    response: Response,
     offset: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include: Optional[Literal["tasks"]] = None,
+    tasks_limit: int = 100,
+    use_cases: TaskListUseCases = Depends(get_task_list_use_cases),
+) -> Union[List[TaskListOut], List[TaskListWithTasksOut], Response]:
+    """List task lists ordered by creation time.
+
+    Pages are keyset-paginated: follow the `X-Next-Cursor` response header
+    with `?cursor=`. `offset` is kept for backwards compatibility.
+    Responses carry an `ETag`; send it back in `If-None-Match` to get a 304
+    while the collection is unchanged.
+
+    With `?include=tasks` each list comes with its first `tasks_limit` tasks,
+    read for the whole page at once instead of one request per list.
+    """
+    if offset and cursor is not None:
+        raise HTTPException(status_code=400, detail="Use either offset or cursor")
+    if include == "tasks":
+        if offset:
+            raise HTTPException(
+                status_code=400, detail="include=tasks pages with cursor only"
+            )
+        # No ETag: the watermark of the lists does not cover their tasks
+        try:
+            with_tasks = await use_cases.page_with_tasks(
+                cursor=cursor,
+                limit=limit,
+                tasks_limit=max(0, min(tasks_limit, MAX_TASKS_LIMIT)),
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if with_tasks.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = with_tasks.next_cursor
+        return json_response(
+            response, TaskListWithTasksOut.dump_json_many(with_tasks.items)
+        )
+    watermark = await use_cases.watermark()
+    not_modified = conditional_response(request, response, watermark)
+    if not_modified is not None:
+        return not_modified
+    if offset:
+        items = await use_cases.list(offset=offset, limit=limit)
+        return json_response(response, TaskListOut.dump_json_many(items))
+    try:
+        page = await use_cases.page(cursor=cursor, limit=limit)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return json_response(response, TaskListOut.dump_json_many(page.items))
+
+
+@router.get(
+    "/summary",
+    response_model=List[TaskListSummaryOut],
+    summary="List task lists with task counts",
+)
+async def summary(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = 100,
     use_cases: TaskListUseCases = Depends(get_task_list_use_cases),
-) -> List[TaskListOut]:
-    items = use_cases.list(offset=offset, limit=limit)
-    return [TaskListOut.from_domain(x) for x in items]
+) -> List[TaskListSummaryOut]:
+    """List task lists with total/open/completed counts and last activity.
+
+    Counts come from one grouped query per page, so clients no longer need to
+    fetch the tasks themselves. Keyset-paginated like `GET /task-lists/`.
+    """
+    try:
+        page = await use_cases.page_summaries(cursor=cursor, limit=limit)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return [TaskListSummaryOut.from_domain(s) for s in page.items]
+
+
+@router.get(
+    "/{task_list_id}",
+    response_model=Union[TaskListOut, TaskListWithTasksOut],
+    summary="Get a task list",
+)
+async def get(
+    task_list_id: UUID,
+    include: Optional[Literal["tasks"]] = None,
+    tasks_limit: int = 100,
+    use_cases: TaskListUseCases = Depends(get_task_list_use_cases),
+) -> Union[TaskListOut, TaskListWithTasksOut]:
+    """Get a task list by id.
+
+    With `?include=tasks` its first `tasks_limit` tasks come along in
+    creation order, read with one more query.
+    """
+    if include == "tasks":
+        with_tasks = await use_cases.get_with_tasks(
+            task_list_id, tasks_limit=max(0, min(tasks_limit, MAX_TASKS_LIMIT))
+        )
+        if with_tasks is None:
+            raise HTTPException(status_code=404, detail="Task list not found")
+        return TaskListWithTasksOut.from_domain(with_tasks)
+    task_list = await use_cases.get(task_list_id)
+    if task_list is None:
+        raise HTTPException(status_code=404, detail="Task list not found")
+    return TaskListOut.from_domain(task_list)
+
+
+@router.post(
+    "/{task_list_id}/complete-all",
+    response_model=TaskListCompleteAllOut,
+    summary="Complete every open task of a list",
+)
+async def complete_all(
+    task_list_id: UUID,
+    task_list_use_cases: TaskListUseCases = Depends(get_task_list_use_cases),
+    task_use_cases: TaskUseCases = Depends(get_task_use_cases),
+) -> TaskListCompleteAllOut:
+    """Complete all open tasks of the list with a single UPDATE.
+
+    Returns the tasks this call completed; tasks that were already complete
+    are left untouched.
+    """
+    if await task_list_use_cases.get(task_list_id) is None:
+        raise HTTPException(status_code=404, detail="Task list not found")
+    tasks = await task_use_cases.complete_all(task_list_id)
+    return TaskListCompleteAllOut(
+        task_list_id=str(task_list_id),
+        completed=len(tasks),
+        tasks=[TaskOut.from_domain(t) for t in tasks],
+    )
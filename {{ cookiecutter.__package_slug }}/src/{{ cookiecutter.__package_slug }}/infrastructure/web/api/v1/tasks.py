@@ -1,12 +1,36 @@
-from typing import List
+from collections import Counter
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
+from {{ cookiecutter.__package_slug }}.application.task_lists import TaskListUseCases
 from {{ cookiecutter.__package_slug }}.application.tasks import TaskUseCases
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import InvalidCursorError
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_bulk_create_in import TaskBulkCreateIn
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_bulk_create_out import (
+    TaskBulkCreateOut,
+    TaskBulkItemResult,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_complete_many_in import (
+    TaskCompleteManyIn,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_complete_many_out import (
+    TaskCompleteManyOut,
+    TaskCompleteResult,
+)
 from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_create_in import TaskCreateIn
 from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
-from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.services import get_task_use_cases
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_patch_in import TaskPatchIn
+from {{ cookiecutter.__package_slug }}.infrastructure.web.conditional import conditional_response
+from {{ cookiecutter.__package_slug }}.infrastructure.web.serialization import json_response
+from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.services import (
+    get_task_list_use_cases,
+    get_task_use_cases,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.web.export import EXPORT_FORMATS, encode_stream
 
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -14,22 +38,134 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 # Removed local DTOs; importing from schemas instead
 
+# Bulk item error for a task list that does not exist, shaped like the
+# validation errors reported next to it
+LIST_NOT_FOUND = {
+    "type": "not_found",
+    "loc": ["task_list_id"],
+    "msg": "Task list not found",
+}
+
 
 @router.post("/", response_model=TaskOut, summary="Create a task")
-def create(
+async def create(
     payload: TaskCreateIn,
     use_cases: TaskUseCases = Depends(get_task_use_cases),
 ) -> TaskOut:
-    created = use_cases.add(payload.task_list_id, payload.title, payload.description)
+    created = await use_cases.add(
+        payload.task_list_id, payload.title, payload.description
+    )
     return TaskOut.from_domain(created)
 
 
+@router.post("/bulk", response_model=TaskBulkCreateOut, summary="Create many tasks")
+async def create_bulk(
+    payload: TaskBulkCreateIn,
+    use_cases: TaskUseCases = Depends(get_task_use_cases),
+) -> TaskBulkCreateOut:
+    """Create tasks in batched writes, reporting validation errors per item.
+
+    Valid items are stored in one transaction; invalid ones, and those whose
+    task list does not exist, are skipped and returned with their errors.
+    """
+    results: List[TaskBulkItemResult] = []
+    valid: List[Tuple[int, TaskCreateIn]] = []
+    for index, raw in enumerate(payload.items):
+        try:
+            valid.append((index, TaskCreateIn.model_validate(raw)))
+        except ValidationError as exc:
+            errors = exc.errors(
+                include_url=False, include_context=False, include_input=False
+            )
+            results.append(
+                TaskBulkItemResult(
+                    index=index, errors=cast(List[Dict[str, Any]], errors)
+                )
+            )
+
+    outcome = await use_cases.add_many(
+        (item.task_list_id, item.title, item.description) for _, item in valid
+    )
+    created = 0
+    for (index, _), task in zip(valid, outcome):
+        if task is None:
+            results.append(TaskBulkItemResult(index=index, errors=[LIST_NOT_FOUND]))
+        else:
+            created += 1
+            results.append(
+                TaskBulkItemResult(index=index, task=TaskOut.from_domain(task))
+            )
+
+    results.sort(key=lambda r: r.index)
+    return TaskBulkCreateOut(
+        created=created, failed=len(results) - created, results=results
+    )
+
+
+@router.post(
+    "/complete", response_model=TaskCompleteManyOut, summary="Complete many tasks"
+)
+async def complete_many(
+    payload: TaskCompleteManyIn,
+    use_cases: TaskUseCases = Depends(get_task_use_cases),
+) -> TaskCompleteManyOut:
+    """Complete the given tasks in one transaction with set-based updates.
+
+    Unknown ids are reported as `not_found` and do not fail the request;
+    already completed tasks are left unchanged and reported as
+    `already_completed`.
+    """
+    outcome = await use_cases.complete_many(payload.task_ids)
+    results: List[TaskCompleteResult] = []
+    for task_id, result in outcome.items():
+        if result is None:
+            results.append(TaskCompleteResult(id=str(task_id), status="not_found"))
+        else:
+            results.append(
+                TaskCompleteResult(
+                    id=str(task_id),
+                    status="completed" if result.changed else "already_completed",
+                    task=TaskOut.from_domain(result.task),
+                )
+            )
+    counts = Counter(r.status for r in results)
+    return TaskCompleteManyOut(
+        completed=counts["completed"],
+        already_completed=counts["already_completed"],
+        not_found=counts["not_found"],
+        results=results,
+    )
+
+
 @router.post("/{task_id}/complete", response_model=TaskOut, summary="Complete a task")
-def complete(
+async def complete(
     task_id: UUID,
     use_cases: TaskUseCases = Depends(get_task_use_cases),
 ) -> TaskOut:
-    updated = use_cases.complete(task_id)
+    """Complete a task; completing it again leaves it unchanged."""
+    try:
+        updated = await use_cases.complete(task_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Task not found") from exc
+    return TaskOut.from_domain(updated)
+
+
+@router.patch("/{task_id}", response_model=TaskOut, summary="Update a task")
+async def patch(
+    task_id: UUID,
+    payload: TaskPatchIn,
+    use_cases: TaskUseCases = Depends(get_task_use_cases),
+) -> TaskOut:
+    """Change only the fields present in the body, in a single write."""
+    try:
+        updated = await use_cases.patch(task_id, payload.model_dump(exclude_unset=True))
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Task not found") from exc
+    except ValidationError as exc:
+        errors = exc.errors(
+            include_url=False, include_context=False, include_input=False
+        )
+        raise HTTPException(status_code=422, detail=errors) from exc
     return TaskOut.from_domain(updated)
 
 
@@ -38,11 +174,85 @@ def complete(
     response_model=List[TaskOut],
     summary="List tasks by list id",
 )
-def list_by_list(
+async def list_by_list(
     task_list_id: UUID,
+    request: Request,
+    response: Response,
     offset: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    use_cases: TaskUseCases = Depends(get_task_use_cases),
+) -> Union[List[TaskOut], Response]:
+    """List tasks ordered by creation time.
+
+    Pages are keyset-paginated: follow the `X-Next-Cursor` response header
+    with `?cursor=`. `offset` is kept for backwards compatibility.
+    Responses carry an `ETag`; send it back in `If-None-Match` to get a 304
+    while the list is unchanged.
+    """
+    if offset and cursor is not None:
+        raise HTTPException(status_code=400, detail="Use either offset or cursor")
+    watermark = await use_cases.watermark(task_list_id)
+    not_modified = conditional_response(request, response, watermark)
+    if not_modified is not None:
+        return not_modified
+    if offset:
+        items = await use_cases.list_summaries(task_list_id, offset=offset, limit=limit)
+        return json_response(response, TaskOut.dump_json_many(items))
+    try:
+        page = await use_cases.page_summaries(task_list_id, cursor=cursor, limit=limit)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return json_response(response, TaskOut.dump_json_many(page.items))
+
+
+@router.get("/search", response_model=List[TaskOut], summary="Search tasks")
+async def search(
+    response: Response,
+    q: str = Query(min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    use_cases: TaskUseCases = Depends(get_task_use_cases),
+) -> Response:
+    """Search task titles and descriptions, best matches first.
+
+    All words of `q` must match as whole words. Follow the `X-Next-Cursor`
+    response header with `?cursor=` for more results.
+    """
+    try:
+        page = await use_cases.search(q, cursor=cursor, limit=limit)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return json_response(response, TaskOut.dump_json_many(page.items))
+
+
+@router.get("/by-list/{task_list_id}/export", summary="Export all tasks of a list")
+async def export_by_list(
+    task_list_id: UUID,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = 1000,
+    task_list_use_cases: TaskListUseCases = Depends(get_task_list_use_cases),
     use_cases: TaskUseCases = Depends(get_task_use_cases),
-) -> List[TaskOut]:
-    items = use_cases.list(task_list_id, offset=offset, limit=limit)
-    return [TaskOut.from_domain(x) for x in items]
+) -> StreamingResponse:
+    """Stream every task of the list as NDJSON or CSV.
+
+    Rows are read from a server-side cursor `batch_size` at a time and
+    written as they arrive, so memory stays flat however long the list is.
+    The cursor runs on the request's session, which FastAPI 0.118 and later
+    close only after the response has been sent.
+    """
+    if await task_list_use_cases.get(task_list_id) is None:
+        raise HTTPException(status_code=404, detail="Task list not found")
+    batch_size = max(1, min(batch_size, 10_000))
+    media_type = EXPORT_FORMATS[format][0]
+    chunks = use_cases.stream(task_list_id, batch_size=batch_size)
+    filename = f"tasks-{task_list_id}.{format}"
+    return StreamingResponse(
+        encode_stream(chunks, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
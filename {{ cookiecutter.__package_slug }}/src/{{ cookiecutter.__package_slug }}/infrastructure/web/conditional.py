@@ -0,0 +1,42 @@
+import hashlib
+from email.utils import format_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+from {{ cookiecutter.__package_slug }}.domain.shared.watermark import Watermark
+
+
+def _etag(watermark: Watermark, request: Request) -> str:
+    # The query string selects the page, so it is part of the validator
+    raw = f"{watermark.version}|{request.url.query}".encode()
+    return '"' + hashlib.sha256(raw).hexdigest()[:32] + '"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison (RFC 9110 13.1.2): a W/ prefix does not matter
+    candidates = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def conditional_response(
+    request: Request, response: Response, watermark: Watermark
+) -> Optional[Response]:
+    """Apply `ETag`/`Last-Modified` for `watermark` to the response.
+
+    Returns a 304 response when the client's `If-None-Match` shows its copy
+    is current; the caller then skips loading and serializing the rows.
+    Returns None otherwise. `If-Modified-Since` alone is not honoured: a
+    deleted row does not move the latest timestamp, only the ETag.
+    """
+    # no-cache: clients may store the body but must revalidate before reuse,
+    # otherwise Last-Modified alone would allow heuristic freshness
+    headers = {"ETag": _etag(watermark, request), "Cache-Control": "no-cache"}
+    if watermark.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(watermark.last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return None
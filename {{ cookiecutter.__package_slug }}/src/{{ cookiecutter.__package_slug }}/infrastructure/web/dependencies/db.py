@@ -1,18 +1,101 @@
-from collections.abc import Generator
+from __future__ import annotations
 
-from fastapi import Request
+import math
+import time
+from collections.abc import AsyncGenerator, Generator
+from typing import TYPE_CHECKING, TypeVar
+
+from fastapi import Request, Response
 from sqlalchemy.orm import Session
 
+from {{ cookiecutter.__package_slug }}.infrastructure.metrics.queries import record_commit
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.routing import SessionRouter
+from {{ cookiecutter.__package_slug }}.infrastructure.tracing.spans import span
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+F = TypeVar("F")
+
+# Requests served from a read replica when one is configured
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Holds the unix time until which a client's reads stay on the primary
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+
+def _reads_from_replica(request: Request) -> bool:
+    if request.method not in READ_METHODS:
+        return False
+    until = request.cookies.get(PRIMARY_STICKY_COOKIE)
+    if not until:
+        return True
+    try:
+        return float(until) <= time.time()
+    except ValueError:
+        return True
+
+
+def _route(request: Request, response: Response, router: SessionRouter[F]) -> F:
+    """Choose the session factory for this request.
 
-def get_session(request: Request) -> Generator[Session, None, None]:
+    Reads go to a replica unless the client wrote recently; writes go to the
+    primary and pin the client's following reads to it (read-your-writes)
+    when the replicas are sticky.
+    """
+    if not router.has_replicas:
+        return router.for_write()
+    if not router.sticky:
+        if request.method in READ_METHODS:
+            return router.for_read()
+        return router.for_write()
+    if _reads_from_replica(request):
+        return router.for_read()
+    if request.method not in READ_METHODS:
+        seconds = request.app.container.settings().READ_REPLICA_STICKY_SECONDS  # type: ignore[attr-defined]
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            f"{time.time() + seconds:.3f}",
+            max_age=math.ceil(seconds),
+            httponly=True,
+            samesite="lax",
+        )
+    return router.for_write()
+
+
+def get_session(request: Request, response: Response) -> Generator[Session, None, None]:
     """FastAPI dependency that yields a SQLAlchemy Session from app container."""
-    session_factory = request.app.container.session_factory()  # type: ignore[attr-defined]
+    router = request.app.container.session_router()  # type: ignore[attr-defined]
+    session_factory = _route(request, response, router)
     session: Session = session_factory()
     try:
         yield session
-        session.commit()
+        start = time.perf_counter()
+        with span(request.app.container.tracer(), "COMMIT"):  # type: ignore[attr-defined]
+            session.commit()
+        record_commit(time.perf_counter() - start)
     except Exception:
         session.rollback()
         raise
     finally:
         session.close()
+
+
+async def get_async_session(
+    request: Request, response: Response
+) -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that yields an AsyncSession from app container."""
+    router = request.app.container.async_session_router()  # type: ignore[attr-defined]
+    session_factory = _route(request, response, router)
+    session: AsyncSession = session_factory()
+    try:
+        yield session
+        start = time.perf_counter()
+        with span(request.app.container.tracer(), "COMMIT"):  # type: ignore[attr-defined]
+            await session.commit()
+        record_commit(time.perf_counter() - start)
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
@@ -1,32 +1,141 @@
-from fastapi import Depends
+from typing import Callable, TypeVar, cast
+
+from fastapi import Depends, Request
+from sqlalchemy import event
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from {{ cookiecutter.__package_slug }}.application.runner import Runner
 from {{ cookiecutter.__package_slug }}.application.task_lists import TaskListUseCases
 from {{ cookiecutter.__package_slug }}.application.tasks import TaskUseCases
 from {{ cookiecutter.__package_slug }}.domain.services.task_list_service import (
     TaskListService as DomainTaskListService,
 )
 from {{ cookiecutter.__package_slug }}.domain.services.task_service import TaskService as DomainTaskService
+from {{ cookiecutter.__package_slug }}.domain.shared.changes import ChangePublisher
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.repository import CachedRepositoryBase
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.task_list_repository_cached import (
+    TaskListRepositoryCached,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.task_repository_cached import (
+    TaskRepositoryCached,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.changes.publisher import (
+    FanOutChangePublisher,
+    TransactionalChangePublisher,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.publisher import OutboxChangePublisher
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_counter_repository_rds import (
+    TaskListCounterRepositoryRds,
+)
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
     TaskListRepositoryRds,
 )
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
     TaskRepositoryRds,
 )
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.factory import SEARCH_BACKENDS
+from {{ cookiecutter.__package_slug }}.infrastructure.tracing.spans import span, traced
 from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.db import get_session
 
+R = TypeVar("R")
+
+# run_in_threadpool is typed with a ParamSpec, which the Runner protocol does
+# not spell out
+_THREADPOOL = cast(Runner, run_in_threadpool)
+
+
+def _with_cache(
+    repo: R,
+    decorator: Callable[..., CachedRepositoryBase],
+    session: Session,
+    request: Request,
+) -> R:
+    """Wrap `repo` in its caching decorator when a cache backend is configured.
+
+    Invalidations are replayed once the session commits.
+    """
+    container = request.app.container  # type: ignore[attr-defined]
+    cache = container.cache()
+    if cache is None:
+        return repo
+    cached = decorator(repo, cache, ttl=container.settings().CACHE_TTL_SECONDS)
+    event.listen(session, "after_commit", lambda _: cached.replay_invalidations())
+    return cached  # type: ignore[return-value]
+
 
-def get_task_list_use_cases(
-    session: Session = Depends(get_session),
+def _change_publisher(session: Session, request: Request) -> ChangePublisher:
+    """Publisher sending the session's changes to the feed once it commits.
+
+    With the outbox enabled they are also written to it in the same
+    transaction. When the outbox relay delivers to the feed itself
+    (`OUTBOX_SINK=changes`) nothing is published inline, so every change
+    reaches the feed exactly once, in outbox order.
+    """
+    container = request.app.container  # type: ignore[attr-defined]
+    settings = container.settings()
+    if settings.OUTBOX_ENABLED and settings.OUTBOX_SINK == "changes":
+        return OutboxChangePublisher(session)
+    feed = TransactionalChangePublisher(container.change_broker(), session)
+    if not settings.OUTBOX_ENABLED:
+        return feed
+    return FanOutChangePublisher([OutboxChangePublisher(session), feed])
+
+
+def build_task_list_use_cases(
+    session: Session, run: Runner, request: Request
 ) -> TaskListUseCases:
-    """Build TaskList use cases with RDS repository and domain service."""
-    repo = TaskListRepositoryRds(session)
-    svc = DomainTaskListService(repo)
-    return TaskListUseCases(svc)
+    container = request.app.container  # type: ignore[attr-defined]
+    settings = container.settings()
+    tracer = container.tracer()
+    with span(tracer, "build TaskListUseCases"):
+        repo = _with_cache(
+            traced(
+                TaskListRepositoryRds(session, counters=settings.TASK_LIST_COUNTERS),
+                tracer,
+            ),
+            TaskListRepositoryCached,
+            session,
+            request,
+        )
+        svc = DomainTaskListService(repo, _change_publisher(session, request))
+        return traced(TaskListUseCases(traced(svc, tracer), run), tracer)
+
+
+def build_task_use_cases(
+    session: Session, run: Runner, request: Request
+) -> TaskUseCases:
+    container = request.app.container  # type: ignore[attr-defined]
+    tracer = container.tracer()
+    with span(tracer, "build TaskUseCases"):
+        search_index = SEARCH_BACKENDS[container.search_backend()](session)
+        repo = _with_cache(
+            traced(TaskRepositoryRds(session, search_index=search_index), tracer),
+            TaskRepositoryCached,
+            session,
+            request,
+        )
+        settings = container.settings()
+        counters = None
+        if settings.TASK_LIST_COUNTERS:
+            counters = traced(TaskListCounterRepositoryRds(session), tracer)
+        svc = DomainTaskService(repo, counters, _change_publisher(session, request))
+        return traced(TaskUseCases(traced(svc, tracer), run), tracer)
+
+
+async def get_task_list_use_cases(
+    request: Request, session: Session = Depends(get_session)
+) -> TaskListUseCases:
+    """Build TaskList use cases with RDS repository and domain service.
+
+    Domain calls run in Starlette's threadpool; building the use cases does
+    no I/O, so this dependency itself stays on the event loop.
+    """
+    return build_task_list_use_cases(session, _THREADPOOL, request)
 
 
-def get_task_use_cases(session: Session = Depends(get_session)) -> TaskUseCases:
+async def get_task_use_cases(
+    request: Request, session: Session = Depends(get_session)
+) -> TaskUseCases:
     """Build Task use cases with RDS repository and domain service."""
-    repo = TaskRepositoryRds(session)
-    svc = DomainTaskService(repo)
-    return TaskUseCases(svc)
+    return build_task_use_cases(session, _THREADPOOL, request)
@@ -0,0 +1,56 @@
+from typing import Any, Callable, Dict, TypeVar
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from {{ cookiecutter.__package_slug }}.application.runner import Runner
+from {{ cookiecutter.__package_slug }}.application.task_lists import TaskListUseCases
+from {{ cookiecutter.__package_slug }}.application.tasks import TaskUseCases
+from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.db import get_async_session
+from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.services import (
+    build_task_list_use_cases,
+    build_task_use_cases,
+    get_task_list_use_cases,
+    get_task_use_cases,
+)
+
+T = TypeVar("T")
+
+
+def _async_session_runner(session: AsyncSession) -> Runner:
+    """Run sync domain code on the AsyncSession's connection via a greenlet.
+
+    The sync repositories are reused as-is: their I/O is awaited on the event
+    loop instead of blocking a threadpool worker.
+    """
+
+    async def run(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        return await session.run_sync(lambda _: fn(*args, **kwargs))
+
+    return run
+
+
+async def get_task_list_use_cases_async(
+    request: Request, session: AsyncSession = Depends(get_async_session)
+) -> TaskListUseCases:
+    """Build TaskList use cases on an AsyncSession."""
+    return build_task_list_use_cases(
+        session.sync_session, _async_session_runner(session), request
+    )
+
+
+async def get_task_use_cases_async(
+    request: Request, session: AsyncSession = Depends(get_async_session)
+) -> TaskUseCases:
+    """Build Task use cases on an AsyncSession."""
+    return build_task_use_cases(
+        session.sync_session, _async_session_runner(session), request
+    )
+
+
+# Installed as `app.dependency_overrides` when Settings.DATABASE_ASYNC is set;
+# kept apart so the sync stack never imports sqlalchemy.ext.asyncio
+ASYNC_DEPENDENCY_OVERRIDES: Dict[Callable[..., Any], Callable[..., Any]] = {
+    get_task_list_use_cases: get_task_list_use_cases_async,
+    get_task_use_cases: get_task_use_cases_async,
+}
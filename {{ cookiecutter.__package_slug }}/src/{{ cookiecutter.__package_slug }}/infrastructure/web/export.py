@@ -0,0 +1,64 @@
+import csv
+import io
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+
+EXPORT_FIELDS = (
+    "id",
+    "task_list_id",
+    "title",
+    "description",
+    "is_completed",
+    "created_at",
+    "completed_at",
+    "updated_at",
+)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _csv_rows(rows: List[Tuple[Any, ...]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def encode_ndjson(tasks: List[Task]) -> bytes:
+    return b"".join(
+        task.model_dump_json(include=set(EXPORT_FIELDS)).encode() + b"\n"
+        for task in tasks
+    )
+
+
+def encode_csv(tasks: List[Task]) -> bytes:
+    return _csv_rows(
+        [tuple(_csv_value(getattr(t, f)) for f in EXPORT_FIELDS) for t in tasks]
+    )
+
+
+# format -> (media type, header bytes, chunk encoder)
+EXPORT_FORMATS: Dict[str, Tuple[str, bytes, Callable[[List[Task]], bytes]]] = {
+    "ndjson": ("application/x-ndjson", b"", encode_ndjson),
+    "csv": ("text/csv; charset=utf-8", _csv_rows([EXPORT_FIELDS]), encode_csv),
+}
+
+
+async def encode_stream(
+    chunks: AsyncIterator[List[Task]], export_format: str
+) -> AsyncIterator[bytes]:
+    """Encode task chunks as they arrive; one body chunk per input chunk."""
+    _, header, encode = EXPORT_FORMATS[export_format]
+    if header:
+        yield header
+    async for tasks in chunks:
+        yield encode(tasks)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+
+from fastapi import APIRouter, Request, Response
+from sqlalchemy import Engine, text
+from starlette.concurrency import run_in_threadpool
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.pool import pool_status
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.sqlite import uses_sqlite_profile
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+router = APIRouter(tags=["health"])
+
+
+def _ping(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def _ping_async(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+@router.get("/health", summary="Service, database and connection pool health")
+async def health(request: Request, response: Response) -> Dict[str, Any]:
+    """Report database reachability and pool saturation.
+
+    Returns 503 when the database cannot be reached and `degraded` when the
+    pool in use is close to its capacity.
+    """
+    container = request.app.container  # type: ignore[attr-defined]
+    settings = container.settings()
+    # Under the SQLite profile the primary is the single writer connection,
+    # busy whenever a write runs; report on the readers serving requests
+    reader = uses_sqlite_profile(settings.DATABASE_URL, settings) and not (
+        settings.READ_REPLICA_URLS
+    )
+    if settings.DATABASE_ASYNC:
+        async_engine = (
+            container.async_replica_engines()[0] if reader else container.async_engine()
+        )
+        engine = async_engine.sync_engine
+        ping = _ping_async(async_engine)
+    else:
+        engine = container.replica_engines()[0] if reader else container.engine()
+        ping = run_in_threadpool(_ping, engine)
+
+    body: Dict[str, Any] = {"status": "ok"}
+    try:
+        await ping
+        body["database"] = "ok"
+    except Exception as exc:
+        response.status_code = 503
+        body.update(status="unavailable", database=type(exc).__name__)
+
+    pool = pool_status(engine)
+    body["pool"] = pool
+    saturation = pool.get("saturation")
+    if (
+        body["status"] == "ok"
+        and saturation is not None
+        and saturation >= settings.DATABASE_POOL_SATURATION_WARNING
+    ):
+        body["status"] = "degraded"
+    return body
@@ -0,0 +1,24 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from anyio import to_thread
+from fastapi import FastAPI
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Per-worker startup and shutdown.
+
+    Migrates the database unless DATABASE_MIGRATE_ON_STARTUP is off, so that
+    importing the app never touches it. Then sizes the threadpool that runs
+    sync dependencies and domain calls; the limiter belongs to the event
+    loop, so it is set once the worker's loop is running.
+    """
+    container = app.container  # type: ignore[attr-defined]
+    settings = container.settings()
+    if settings.DATABASE_MIGRATE_ON_STARTUP:
+        await to_thread.run_sync(container.init_database)
+    if settings.SERVER_THREADPOOL_SIZE:
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = settings.SERVER_THREADPOOL_SIZE
+    yield
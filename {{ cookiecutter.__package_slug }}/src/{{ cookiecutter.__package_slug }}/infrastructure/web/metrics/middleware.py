@@ -0,0 +1,84 @@
+import logging
+import time
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from {{ cookiecutter.__package_slug }}.infrastructure.metrics.prometheus import AppMetrics
+from {{ cookiecutter.__package_slug }}.infrastructure.metrics.queries import (
+    RequestStats,
+    current_request_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def route_label(scope: Scope) -> str:
+    """The matched route's path template, so ids do not explode cardinality."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Times each HTTP request and the database work done for it.
+
+    A plain ASGI middleware: the measurement ends once the application has
+    returned, after the session dependencies have committed, and streaming
+    bodies are passed through untouched. Requests that run more than
+    `query_budget` statements (0 disables the check) are logged with their
+    most repeated statement, the usual sign of an N+1 query pattern.
+    """
+
+    def __init__(
+        self, app: ASGIApp, metrics: AppMetrics, query_budget: int = 0
+    ) -> None:
+        self.app = app
+        self.metrics = metrics
+        self.query_budget = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        stats = RequestStats()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = self.metrics.in_progress.labels(method)
+        in_progress.inc()
+        token = current_request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            seconds = time.perf_counter() - start
+            current_request_stats.reset(token)
+            in_progress.dec()
+            route = route_label(scope)
+            self.metrics.observe_request(method, route, status, seconds, stats)
+            if self.query_budget and stats.queries > self.query_budget:
+                self._report_over_budget(method, route, stats)
+
+    def _report_over_budget(self, method: str, route: str, stats: RequestStats) -> None:
+        self.metrics.over_budget.labels(method, route).inc()
+        statement, repeats = stats.most_repeated()
+        logger.warning(
+            "%s %s ran %d queries (budget %d); most repeated, %d times: %s",
+            method,
+            route,
+            stats.queries,
+            self.query_budget,
+            repeats,
+            " ".join(statement.split())[:300],
+        )
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Request, Response
+
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def metrics(request: Request) -> Response:
+    """Expose request, query and pool metrics in the Prometheus text format."""
+    app_metrics = request.app.container.metrics()  # type: ignore[attr-defined]
+    body, content_type = app_metrics.exposition()
+    return Response(content=body, media_type=content_type)
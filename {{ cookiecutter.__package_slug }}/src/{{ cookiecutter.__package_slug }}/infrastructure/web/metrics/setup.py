@@ -0,0 +1,23 @@
+from fastapi import FastAPI
+
+from {{ cookiecutter.__package_slug }}.infrastructure.container import Container
+from {{ cookiecutter.__package_slug }}.infrastructure.web.metrics.middleware import MetricsMiddleware
+from {{ cookiecutter.__package_slug }}.infrastructure.web.metrics.routes import router as metrics_router
+
+
+def install_metrics(app: FastAPI, container: Container) -> None:
+    """Instrument the engines the app uses, time requests and add /metrics."""
+    settings = container.settings()
+    metrics = container.metrics()
+    metrics.instrument_engine("primary", container.engine())
+    for n, engine in enumerate(container.replica_engines()):
+        metrics.instrument_engine(f"replica-{n}", engine)
+    if settings.DATABASE_ASYNC:
+        async_primary = container.async_engine().sync_engine
+        metrics.instrument_engine("async-primary", async_primary)
+        for n, async_engine in enumerate(container.async_replica_engines()):
+            metrics.instrument_engine(f"async-replica-{n}", async_engine.sync_engine)
+    app.add_middleware(
+        MetricsMiddleware, metrics=metrics, query_budget=settings.METRICS_QUERY_BUDGET
+    )
+    app.include_router(metrics_router)
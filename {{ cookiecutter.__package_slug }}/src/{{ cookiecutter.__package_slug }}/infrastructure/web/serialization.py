@@ -0,0 +1,18 @@
+from fastapi import Response
+
+
+def json_response(response: Response, content: bytes) -> Response:
+    """Wrap pre-serialized JSON bytes in a Response.
+
+    Returning a Response skips FastAPI's `response_model` validation and its
+    `jsonable_encoder`/`json.dumps` round trip; the route's `response_model`
+    still documents the body. Headers already set on `response` (e.g. the
+    pagination cursor or ETag) are carried over.
+    """
+    out = Response(content=content, media_type="application/json")
+    out.raw_headers.extend(
+        (name, value)
+        for name, value in response.raw_headers
+        if name not in (b"content-length", b"content-type")
+    )
+    return out
@@ -0,0 +1,69 @@
+import os
+from typing import Any, Dict, List, Union
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.sqlite import is_sqlite_file
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+# Import string of the app factory uvicorn calls in each worker process
+APP = "{{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }}:create_app"
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks (e.g. cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def resolve_workers(workers: Union[int, str, None]) -> int:
+    """Worker count for a SERVER_WORKERS value: 1 if unset, CPUs for "auto"."""
+    if workers is None:
+        return 1
+    if workers == "auto":
+        return available_cpus()
+    return int(workers)
+
+
+def uvicorn_options(settings: Settings) -> Dict[str, Any]:
+    """Keyword arguments for `uvicorn.run` taken from `settings`."""
+    return {
+        "host": settings.SERVER_HOST,
+        "port": settings.SERVER_PORT,
+        "workers": resolve_workers(settings.SERVER_WORKERS),
+        "loop": settings.SERVER_LOOP,
+        "http": settings.SERVER_HTTP,
+        "backlog": settings.SERVER_BACKLOG,
+        "timeout_keep_alive": settings.SERVER_KEEP_ALIVE_SECONDS,
+        "limit_max_requests": settings.SERVER_MAX_REQUESTS,
+        "limit_max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+    }
+
+
+def multi_worker_warnings(settings: Settings, workers: int) -> List[str]:
+    """Settings whose state lives in one process and splits across `workers`.
+
+    Empty with a single worker. Each worker would otherwise have its own
+    change feed (SSE clients only see the writes their worker handled), its
+    own memory cache (stale reads after writes served elsewhere) and its own
+    connections to a SQLite file, whose writers only take turns under the
+    SQLite profile.
+    """
+    if workers <= 1:
+        return []
+    warnings = []
+    if settings.CHANGE_FEED_BACKEND == "local":
+        warnings.append(
+            "CHANGE_FEED_BACKEND=local: /changes/ subscribers only see writes "
+            "handled by their own worker; use redis"
+        )
+    if settings.CACHE_BACKEND == "memory":
+        warnings.append(
+            "CACHE_BACKEND=memory: each worker caches separately and serves "
+            "stale reads after writes handled by another; use redis"
+        )
+    if is_sqlite_file(settings.DATABASE_URL) and not settings.SQLITE_PROFILE:
+        warnings.append(
+            "SQLITE_PROFILE=false: writers in different workers can fail with "
+            "'database is locked'; set SQLITE_PROFILE=true"
+        )
+    return warnings
@@ -0,0 +1,18 @@
+from fastapi import FastAPI
+
+from {{ cookiecutter.__package_slug }}.infrastructure.container import Container
+from {{ cookiecutter.__package_slug }}.infrastructure.tracing.spans import trace_engine
+from {{ cookiecutter.__package_slug }}.infrastructure.web.tracing.middleware import TracingMiddleware
+
+
+def install_tracing(app: FastAPI, container: Container) -> None:
+    """Trace requests and the SQL statements of every engine the app uses."""
+    tracer = container.tracer()
+    trace_engine(container.engine(), tracer)
+    for engine in container.replica_engines():
+        trace_engine(engine, tracer)
+    if container.settings().DATABASE_ASYNC:
+        trace_engine(container.async_engine().sync_engine, tracer)
+        for async_engine in container.async_replica_engines():
+            trace_engine(async_engine.sync_engine, tracer)
+    app.add_middleware(TracingMiddleware, tracer=tracer)
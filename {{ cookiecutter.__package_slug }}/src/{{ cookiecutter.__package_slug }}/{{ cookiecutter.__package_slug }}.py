@@ -1,37 +1,84 @@
+from functools import lru_cache
+from importlib.metadata import metadata
+from typing import Any, Tuple
+
 from fastapi import FastAPI
-from importlib.metadata import version, metadata
 
+from {{ cookiecutter.__package_slug }}.domain.shared.ids import ID_GENERATORS, set_id_generator
 from {{ cookiecutter.__package_slug }}.infrastructure.container import Container
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.changes import router as changes_router
 from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.task_lists import router as task_lists_router
 from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.tasks import router as tasks_router
+from {{ cookiecutter.__package_slug }}.infrastructure.web.health.routes import router as health_router
+from {{ cookiecutter.__package_slug }}.infrastructure.web.lifespan import lifespan
 from {{ cookiecutter.__package_slug }}.infrastructure.web.ui.routes import router as ui_router
 
 
-def create_app() -> FastAPI:
-    """FastAPI application factory with container-based initialization."""
-    container = Container()
-    container.init_database()
-
-    # Get package metadata
-    package_version = version("{{ cookiecutter.__package_slug }}")
+@lru_cache(maxsize=None)
+def package_info() -> Tuple[str, str, str]:
+    """(name, version, description) of the installed package, read once."""
     package_metadata = metadata("{{ cookiecutter.__package_slug }}")
-    package_name = package_metadata.get("Name", "{{ cookiecutter.__package_slug }}")
-    package_description = package_metadata.get(
-        "Summary", "A package for doing great things!"
+    return (
+        package_metadata.get("Name", "{{ cookiecutter.__package_slug }}"),
+        package_metadata["Version"],
+        package_metadata.get("Summary", "A package for doing great things!"),
     )
 
+
+def create_app() -> FastAPI:
+    """FastAPI application factory with container-based initialization.
+
+    Nothing here touches the database: engines connect on first use and the
+    schema is migrated by the lifespan (see `infrastructure.web.lifespan`).
+    The async, metrics and tracing stacks are imported only when enabled.
+    """
+    container = Container()
+    package_name, package_version, package_description = package_info()
+    set_id_generator(ID_GENERATORS[container.settings().ID_GENERATOR])
+
     app = FastAPI(
         title=package_name.title(),
         version=package_version,
         description=package_description,
+        lifespan=lifespan,
     )
     app.container = container  # type: ignore[attr-defined]
+    if container.settings().DATABASE_ASYNC:
+        from {{ cookiecutter.__package_slug }}.infrastructure.web.dependencies.services_async import (
+            ASYNC_DEPENDENCY_OVERRIDES,
+        )
+
+        app.dependency_overrides.update(ASYNC_DEPENDENCY_OVERRIDES)
 
     app.include_router(task_lists_router)
     app.include_router(tasks_router)
+    app.include_router(changes_router)
     app.include_router(ui_router)
+    app.include_router(health_router)
+    if container.settings().METRICS_ENABLED:
+        from {{ cookiecutter.__package_slug }}.infrastructure.web.metrics.setup import install_metrics
+
+        install_metrics(app, container)
+    # Added last so it is the outermost middleware and times the others too
+    if container.tracer() is not None:
+        from {{ cookiecutter.__package_slug }}.infrastructure.web.tracing.setup import install_tracing
+
+        install_tracing(app, container)
 
     return app
 
 
-app = create_app()
+@lru_cache(maxsize=None)
+def _default_app() -> FastAPI:
+    return create_app()
+
+
+def __getattr__(name: str) -> Any:
+    """Build `app` on first access rather than on import.
+
+    Servers should call `create_app` (`uvicorn --factory`); `app` remains for
+    `uvicorn {{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }}:app`.
+    """
+    if name == "app":
+        return _default_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
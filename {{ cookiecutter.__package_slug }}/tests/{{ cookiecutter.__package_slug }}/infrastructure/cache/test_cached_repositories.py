@@ -0,0 +1,152 @@
+import time
+from collections import Counter
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.backends import MemoryCacheBackend, RedisCacheBackend
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.task_list_repository_cached import (
+    TaskListRepositoryCached,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.cache.task_repository_cached import (
+    TaskRepositoryCached,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
+    TaskListRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+
+
+class FakeRedis:
+    """The subset of redis-py used by RedisCacheBackend."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            return None
+        return value
+
+    def set(self, key, value, px=None):
+        self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class CountingRepository:
+    """Pass-through wrapper counting the calls that reach the inner repository."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        method = getattr(self.inner, name)
+
+        def call(*args, **kwargs):
+            self.calls[name] += 1
+            return method(*args, **kwargs)
+
+        return call
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        return MemoryCacheBackend()
+    return RedisCacheBackend(FakeRedis(), prefix="test:")
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(autoflush=False, bind=engine)() as session:
+        yield session
+
+
+def test_task_reads_are_cached_and_writes_invalidate_list_pages(cache, session):
+    lists = TaskListRepositoryRds(session)
+    inbox = lists.create(TaskList(name="Inbox"))
+    other = lists.create(TaskList(name="Other"))
+    inner = CountingRepository(TaskRepositoryRds(session))
+    repo = TaskRepositoryCached(inner, cache)
+
+    t1 = repo.create(Task(task_list_id=inbox.id, title="t1"))
+    assert repo.get(t1.id) == repo.get(t1.id) == t1
+    assert inner.calls["get"] == 1
+
+    assert [t.title for t in repo.page_by_task_list(inbox.id).items] == ["t1"]
+    repo.page_by_task_list(inbox.id)
+    repo.page_by_task_list(other.id)
+    assert inner.calls["page_by_task_list"] == 2
+
+    # A write to one list evicts that list's pages only
+    repo.create(Task(task_list_id=inbox.id, title="t2"))
+    assert [t.title for t in repo.page_by_task_list(inbox.id).items] == ["t1", "t2"]
+    repo.page_by_task_list(other.id)
+    assert inner.calls["page_by_task_list"] == 3
+
+    # Moving a task evicts the pages of the old and the new list
+    moved = t1.model_copy(update={"task_list_id": other.id})
+    moved.mark_completed()
+    repo.update(moved)
+    assert repo.get(t1.id).is_completed is True
+    assert [t.title for t in repo.page_by_task_list(inbox.id).items] == ["t2"]
+    assert [t.title for t in repo.list_by_task_list(other.id)] == ["t1"]
+
+    assert repo.delete(t1.id) is True
+    assert repo.get(t1.id) is None
+    assert repo.list_by_task_list(other.id) == []
+
+
+def test_task_list_pages_are_invalidated_on_create(cache, session):
+    inner = CountingRepository(TaskListRepositoryRds(session))
+    repo = TaskListRepositoryCached(inner, cache)
+
+    repo.create(TaskList(name="a"))
+    assert [tl.name for tl in repo.page().items] == ["a"]
+    assert [tl.name for tl in repo.page().items] == ["a"]
+    assert inner.calls["page"] == 1
+
+    repo.create(TaskList(name="b"))
+    assert [tl.name for tl in repo.page().items] == ["a", "b"]
+    assert inner.calls["page"] == 2
+
+
+def test_task_list_delete_evicts_the_pages_of_its_tasks(cache, session):
+    lists = TaskListRepositoryCached(TaskListRepositoryRds(session), cache)
+    inner = CountingRepository(TaskRepositoryRds(session))
+    tasks = TaskRepositoryCached(inner, cache)
+    inbox = lists.create(TaskList(name="Inbox"))
+
+    assert tasks.page_by_task_list(inbox.id).items == []
+    assert lists.get(inbox.id) == inbox
+    assert lists.delete(inbox.id) is True
+    assert lists.get(inbox.id) is None
+    tasks.page_by_task_list(inbox.id)
+    assert inner.calls["page_by_task_list"] == 2
+
+
+def test_memory_backend_expires_and_evicts_least_recently_used():
+    cache = MemoryCacheBackend(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (b"1", None, b"3")
+
+    cache.set("ttl", b"x", ttl=0.0)
+    assert cache.get("ttl") is None
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from {{ cookiecutter.__package_slug }}.domain.services.task_list_service import TaskListService
+from {{ cookiecutter.__package_slug }}.domain.services.task_service import TaskService
+from {{ cookiecutter.__package_slug }}.infrastructure.changes.brokers import RESET, LocalChangeBroker
+from {{ cookiecutter.__package_slug }}.infrastructure.changes.publisher import TransactionalChangePublisher
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
+    TaskListRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+
+
+def setup_in_memory_db():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.messages = []
+
+    def publish(self, message):
+        self.messages.append(json.loads(message))
+
+    def subscribe(self):  # pragma: no cover - not used
+        raise NotImplementedError
+
+
+def test_changes_are_published_on_commit_and_dropped_on_rollback():
+    SessionLocal = setup_in_memory_db()
+    broker = RecordingBroker()
+    with SessionLocal() as session:
+        publisher = TransactionalChangePublisher(broker, session)
+        lists = TaskListService(TaskListRepositoryRds(session), publisher)
+        tasks = TaskService(TaskRepositoryRds(session), changes=publisher)
+
+        tl = lists.create("Inbox")
+        t1 = tasks.add(tl.id, "t1")
+        tasks.add_many([(tl.id, "t2", None)])
+        assert broker.messages == []
+        session.commit()
+        assert [m["type"] for m in broker.messages] == [
+            "task_list.created",
+            "task.created",
+            "task.created",
+        ]
+        assert broker.messages[0]["task_list"]["name"] == "Inbox"
+        assert broker.messages[1]["task"]["id"] == str(t1.id)
+
+        broker.messages.clear()
+        tasks.complete(t1.id)
+        session.rollback()
+        session.commit()
+        assert broker.messages == []
+
+        tasks.complete_all(tl.id)
+        # Already completed: no second task.completed event
+        tasks.complete(t1.id)
+        tasks.complete_many([t1.id])
+        tasks.patch(t1.id, {"title": "renamed"})
+        session.commit()
+        assert [(m["type"], m["task"]["title"]) for m in broker.messages] == [
+            ("task.completed", "t1"),
+            ("task.completed", "t2"),
+            ("task.updated", "renamed"),
+        ]
+
+
+class FailingBroker(RecordingBroker):
+    def publish(self, message):
+        if not self.messages:
+            self.messages.append(None)
+            raise ConnectionError("broker down")
+        super().publish(message)
+
+
+def test_broker_errors_after_commit_are_logged_not_raised(caplog):
+    SessionLocal = setup_in_memory_db()
+    broker = FailingBroker()
+    with SessionLocal() as session:
+        publisher = TransactionalChangePublisher(broker, session)
+        lists = TaskListService(TaskListRepositoryRds(session), publisher)
+        lists.create("A")
+        lists.create("B")
+        session.commit()
+    # The first event failed, the second still went out
+    assert [m and m["task_list"]["name"] for m in broker.messages] == [None, "B"]
+    assert "not published" in caplog.text
+
+
+def test_local_broker_delivers_across_threads_and_resets_slow_subscribers():
+    broker = LocalChangeBroker(max_pending=2)
+
+    async def scenario():
+        async with broker.subscribe() as messages:
+            assert len(broker) == 1
+            publisher = threading.Thread(target=broker.publish, args=(b"a",))
+            publisher.start()
+            publisher.join()
+            assert await asyncio.wait_for(messages.__anext__(), 1) == b"a"
+
+            for message in (b"b", b"c", b"d"):
+                broker.publish(message)
+            await asyncio.sleep(0)
+            assert await messages.__anext__() == RESET
+        assert len(broker) == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,68 @@
+from prometheus_client import values
+from prometheus_client.parser import text_string_to_metric_families
+
+from {{ cookiecutter.__package_slug }}.infrastructure.container import _create_engine_for_url
+from {{ cookiecutter.__package_slug }}.infrastructure.metrics.prometheus import AppMetrics
+from {{ cookiecutter.__package_slug }}.infrastructure.metrics.queries import RequestStats
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+
+def _pool_samples(body):
+    return {
+        (sample.name, sample.labels["engine"]): sample.value
+        for family in text_string_to_metric_families(body.decode())
+        for sample in family.samples
+        if sample.name.startswith("db_pool_")
+    }
+
+
+def _engine(tmp_path, name):
+    settings = Settings(DATABASE_POOL_SIZE=2, DATABASE_MAX_OVERFLOW=1)
+    return _create_engine_for_url(f"sqlite:///{tmp_path / name}", settings)
+
+
+def test_pool_metrics_are_read_at_scrape_time(tmp_path):
+    metrics = AppMetrics()
+    engine = _engine(tmp_path, "single.db")
+    metrics.instrument_engine("primary", engine)
+    with engine.connect():
+        samples = _pool_samples(metrics.exposition()[0])
+    assert samples[("db_pool_checked_out", "primary")] == 1
+    assert samples[("db_pool_capacity", "primary")] == 3
+    assert samples[("db_pool_checkouts_total", "primary")] == 1
+
+
+def test_pool_metrics_add_up_across_worker_processes(monkeypatch, tmp_path):
+    directory = tmp_path / "prometheus"
+    directory.mkdir()
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(directory))
+
+    # Two workers, told apart by the pid their values are filed under; the
+    # value class is picked when a labelled child is first used
+    workers = []
+    for pid in (1001, 1002):
+        worker_value = values.MultiProcessValue(lambda pid=pid: pid)
+        monkeypatch.setattr(values, "ValueClass", worker_value)
+        metrics = AppMetrics()
+        engine = _engine(tmp_path, f"{pid}.db")
+        metrics.instrument_engine("primary", engine)
+        workers.append(metrics)
+        if pid == 1001:
+            held = engine.connect()
+        for _ in range(2):
+            with engine.connect():
+                pass
+        metrics.observe_request("GET", "/", 200, 0.01, RequestStats())
+
+    first, second = workers
+    samples = _pool_samples(second.exposition()[0])
+    assert samples[("db_pool_checked_out", "primary")] == 1
+    assert samples[("db_pool_capacity", "primary")] == 6
+    assert samples[("db_pool_checkouts_total", "primary")] == 5
+
+    # Counters only grow by what was checked out since the last publish
+    held.close()
+    first.observe_request("GET", "/", 200, 0.01, RequestStats())
+    samples = _pool_samples(second.exposition()[0])
+    assert samples[("db_pool_checkouts_total", "primary")] == 5
+    assert samples[("db_pool_checked_out", "primary")] == 0
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from {{ cookiecutter.__package_slug }}.domain.services.task_list_service import TaskListService
+from {{ cookiecutter.__package_slug }}.domain.services.task_service import TaskService
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.publisher import OutboxChangePublisher
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.relay import OutboxRelay
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.sinks import InMemoryOutboxSink
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models.outbox_event import OutboxEventModel
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
+    TaskListRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+
+
+def setup_in_memory_db():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def write_changes(SessionLocal, *, commit=True):
+    with SessionLocal() as session:
+        outbox = OutboxChangePublisher(session)
+        tl = TaskListService(TaskListRepositoryRds(session), outbox).create("Inbox")
+        tasks = TaskService(TaskRepositoryRds(session), changes=outbox)
+        created = tasks.add_many([(tl.id, f"t{i}", None) for i in range(4)])
+        tasks.complete(created[0].id)
+        # Repeating it writes no second outbox row
+        tasks.complete(created[0].id)
+        if commit:
+            session.commit()
+
+
+def outbox_size(SessionLocal):
+    with SessionLocal() as session:
+        return session.scalar(select(func.count()).select_from(OutboxEventModel))
+
+
+class FlakySink(InMemoryOutboxSink):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    def send(self, messages):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("sink down")
+        super().send(messages)
+
+
+def test_events_are_written_with_the_transaction_and_relayed_in_batches():
+    SessionLocal = setup_in_memory_db()
+    write_changes(SessionLocal, commit=False)
+    assert outbox_size(SessionLocal) == 0
+
+    write_changes(SessionLocal)
+    assert outbox_size(SessionLocal) == 6
+
+    sink = InMemoryOutboxSink()
+    relay = OutboxRelay(SessionLocal, sink, batch_size=4)
+    assert [relay.relay_once() for _ in range(3)] == [4, 2, 0]
+    assert [m.type for m in sink.messages] == (
+        ["task_list.created"] + ["task.created"] * 4 + ["task.completed"]
+    )
+    assert [m.id for m in sink.messages] == sorted(m.id for m in sink.messages)
+    assert json.loads(sink.messages[1].payload)["task"]["title"] == "t0"
+    assert outbox_size(SessionLocal) == 0
+
+
+def test_failed_batches_stay_in_order_for_the_next_attempt():
+    SessionLocal = setup_in_memory_db()
+    write_changes(SessionLocal)
+    sink = FlakySink(failures=2)
+    relay = OutboxRelay(SessionLocal, sink, batch_size=10)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            relay.relay_once()
+    assert outbox_size(SessionLocal) == 6
+
+    assert relay.relay_once() == 6
+    assert [m.attempts for m in sink.messages] == [2] * 6
+    assert sink.messages[0].type == "task_list.created"
+
+
+def test_postgres_batches_skip_rows_locked_by_other_relays():
+    relay = OutboxRelay(sessionmaker(), InMemoryOutboxSink(), batch_size=50)
+    sql = str(relay.batch_query().compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
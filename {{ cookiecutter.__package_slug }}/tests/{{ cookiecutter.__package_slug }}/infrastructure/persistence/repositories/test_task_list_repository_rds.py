@@ -1,13 +1,22 @@
 from datetime import datetime, timezone
+from uuid import uuid4
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.shared.ids import set_id_generator, uuid7
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_counter_repository_rds import (
+    TaskListCounterRepositoryRds,
+)
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
     TaskListRepositoryRds,
 )
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
 
 
 def setup_in_memory_db():
@@ -50,3 +59,57 @@ def test_task_list_crud_and_pagination():
         assert repo.delete(a.id) is True
         assert repo.delete(a.id) is False
         assert repo.get(a.id) is None
+
+
+def test_task_list_summaries_count_in_one_query_with_or_without_counters():
+    engine, SessionLocal = setup_in_memory_db()
+    statements = []
+    with SessionLocal() as session:  # type: Session
+        repo = TaskListRepositoryRds(session)
+        lists = [repo.create(TaskList(name=name)) for name in "ABC"]
+        tasks = TaskRepositoryRds(session)
+        tasks.create_many(
+            [Task(task_list_id=lists[0].id, title=f"a{i}") for i in range(3)]
+            + [Task(task_list_id=lists[1].id, title="b", is_completed=True)]
+        )
+        TaskListCounterRepositoryRds(session).rebuild()
+
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        grouped = repo.page_summaries(limit=2)
+        assert len(statements) == 1
+        assert [(s.name, s.total, s.open, s.completed) for s in grouped.items] == [
+            ("A", 3, 3, 0),
+            ("B", 1, 0, 1),
+        ]
+        rest = repo.page_summaries(cursor=grouped.next_cursor, limit=2)
+        assert [(s.name, s.total) for s in rest.items] == [("C", 0)]
+        # Lists without tasks report their own creation as last activity
+        empty = rest.items[0]
+        assert empty.last_activity_at.replace(tzinfo=None) == empty.created_at
+
+        counted = TaskListRepositoryRds(session, counters=True).page_summaries(limit=3)
+        assert counted.items == grouped.items + rest.items
+
+
+def test_new_ids_are_uuid7_in_creation_order_and_stored_in_16_bytes():
+    engine, SessionLocal = setup_in_memory_db()
+    with SessionLocal() as session:  # type: Session
+        repo = TaskListRepositoryRds(session)
+        lists = [repo.create(TaskList(name=str(n))) for n in range(100)]
+        assert {tl.id.version for tl in lists} == {7}
+        assert sorted(tl.id for tl in lists) == [tl.id for tl in lists]
+        assert repo.get(lists[42].id).name == "42"
+        lengths = session.execute(text("SELECT DISTINCT length(id) FROM task_lists"))
+        assert lengths.all() == [(16,)]
+
+        set_id_generator(uuid4)
+        try:
+            legacy = repo.create(TaskList(name="v4"))
+        finally:
+            set_id_generator(uuid7)
+        assert legacy.id.version == 4
+        assert repo.get(legacy.id).name == "v4"
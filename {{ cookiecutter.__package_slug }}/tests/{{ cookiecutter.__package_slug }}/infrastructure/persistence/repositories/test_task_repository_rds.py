@@ -1,10 +1,13 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
-from sqlalchemy import create_engine
+import pytest
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
 from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import InvalidCursorError
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
 from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
     TaskListRepositoryRds,
@@ -57,3 +60,200 @@ def test_task_crud_pagination_and_post_delete_get():
         ok = repo.delete(t2.id)
         assert ok is True
         assert repo.get(t2.id) is None
+
+
+def test_task_keyset_pagination_walks_all_pages_in_order():
+    engine, SessionLocal = setup_in_memory_db()
+    with SessionLocal() as session:  # type: Session
+        task_list_repo = TaskListRepositoryRds(session)
+        repo = TaskRepositoryRds(session)
+
+        tl = task_list_repo.create(
+            TaskList(name="Inbox", created_at=datetime.now(timezone.utc))
+        )
+        base = datetime.now(timezone.utc)
+        # Two tasks share a timestamp so the id tie-breaker is exercised
+        created = [
+            repo.create(
+                Task(
+                    task_list_id=tl.id,
+                    title=f"t{i}",
+                    created_at=base + timedelta(seconds=i // 2),
+                )
+            )
+            for i in range(5)
+        ]
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = repo.page_by_task_list(tl.id, cursor=cursor, limit=2)
+            seen.extend(page.items)
+            pages += 1
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert pages == 3
+        expected = sorted(created, key=lambda t: (t.created_at, t.id))
+        assert [t.id for t in seen] == [t.id for t in expected]
+
+        with pytest.raises(InvalidCursorError):
+            repo.page_by_task_list(tl.id, cursor="not-a-cursor")
+
+
+def test_task_create_many_persists_all_rows():
+    engine, SessionLocal = setup_in_memory_db()
+    with SessionLocal() as session:  # type: Session
+        tl = TaskListRepositoryRds(session).create(
+            TaskList(name="Import", created_at=datetime.now(timezone.utc))
+        )
+        repo = TaskRepositoryRds(session)
+
+        tasks = [
+            Task(
+                task_list_id=tl.id, title=f"t{i}", created_at=datetime.now(timezone.utc)
+            )
+            for i in range(2500)
+        ]
+        created = repo.create_many(tasks)
+
+        assert [t.id for t in created] == [t.id for t in tasks]
+        assert repo.get(tasks[-1].id) is not None
+        assert len(repo.list_by_task_list(tl.id, limit=5000)) == 2500
+        assert repo.create_many([]) == []
+
+        # Referenced lists are checked in one query
+        missing = uuid4()
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        assert repo.existing_task_list_ids([tl.id, missing, tl.id]) == {tl.id}
+        assert len(statements) == 1 and statements[0].startswith("SELECT")
+        assert repo.existing_task_list_ids([]) == set()
+        assert len(statements) == 1
+
+
+def test_task_complete_and_patch_are_single_idempotent_updates():
+    engine, SessionLocal = setup_in_memory_db()
+    statements = []
+    with SessionLocal() as session:  # type: Session
+        tl = TaskListRepositoryRds(session).create(
+            TaskList(name="Inbox", created_at=datetime.now(timezone.utc))
+        )
+        repo = TaskRepositoryRds(session)
+        task = repo.create(Task(task_list_id=tl.id, title="t1"))
+        session.expunge_all()
+
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        first = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        done, changed = repo.complete(task.id, completed_at=first)
+        assert len(statements) == 1 and statements[0].startswith("UPDATE")
+        assert done.is_completed is True and changed is True
+
+        again, changed = repo.complete(task.id, completed_at=first + timedelta(days=1))
+        assert changed is False
+        assert again.completed_at == done.completed_at
+        assert again.updated_at == done.updated_at
+
+        renamed = repo.patch(task.id, {"title": "renamed"}, now=first)
+        assert (renamed.title, renamed.is_completed) == ("renamed", True)
+
+        reopened = repo.patch(task.id, {"is_completed": False}, now=first)
+        assert reopened.is_completed is False and reopened.completed_at is None
+        assert repo.get(task.id).completed_at is None
+
+        missing = Task(task_list_id=tl.id, title="x").id
+        assert repo.complete(missing, completed_at=first) is None
+
+
+def test_task_complete_many_and_by_task_list_use_set_based_updates():
+    engine, SessionLocal = setup_in_memory_db()
+    statements = []
+    with SessionLocal() as session:  # type: Session
+        lists = TaskListRepositoryRds(session)
+        inbox = lists.create(TaskList(name="Inbox"))
+        other = lists.create(TaskList(name="Other"))
+        repo = TaskRepositoryRds(session)
+        tasks = repo.create_many(
+            [Task(task_list_id=inbox.id, title=f"t{i}") for i in range(5)]
+            + [Task(task_list_id=other.id, title="o")]
+        )
+
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        now = datetime.now(timezone.utc)
+        missing = Task(task_list_id=inbox.id, title="x").id
+        ids = [tasks[0].id, tasks[1].id, missing]
+        done = repo.complete_many(ids, completed_at=now)
+        assert {r.task.id for r in done} == {tasks[0].id, tasks[1].id}
+        assert all(r.changed and r.task.completed_at for r in done)
+        # One UPDATE, then one SELECT for the id it did not match
+        assert len(statements) == 2
+
+        again = repo.complete_many(ids[:2], completed_at=now)
+        assert {(r.task.id, r.changed) for r in again} == {
+            (tasks[0].id, False),
+            (tasks[1].id, False),
+        }
+        assert len(statements) == 4
+
+        rest = repo.complete_by_task_list(inbox.id, completed_at=now)
+        assert {t.id for t in rest} == {t.id for t in tasks[2:5]}
+        assert repo.complete_by_task_list(inbox.id, completed_at=now) == []
+        assert len(statements) == 6
+        assert repo.get(tasks[5].id).is_completed is False
+
+
+def test_task_summaries_select_only_listed_columns_and_page_like_tasks():
+    engine, SessionLocal = setup_in_memory_db()
+    statements = []
+    with SessionLocal() as session:  # type: Session
+        tl = TaskListRepositoryRds(session).create(TaskList(name="Inbox"))
+        repo = TaskRepositoryRds(session)
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        repo.create_many(
+            [
+                Task(
+                    task_list_id=tl.id,
+                    title=f"t{i}",
+                    description="long " * 100,
+                    created_at=base + timedelta(seconds=i),
+                )
+                for i in range(5)
+            ]
+        )
+        session.expunge_all()
+
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        first = repo.page_summaries_by_task_list(tl.id, limit=3)
+        second = repo.page_summaries_by_task_list(
+            tl.id, cursor=first.next_cursor, limit=3
+        )
+        summaries = repo.list_summaries_by_task_list(tl.id, offset=1, limit=2)
+
+        assert [s.title for s in first.items + second.items] == [
+            f"t{i}" for i in range(5)
+        ]
+        assert second.next_cursor is None
+        assert first.items[0][1:] == (tl.id, "t0", False)
+        assert [s.title for s in summaries] == ["t1", "t2"]
+        assert all("description" not in s for s in statements)
+        assert all("updated_at" not in s for s in statements)
+        # No ORM instances were loaded for the projection
+        assert len(session.identity_map) == 0
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.domain.shared.pagination import InvalidCursorError
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_list_repository_rds import (
+    TaskListRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.schema import upgrade_database
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.search.factory import (
+    SEARCH_BACKENDS,
+    detect_search_backend,
+)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    upgrade_database(engine)
+    assert detect_search_backend(engine) == "sqlite_fts"
+    with sessionmaker(bind=engine)() as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.mark.parametrize("backend", ["like", "sqlite_fts"])
+def test_search_follows_writes_and_pages(session, backend):
+    repo = TaskRepositoryRds(session, search_index=SEARCH_BACKENDS[backend](session))
+    tl = TaskListRepositoryRds(session).create(TaskList(name="Inbox"))
+    milk = repo.create(Task(task_list_id=tl.id, title="Buy milk"))
+    repo.create_many(
+        [
+            Task(task_list_id=tl.id, title="Groceries", description="milk and eggs"),
+            Task(task_list_id=tl.id, title="Call Bob"),
+        ]
+    )
+
+    def titles(query, **kwargs):
+        return [t.title for t in repo.search(query, **kwargs).items]
+
+    assert sorted(titles("milk")) == ["Buy milk", "Groceries"]
+    assert titles("MILK eggs") == ["Groceries"]
+    assert titles("%") == [] and titles("nothing") == []
+
+    first = repo.search("milk", limit=1)
+    rest = repo.search("milk", cursor=first.next_cursor, limit=1)
+    assert len(first.items) == 1 and rest.next_cursor is None
+    assert {first.items[0].title, rest.items[0].title} == {"Buy milk", "Groceries"}
+    with pytest.raises(InvalidCursorError):
+        repo.search("milk", cursor="garbage")
+
+    repo.patch(milk.id, {"title": "Buy bread"}, now=milk.created_at)
+    assert titles("bread") == ["Buy bread"]
+    assert titles("milk") == ["Groceries"]
+    repo.delete(milk.id)
+    assert titles("bread") == []
+
+
+def test_fts_ranks_title_matches_first(session):
+    index = SEARCH_BACKENDS["sqlite_fts"](session)
+    repo = TaskRepositoryRds(session, search_index=index)
+    tl = TaskListRepositoryRds(session).create(TaskList(name="Inbox"))
+    repo.create(Task(task_list_id=tl.id, title="Chores", description="report"))
+    repo.create(Task(task_list_id=tl.id, title="Write report"))
+
+    assert [t.title for t in repo.search("report").items] == ["Write report", "Chores"]
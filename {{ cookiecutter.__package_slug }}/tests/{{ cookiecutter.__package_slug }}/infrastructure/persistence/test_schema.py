@@ -0,0 +1,94 @@
+from uuid import uuid4
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.database import Base
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.models import (  # noqa: F401
+    outbox_event,
+    task,
+    task_list,
+    task_list_counter,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.schema import (
+    alembic_config,
+    include_object,
+    upgrade_database,
+)
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.repositories.task_repository_rds import (
+    TaskRepositoryRds,
+)
+
+
+def test_migrations_match_orm_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    upgrade_database(engine)
+    # Running again on an up-to-date database is a no-op
+    upgrade_database(engine)
+
+    with engine.connect() as connection:
+        # The search index is created with raw SQL and not mapped
+        context = MigrationContext.configure(
+            connection, opts={"include_object": include_object}
+        )
+        diff = compare_metadata(context, Base.metadata)
+    assert diff == []
+
+
+def test_unversioned_database_is_stamped_and_upgraded(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    # Simulate a database created by create_all with the baseline schema
+    upgrade_database(engine, "0001")
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE alembic_version"))
+
+    upgrade_database(engine)
+
+    index_names = {ix["name"] for ix in inspect(engine).get_indexes("tasks")}
+    assert "ix_tasks_task_list_id_created_at_id" in index_names
+    columns = {c["name"] for c in inspect(engine).get_columns("tasks")}
+    assert "updated_at" in columns
+
+
+def test_hex_uuids_are_converted_to_blobs_and_back(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'hex.db'}")
+    upgrade_database(engine, "0006")
+    list_id, task_id = uuid4(), uuid4()
+    with engine.begin() as connection:
+        # Rows as written before 0007: 32 hex characters
+        connection.execute(
+            text(
+                "INSERT INTO task_lists (id, name, created_at) "
+                "VALUES (:id, 'list', '2024-01-01 00:00:00')"
+            ),
+            {"id": list_id.hex},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO tasks "
+                "(id, task_list_id, title, is_completed, created_at) "
+                "VALUES (:id, :list_id, 'task', 0, '2024-01-01 00:00:00')"
+            ),
+            {"id": task_id.hex, "list_id": list_id.hex},
+        )
+
+    upgrade_database(engine)
+    with engine.connect() as connection:
+        stored = connection.execute(text("SELECT id, task_list_id FROM tasks")).one()
+    assert stored == (task_id.bytes, list_id.bytes)
+    with Session(engine) as session:
+        task = TaskRepositoryRds(session).get(task_id)
+        assert task.task_list_id == list_id
+        listed = TaskRepositoryRds(session).list_by_task_list(list_id)
+        assert [t.id for t in listed] == [task_id]
+
+    config = alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.downgrade(config, "0006")
+    with engine.connect() as connection:
+        stored = connection.execute(text("SELECT id, task_list_id FROM tasks")).one()
+    assert stored == (task_id.hex, list_id.hex)
@@ -0,0 +1,95 @@
+import threading
+
+from sqlalchemy import text
+
+from {{ cookiecutter.__package_slug }}.infrastructure.container import _create_engine_for_url, _engine_options
+from {{ cookiecutter.__package_slug }}.infrastructure.persistence.pool import InstrumentedQueuePool, pool_status
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+
+
+def test_engine_options_use_dialect_defaults_and_settings_overrides():
+    options = _engine_options("postgresql+psycopg://u:p@db/app", Settings())
+    assert options["pool_size"] == 10
+    assert options["pool_pre_ping"] is True
+    assert options["pool_recycle"] == 1800
+    assert options["connect_args"]["options"] == "-c statement_timeout=30000"
+
+    settings = Settings(DATABASE_POOL_SIZE=3, DATABASE_STATEMENT_TIMEOUT_MS=500)
+    options = _engine_options("postgresql+psycopg://u:p@db/app", settings)
+    assert options["pool_size"] == 3
+    assert options["connect_args"]["options"] == "-c statement_timeout=500"
+
+    # In-memory SQLite keeps its single-connection pool
+    assert _engine_options("sqlite://", Settings()) == {
+        "connect_args": {"check_same_thread": False}
+    }
+
+
+def test_pool_status_reports_checkouts_and_saturation(tmp_path):
+    # Without the SQLite profile the file gets the usual pool
+    settings = Settings(DATABASE_POOL_SIZE=2, DATABASE_MAX_OVERFLOW=0)
+    engine = _create_engine_for_url(f"sqlite:///{tmp_path / 'pool.db'}", settings)
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        busy = pool_status(engine)
+    assert busy["capacity"] == 2
+    assert busy["checked_out"] == 1
+    assert busy["saturation"] == 0.5
+
+    engine.dispose()
+    idle = pool_status(engine)
+    assert idle["checkouts"] == 1
+    assert idle["checked_out"] == 0
+
+
+def test_sqlite_profile_sets_pragmas_and_serializes_writers(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    settings = Settings(SQLITE_PROFILE=True)
+    writer = _create_engine_for_url(url, settings)
+    reader = _create_engine_for_url(url, settings, read_only=True)
+    assert pool_status(writer)["capacity"] == 1
+
+    with reader.connect() as connection:
+        pragmas = {
+            name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size")
+        }
+        assert connection.exec_driver_sql("PRAGMA query_only").scalar() == 1
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "busy_timeout": 5000,
+        "cache_size": -64 * 1024,
+    }
+
+    with writer.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE counter (n INTEGER)")
+        connection.exec_driver_sql("INSERT INTO counter VALUES (0)")
+
+    # Each engine stands for a worker process with its own writer connection.
+    # All read before writing; deferred transactions would fail the upgrade
+    # with "database is locked", BEGIN IMMEDIATE makes them take turns.
+    writers = [_create_engine_for_url(url, settings) for _ in range(4)]
+    barrier = threading.Barrier(len(writers))
+
+    def increment(engine):
+        with engine.begin() as connection:
+            n = connection.exec_driver_sql("SELECT n FROM counter").scalar()
+            try:
+                barrier.wait(timeout=0.5)
+            except threading.BrokenBarrierError:
+                pass  # the others are queued behind this transaction
+            connection.exec_driver_sql("UPDATE counter SET n = ?", (n + 1,))
+
+    threads = [threading.Thread(target=increment, args=(e,)) for e in writers]
+    for thread in threads:
+        thread.start()
+    # WAL: readers are not blocked by the writers
+    with reader.connect() as connection:
+        assert connection.exec_driver_sql("SELECT n FROM counter").scalar() >= 0
+    for thread in threads:
+        thread.join()
+    with reader.connect() as connection:
+        assert connection.exec_driver_sql("SELECT n FROM counter").scalar() == 4
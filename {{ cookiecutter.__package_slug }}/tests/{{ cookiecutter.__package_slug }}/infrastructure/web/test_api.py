@@ -1,33 +1,657 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+from dependency_injector import providers
 from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 
+from {{ cookiecutter.__package_slug }}.domain.entities.task import Task
+from {{ cookiecutter.__package_slug }}.domain.entities.task_list import TaskList
+from {{ cookiecutter.__package_slug }}.infrastructure.changes.brokers import LocalChangeBroker
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.relay import OutboxRelay
+from {{ cookiecutter.__package_slug }}.infrastructure.outbox.sinks import InMemoryOutboxSink
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.changes import stream as stream_changes
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_list_out import TaskListOut
+from {{ cookiecutter.__package_slug }}.infrastructure.web.api.v1.schemas.task_out import TaskOut
 from {{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }} import create_app
 
 
 def test_task_list_and_tasks_endpoints():
     app = create_app()
-    client = TestClient(app)
+    with TestClient(app) as client:
+        # create list
+        r = client.post("/task-lists/", json={"name": "Inbox"})
+        assert r.status_code == 200
+        tl = r.json()
+
+        # list lists
+        r = client.get("/task-lists/")
+        assert r.status_code == 200
+        assert any(x["name"] == "Inbox" for x in r.json())
+
+        # create task
+        r = client.post("/tasks/", json={"task_list_id": tl["id"], "title": "t1"})
+        assert r.status_code == 200
+        t = r.json()
+
+        # list by list
+        r = client.get(f"/tasks/by-list/{tl['id']}")
+        assert r.status_code == 200
+        assert len(r.json()) >= 1
+
+        # complete
+        r = client.post(f"/tasks/{t['id']}/complete")
+        assert r.status_code == 200
+        assert r.json()["is_completed"] is True
+
+        # browser UI
+        assert client.get("/").status_code == 200
+
+
+def test_list_endpoints_follow_next_cursor():
+    app = create_app()
+    with TestClient(app) as client:
+        tl = client.post("/task-lists/", json={"name": "Paged"}).json()
+        for i in range(3):
+            client.post("/tasks/", json={"task_list_id": tl["id"], "title": f"t{i}"})
+
+        r = client.get(f"/tasks/by-list/{tl['id']}", params={"limit": 2})
+        assert r.status_code == 200
+        assert len(r.json()) == 2
+        cursor = r.headers["X-Next-Cursor"]
+
+        r = client.get(
+            f"/tasks/by-list/{tl['id']}", params={"limit": 2, "cursor": cursor}
+        )
+        assert r.status_code == 200
+        assert [x["title"] for x in r.json()] == ["t2"]
+        assert "X-Next-Cursor" not in r.headers
+
+        r = client.get("/task-lists/", params={"cursor": "garbage"})
+        assert r.status_code == 400
+
+
+def test_bulk_create_reports_per_item_results():
+    app = create_app()
+    with TestClient(app) as client:
+        tl = client.post("/task-lists/", json={"name": "Bulk"}).json()
+        missing = "00000000-0000-0000-0000-000000000000"
+        items = [
+            {"task_list_id": tl["id"], "title": "a"},
+            {"task_list_id": tl["id"], "title": ""},
+            {"task_list_id": missing, "title": "b"},
+            {"task_list_id": tl["id"], "title": "c", "description": "d"},
+        ]
+        r = client.post("/tasks/bulk", json={"items": items})
+        assert r.status_code == 200
+        body = r.json()
+        assert body["created"] == 2 and body["failed"] == 2
+        assert [x["index"] for x in body["results"]] == [0, 1, 2, 3]
+        assert body["results"][1]["task"] is None
+        assert body["results"][1]["errors"][0]["loc"] == ["title"]
+        assert body["results"][2]["task"] is None
+        assert body["results"][2]["errors"] == [
+            {"type": "not_found", "loc": ["task_list_id"], "msg": "Task list not found"}
+        ]
+        assert body["results"][3]["task"]["title"] == "c"
+
+        r = client.post("/tasks/bulk", json={"items": items[2:3]})
+        assert r.json()["created"] == 0 and r.json()["failed"] == 1
+
+        r = client.get(f"/tasks/by-list/{tl['id']}")
+        assert [x["title"] for x in r.json()] == ["a", "c"]
+
+
+def test_async_stack_serves_the_same_endpoints(monkeypatch, tmp_path):
+    monkeypatch.setenv("{{ cookiecutter.__package_slug | upper }}_DATABASE_URL", f"sqlite:///{tmp_path / 'async.db'}")
+    monkeypatch.setenv("{{ cookiecutter.__package_slug | upper }}_DATABASE_ASYNC", "true")
+    app = create_app()
+    with TestClient(app) as client:
+        tl = client.post("/task-lists/", json={"name": "Async"}).json()
+        t = client.post(
+            "/tasks/", json={"task_list_id": tl["id"], "title": "t1"}
+        ).json()
+
+        r = client.post(f"/tasks/{t['id']}/complete")
+        assert r.status_code == 200
+        assert r.json()["is_completed"] is True
+
+        r = client.get(f"/tasks/by-list/{tl['id']}")
+        assert [x["title"] for x in r.json()] == ["t1"]
+        assert app.container.async_engine().dialect.driver == "aiosqlite"
+
+
+def test_health_reports_database_and_pool():
+    app = create_app()
+    with TestClient(app) as client:
+        r = client.get("/health")
+        assert r.status_code == 200
+        body = r.json()
+        assert body["status"] == "ok"
+        assert body["database"] == "ok"
+        assert body["pool"]["pool"] == "InstrumentedQueuePool"
+        assert body["pool"]["checkouts"] >= 1
+
+
+def test_reads_use_replicas_until_the_client_writes(monkeypatch, tmp_path):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    replicas = []
+    for name in ("replica-1", "replica-2"):
+        url = f"sqlite:///{tmp_path / name}.db"
+        monkeypatch.setenv(prefix + "DATABASE_URL", url)
+        with TestClient(create_app()) as client:
+            client.post("/task-lists/", json={"name": name})
+        replicas.append(url)
+
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setenv(prefix + "READ_REPLICA_URLS", ",".join(replicas))
+    app = create_app()
+    with TestClient(app) as client:
+
+        def names():
+            return [x["name"] for x in client.get("/task-lists/").json()]
+
+        assert [names(), names(), names()] == [
+            ["replica-1"],
+            ["replica-2"],
+            ["replica-1"],
+        ]
+
+        client.post("/task-lists/", json={"name": "primary"})
+        assert names() == ["primary"]
+        client.cookies.clear()
+        assert names() == ["replica-2"]
+
+        session = app.container.session_router().for_read()()
+        with pytest.raises(OperationalError):
+            session.execute(text("DELETE FROM task_lists"))
+        session.close()
+
+
+def test_cached_reads_see_writes(monkeypatch, tmp_path):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'cache.db'}")
+    monkeypatch.setenv(prefix + "CACHE_BACKEND", "memory")
+    with TestClient(create_app()) as client:
+        tl = client.post("/task-lists/", json={"name": "Cached"}).json()
+        t = client.post(
+            "/tasks/", json={"task_list_id": tl["id"], "title": "t1"}
+        ).json()
+        r = client.get(f"/tasks/by-list/{tl['id']}")
+        assert [x["is_completed"] for x in r.json()] == [False]
+
+        client.post(f"/tasks/{t['id']}/complete")
+        client.post("/tasks/", json={"task_list_id": tl["id"], "title": "t2"})
+        r = client.get(f"/tasks/by-list/{tl['id']}")
+        assert [(x["title"], x["is_completed"]) for x in r.json()] == [
+            ("t1", True),
+            ("t2", False),
+        ]
+
+
+@pytest.mark.parametrize("counters", [False, True])
+def test_task_list_summary_counts_tasks(monkeypatch, tmp_path, counters):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'sum.db'}")
+    monkeypatch.setenv(prefix + "TASK_LIST_COUNTERS", str(counters).lower())
+    with TestClient(create_app()) as client:
+        a = client.post("/task-lists/", json={"name": "A"}).json()
+        b = client.post("/task-lists/", json={"name": "B"}).json()
+        client.post("/task-lists/", json={"name": "Empty"})
+        t1 = client.post("/tasks/", json={"task_list_id": a["id"], "title": "1"}).json()
+        items = [{"task_list_id": a["id"], "title": str(i)} for i in range(2, 5)]
+        items.append({"task_list_id": b["id"], "title": "b1"})
+        results = client.post("/tasks/bulk", json={"items": items}).json()["results"]
+        t2, t3, t4 = [x["task"] for x in results[:3]]
+
+        client.post(f"/tasks/{t1['id']}/complete")
+        client.post(f"/tasks/{t1['id']}/complete")
+        client.post("/tasks/complete", json={"task_ids": [t1["id"], t2["id"]]})
+        client.patch(f"/tasks/{t3['id']}", json={"task_list_id": b["id"]})
+        client.post(f"/task-lists/{b['id']}/complete-all")
+        client.patch(f"/tasks/{t4['id']}", json={"title": "renamed"})
+        # Reopen and move a completed task, and repeat the reopen
+        client.patch(f"/tasks/{t2['id']}", json={"is_completed": False})
+        client.patch(f"/tasks/{t2['id']}", json={"is_completed": False})
+        client.patch(f"/tasks/{t3['id']}", json={"task_list_id": a["id"]})
+
+        r = client.get("/task-lists/summary", params={"limit": 2})
+        assert r.status_code == 200
+        rows = r.json()
+        assert [(x["name"], x["total"], x["open"], x["completed"]) for x in rows] == [
+            ("A", 4, 2, 2),
+            ("B", 1, 0, 1),
+        ]
+        assert all(x["last_activity_at"] for x in rows)
+
+        r = client.get(
+            "/task-lists/summary", params={"cursor": r.headers["X-Next-Cursor"]}
+        )
+        assert [(x["name"], x["total"], x["open"]) for x in r.json()] == [
+            ("Empty", 0, 0)
+        ]
+        r = client.get("/task-lists/summary", params={"cursor": "x"})
+        assert r.status_code == 400
+
+
+def test_search_tasks(monkeypatch, tmp_path):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'q.db'}")
+    with TestClient(create_app()) as client:
+        tl = client.post("/task-lists/", json={"name": "Search"}).json()
+        for title in ["Buy milk", "Milk the cow", "Walk"]:
+            client.post("/tasks/", json={"task_list_id": tl["id"], "title": title})
+
+        r = client.get("/tasks/search", params={"q": "milk", "limit": 1})
+        assert r.status_code == 200
+        assert len(r.json()) == 1
+        r = client.get(
+            "/tasks/search", params={"q": "milk", "cursor": r.headers["X-Next-Cursor"]}
+        )
+        assert len(r.json()) == 1 and "X-Next-Cursor" not in r.headers
+        assert client.get("/tasks/search", params={"q": ""}).status_code == 422
+        r = client.get("/tasks/search", params={"q": "milk", "cursor": "x"})
+        assert r.status_code == 400
+
+
+def test_change_feed_pushes_committed_writes():
+    app = create_app()
+    with TestClient(app) as client:
+
+        def write():
+            tl = client.post("/task-lists/", json={"name": "Live"}).json()
+            t = client.post("/tasks/", json={"task_list_id": tl["id"], "title": "t"})
+            client.post(f"/tasks/{t.json()['id']}/complete")
+            # Rejected, so nothing is committed nor published
+            client.post("/tasks/", json={"task_list_id": tl["id"], "title": ""})
+
+        async def read(count):
+            # The endpoint's generator, driven directly: TestClient only returns
+            # once a response ends, which a change feed never does on its own
+            events = stream_changes(SimpleNamespace(app=app))
+            try:
+                subscribed = await events.__anext__()
+                assert subscribed.comment == "subscribed"
+                await asyncio.to_thread(write)
+                return [
+                    json.loads((await events.__anext__()).raw_data)
+                    for _ in range(count)
+                ]
+            finally:
+                await events.aclose()
+
+        changes = asyncio.run(read(3))
+        assert [c["type"] for c in changes] == [
+            "task_list.created",
+            "task.created",
+            "task.completed",
+        ]
+        assert changes[2]["task"]["is_completed"] is True
+        assert len(app.container.change_broker()) == 0
+
+        r = client.get("/openapi.json")
+        assert "text/event-stream" in json.dumps(r.json()["paths"]["/changes/"])
+
+
+def test_outbox_records_committed_writes(monkeypatch, tmp_path):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'o.db'}")
+    monkeypatch.setenv(prefix + "OUTBOX_ENABLED", "true")
+    app = create_app()
+    with TestClient(app) as client:
+        tl = client.post("/task-lists/", json={"name": "Outbox"}).json()
+        client.post("/tasks/", json={"task_list_id": tl["id"], "title": "t"})
+        client.post("/tasks/", json={"task_list_id": tl["id"], "title": ""})
+
+        sink = InMemoryOutboxSink()
+        relay = OutboxRelay(app.container.session_factory(), sink)
+        assert relay.relay_once() == 2
+        assert [m.type for m in sink.messages] == ["task_list.created", "task.created"]
+
+
+class RecordingChangeBroker(LocalChangeBroker):
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    def publish(self, message):
+        self.published.append(json.loads(message))
+        super().publish(message)
+
+
+def test_outbox_relay_is_the_only_publisher_with_the_changes_sink(
+    monkeypatch, tmp_path
+):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'oc.db'}")
+    monkeypatch.setenv(prefix + "OUTBOX_ENABLED", "true")
+    monkeypatch.setenv(prefix + "OUTBOX_SINK", "changes")
+    app = create_app()
+    broker = RecordingChangeBroker()
+    app.container.change_broker.override(providers.Object(broker))
+    with TestClient(app) as client:
+        client.post("/task-lists/", json={"name": "Once"})
+        assert broker.published == []
+
+        relay = app.container.outbox_relay()
+        assert relay.relay_once() == 1
+        assert relay.relay_once() == 0
+        assert [c["type"] for c in broker.published] == ["task_list.created"]
+
+
+def _sample(body, name, **labels):
+    """Value of one sample in a Prometheus text exposition."""
+    selector = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    prefix = name + ("{" + selector + "} " if labels else " ")
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+    raise AssertionError(f"{prefix!r} not in metrics")
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_metrics_count_requests_and_their_queries(
+    monkeypatch, tmp_path, caplog, use_async
+):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'm.db'}")
+    monkeypatch.setenv(prefix + "DATABASE_ASYNC", str(use_async).lower())
+    monkeypatch.setenv(prefix + "METRICS_QUERY_BUDGET", "3")
+    with TestClient(create_app()) as client:
+        tl = client.post("/task-lists/", json={"name": "Metrics"}).json()
+        items = [{"task_list_id": tl["id"], "title": f"t{i}"} for i in range(3)]
+        with caplog.at_level(logging.WARNING):
+            client.post("/tasks/bulk", json={"items": items})
+        for task in client.get(f"/tasks/by-list/{tl['id']}").json():
+            client.post(f"/tasks/{task['id']}/complete")
+        client.get(f"/tasks/by-list/{tl['id']}")
+
+        r = client.get("/metrics")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/plain")
+        body = r.text
+        by_list = {"method": "GET", "route": "/tasks/by-list/{task_list_id}"}
+        assert _sample(body, "http_requests_total", status="200", **by_list) == 2
+        assert _sample(body, "http_request_duration_seconds_count", **by_list) == 2
+        assert _sample(body, "db_queries_per_request_sum", **by_list) >= 2
+        complete = {"method": "POST", "route": "/tasks/{task_id}/complete"}
+        assert _sample(body, "db_queries_per_request_count", **complete) == 3
+        assert _sample(body, "db_query_duration_seconds_count", operation="UPDATE") >= 3
+        assert _sample(body, "db_commit_duration_seconds_count") == 7
+        assert _sample(body, "http_requests_in_progress", method="GET") == 1
+        engine = "async-primary" if use_async else "primary"
+        assert _sample(body, "db_pool_checkouts_total", engine=engine) >= 1
+        assert 'route="unmatched"' not in body
+
+        # Bulk create and its search index refresh exceed a budget of 3
+        bulk = {"method": "POST", "route": "/tasks/bulk"}
+        assert _sample(body, "db_query_budget_exceeded_total", **bulk) == 1
+        exceeded = [
+            x for x in body.splitlines() if x.startswith("db_query_budget_exceeded_t")
+        ]
+        assert len(exceeded) == 1
+        assert any("POST /tasks/bulk ran" in r.getMessage() for r in caplog.records)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_include_tasks_reads_any_page_of_lists_in_two_queries(
+    monkeypatch, tmp_path, use_async
+):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'inc.db'}")
+    monkeypatch.setenv(prefix + "DATABASE_ASYNC", str(use_async).lower())
+    with TestClient(create_app()) as client:
+        # List n holds n tasks
+        lists = []
+        for n in range(6):
+            tl = client.post("/task-lists/", json={"name": f"L{n}"}).json()
+            items = [{"task_list_id": tl["id"], "title": f"L{n}-{i}"} for i in range(n)]
+            if items:
+                client.post("/tasks/bulk", json={"items": items})
+            lists.append(tl)
+
+        route = {"method": "GET", "route": "/task-lists/"}
+        queries = []
+        total = 0.0
+        for limit in (1, 3, 6):
+            params = {"include": "tasks", "limit": limit, "tasks_limit": 2}
+            r = client.get("/task-lists/", params=params)
+            assert r.status_code == 200 and len(r.json()) == limit
+            body = client.get("/metrics").text
+            seen = _sample(body, "db_queries_per_request_sum", **route)
+            queries.append(seen - total)
+            total = seen
+        # The page of lists, then the first tasks of all of them
+        assert queries == [2, 2, 2]
+
+        page = r.json()
+        assert [len(x["tasks"]) for x in page] == [0, 1, 2, 2, 2, 2]
+        assert [x["has_more_tasks"] for x in page] == [False] * 3 + [True] * 3
+        assert [t["title"] for t in page[3]["tasks"]] == ["L3-0", "L3-1"]
+        assert all(t["task_list_id"] == page[3]["id"] for t in page[3]["tasks"])
+
+        r = client.get("/task-lists/", params={"include": "tasks", "limit": 4})
+        rest = client.get(
+            "/task-lists/",
+            params={"include": "tasks", "cursor": r.headers["X-Next-Cursor"]},
+        ).json()
+        assert [len(x["tasks"]) for x in rest] == [4, 5]
+        r = client.get("/task-lists/", params={"include": "tasks", "offset": 2})
+        assert r.status_code == 400
+
+        r = client.get(
+            f"/task-lists/{lists[5]['id']}",
+            params={"include": "tasks", "tasks_limit": 3},
+        )
+        assert r.status_code == 200
+        one = r.json()
+        assert [t["title"] for t in one["tasks"]] == ["L5-0", "L5-1", "L5-2"]
+        assert one["has_more_tasks"] is True
+        assert client.get(f"/task-lists/{lists[5]['id']}").json() == {
+            "id": lists[5]["id"],
+            "name": "L5",
+        }
+        missing = "00000000-0000-0000-0000-000000000000"
+        assert client.get(f"/task-lists/{missing}").status_code == 404
+        r = client.get(f"/task-lists/{missing}", params={"include": "tasks"})
+        assert r.status_code == 404
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_tracing_spans_nest_from_request_to_sql(monkeypatch, tmp_path, use_async):
+    pytest.importorskip("opentelemetry.sdk")
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    trace_file = tmp_path / "spans.jsonl"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 't.db'}")
+    monkeypatch.setenv(prefix + "DATABASE_ASYNC", str(use_async).lower())
+    monkeypatch.setenv(prefix + "TRACING_EXPORTER", "file")
+    monkeypatch.setenv(prefix + "TRACING_FILE", str(trace_file))
+    app = create_app()
+    with TestClient(app) as client:
+        tl = client.post("/task-lists/", json={"name": "Traced"}).json()
+        t = client.post("/tasks/", json={"task_list_id": tl["id"], "title": "t"}).json()
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        traceparent = f"00-{trace_id}-00f067aa0ba902b7-01"
+        headers = {"traceparent": traceparent}
+        r = client.post(f"/tasks/{t['id']}/complete", headers=headers)
+        assert r.status_code == 200
+        app.container.tracer_provider().force_flush()
+
+        spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+        spans = [s for s in spans if s["context"]["trace_id"] == "0x" + trace_id]
+        by_id = {s["context"]["span_id"]: s for s in spans}
+
+        def chain(span):
+            names = []
+            while span is not None:
+                names.append(span["name"])
+                span = by_id.get(span["parent_id"])
+            return names[::-1]
+
+        server = chain(next(s for s in spans if s["kind"] == "SpanKind.SERVER"))
+        assert server == ["POST /tasks/{task_id}/complete"]
+        build = ["POST /tasks/{task_id}/complete", "build TaskUseCases"]
+        assert build in map(chain, spans)
+        update = next(s for s in spans if s["name"] == "UPDATE")
+        assert "UPDATE tasks" in update["attributes"]["db.statement"]
+        assert chain(update) == [
+            "POST /tasks/{task_id}/complete",
+            "TaskUseCases.complete",
+            "TaskService.complete",
+            "TaskRepositoryRds.complete",
+            "UPDATE",
+        ]
+        assert update["attributes"]["db.system"] == "sqlite"
+        commit = next(s for s in spans if s["name"] == "COMMIT")
+        assert chain(commit) == ["POST /tasks/{task_id}/complete", "COMMIT"]
+
+
+def test_tracing_is_off_by_default():
+    app = create_app()
+    assert app.container.tracer() is None
+    assert not any(m.cls.__name__ == "TracingMiddleware" for m in app.user_middleware)
+
+
+def test_list_endpoints_answer_304_while_unchanged():
+    with TestClient(create_app()) as client:
+        tl = client.post("/task-lists/", json={"name": "Etag"}).json()
+        t = client.post(
+            "/tasks/", json={"task_list_id": tl["id"], "title": "t1"}
+        ).json()
+        url = f"/tasks/by-list/{tl['id']}"
+
+        r = client.get(url)
+        etag = r.headers["ETag"]
+        assert r.headers["Last-Modified"].endswith("GMT")
+
+        r = client.get(url, headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.content == b""
+        assert r.headers["ETag"] == etag
+
+        # Another page of the same list has its own validator
+        assert client.get(url, params={"limit": 1}).headers["ETag"] != etag
+
+        client.post(f"/tasks/{t['id']}/complete")
+        r = client.get(url, headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert r.json()[0]["is_completed"] is True
+        etag = r.headers["ETag"]
+
+        client.post("/tasks/", json={"task_list_id": tl["id"], "title": "t2"})
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+        lists_etag = client.get("/task-lists/").headers["ETag"]
+        r = client.get("/task-lists/", headers={"If-None-Match": lists_etag})
+        assert r.status_code == 304
+        client.post("/task-lists/", json={"name": "Another"})
+        r = client.get("/task-lists/", headers={"If-None-Match": lists_etag})
+        assert r.status_code == 200
+
+
+def test_patch_task_and_complete_missing_task():
+    with TestClient(create_app()) as client:
+        tl = client.post("/task-lists/", json={"name": "Patch"}).json()
+        t = client.post(
+            "/tasks/", json={"task_list_id": tl["id"], "title": "t1"}
+        ).json()
+        url = f"/tasks/by-list/{tl['id']}"
+        etag = client.get(url).headers["ETag"]
+
+        r = client.patch(f"/tasks/{t['id']}", json={"title": "renamed"})
+        assert r.status_code == 200
+        assert (r.json()["title"], r.json()["is_completed"]) == ("renamed", False)
+        # A rename moves updated_at, so cached copies are invalidated
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+        r = client.patch(f"/tasks/{t['id']}", json={"is_completed": True})
+        assert r.json()["is_completed"] is True
+        assert client.post(f"/tasks/{t['id']}/complete").json()["is_completed"] is True
+
+        r = client.patch(f"/tasks/{t['id']}", json={"title": None})
+        assert r.status_code == 422
+        missing = "00000000-0000-0000-0000-000000000000"
+        assert client.post(f"/tasks/{missing}/complete").status_code == 404
+        assert client.patch(f"/tasks/{missing}", json={"title": "x"}).status_code == 404
+
+
+def test_complete_many_and_complete_all():
+    with TestClient(create_app()) as client:
+        tl = client.post("/task-lists/", json={"name": "Batch"}).json()
+        ids = []
+        for i in range(4):
+            payload = {"task_list_id": tl["id"], "title": f"t{i}"}
+            ids.append(client.post("/tasks/", json=payload).json()["id"])
+        missing = "00000000-0000-0000-0000-000000000000"
+
+        task_ids = [ids[0], missing, ids[1], ids[0]]
+        r = client.post("/tasks/complete", json={"task_ids": task_ids})
+        assert r.status_code == 200
+        body = r.json()
+        assert (body["completed"], body["not_found"]) == (2, 1)
+        assert [(x["id"], x["status"]) for x in body["results"]] == [
+            (ids[0], "completed"),
+            (missing, "not_found"),
+            (ids[1], "completed"),
+        ]
+
+        r = client.post("/tasks/complete", json={"task_ids": [ids[1], ids[2]]})
+        body = r.json()
+        assert (body["completed"], body["already_completed"]) == (1, 1)
+        assert [x["status"] for x in body["results"]] == [
+            "already_completed",
+            "completed",
+        ]
+
+        r = client.post(f"/task-lists/{tl['id']}/complete-all")
+        assert r.status_code == 200
+        assert [t["id"] for t in r.json()["tasks"]] == [ids[3]]
+        r = client.post(f"/task-lists/{tl['id']}/complete-all")
+        assert r.json()["completed"] == 0
+        assert client.post(f"/task-lists/{missing}/complete-all").status_code == 404
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_export_streams_ndjson_and_csv(monkeypatch, tmp_path, use_async):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{tmp_path / 'export.db'}")
+    monkeypatch.setenv(prefix + "DATABASE_ASYNC", str(use_async).lower())
+    with TestClient(create_app()) as client:
+        tl = client.post("/task-lists/", json={"name": "Export"}).json()
+        items = [{"task_list_id": tl["id"], "title": f"t{i}"} for i in range(25)]
+        client.post("/tasks/bulk", json={"items": items})
+        url = f"/tasks/by-list/{tl['id']}/export"
+
+        r = client.get(url, params={"batch_size": 10})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in r.text.splitlines()]
+        assert [row["title"] for row in rows] == [f"t{i}" for i in range(25)]
 
-    # create list
-    r = client.post("/task-lists/", json={"name": "Inbox"})
-    assert r.status_code == 200
-    tl = r.json()
+        r = client.get(url, params={"format": "csv", "batch_size": 7})
+        assert r.headers["content-type"].startswith("text/csv")
+        reader = list(csv.DictReader(io.StringIO(r.text)))
+        assert len(reader) == 25
+        assert reader[0]["is_completed"] == "false"
 
-    # list lists
-    r = client.get("/task-lists/")
-    assert r.status_code == 200
-    assert any(x["name"] == "Inbox" for x in r.json())
+        missing = "00000000-0000-0000-0000-000000000000"
+        assert client.get(f"/tasks/by-list/{missing}/export").status_code == 404
 
-    # create task
-    r = client.post("/tasks/", json={"task_list_id": tl["id"], "title": "t1"})
-    assert r.status_code == 200
-    t = r.json()
 
-    # list by list
-    r = client.get(f"/tasks/by-list/{tl['id']}")
-    assert r.status_code == 200
-    assert len(r.json()) >= 1
+def test_fast_list_serialization_matches_response_models():
+    tl = TaskList(name="Inbox")
+    tasks = [Task(task_list_id=tl.id, title="a"), Task(task_list_id=tl.id, title="b")]
+    tasks[1].mark_completed()
 
-    # complete
-    r = client.post(f"/tasks/{t['id']}/complete")
-    assert r.status_code == 200
-    assert r.json()["is_completed"] is True
+    assert json.loads(TaskOut.dump_json_many(tasks)) == [
+        TaskOut.from_domain(t).model_dump() for t in tasks
+    ]
+    assert json.loads(TaskListOut.dump_json_many([tl])) == [
+        TaskListOut.from_domain(tl).model_dump()
+    ]
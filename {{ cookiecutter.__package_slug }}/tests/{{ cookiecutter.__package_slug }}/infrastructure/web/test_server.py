@@ -0,0 +1,139 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from anyio import to_thread
+from click.testing import CliRunner
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from {{ cookiecutter.__package_slug }}.__main__ import main
+from {{ cookiecutter.__package_slug }}.infrastructure.settings import Settings
+from {{ cookiecutter.__package_slug }}.infrastructure.web.server import (
+    APP,
+    available_cpus,
+    multi_worker_warnings,
+    uvicorn_options,
+)
+from {{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }} import create_app
+
+
+def test_uvicorn_options_come_from_settings():
+    options = uvicorn_options(Settings())
+    assert options["workers"] == 1
+    assert options["loop"] == options["http"] == "auto"
+    assert options["limit_max_requests"] is None
+
+    settings = Settings(
+        SERVER_WORKERS=3,
+        SERVER_LOOP="uvloop",
+        SERVER_KEEP_ALIVE_SECONDS=30,
+        SERVER_BACKLOG=4096,
+        SERVER_MAX_REQUESTS=10000,
+        SERVER_MAX_REQUESTS_JITTER=500,
+    )
+    options = uvicorn_options(settings)
+    assert options["workers"] == 3
+    assert options["loop"] == "uvloop"
+    assert options["timeout_keep_alive"] == 30
+    assert options["backlog"] == 4096
+    assert options["limit_max_requests"] == 10000
+    assert options["limit_max_requests_jitter"] == 500
+
+
+def test_auto_workers_resolve_to_the_available_cpus(monkeypatch):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "SERVER_WORKERS", "auto")
+    assert uvicorn_options(Settings())["workers"] == available_cpus()
+    monkeypatch.setenv(prefix + "SERVER_WORKERS", "3")
+    assert uvicorn_options(Settings())["workers"] == 3
+    with pytest.raises(ValueError):
+        Settings(SERVER_WORKERS=0)
+
+
+def test_multiple_workers_warn_about_per_process_state():
+    assert multi_worker_warnings(Settings(CACHE_BACKEND="memory"), 1) == []
+    local = multi_worker_warnings(Settings(SQLITE_PROFILE=True), 4)
+    assert [w.split(":")[0] for w in local] == ["CHANGE_FEED_BACKEND=local"]
+    both = multi_worker_warnings(
+        Settings(CACHE_BACKEND="memory", SQLITE_PROFILE=True), 2
+    )
+    assert len(both) == 2
+    shared = Settings(
+        CHANGE_FEED_BACKEND="redis", CACHE_BACKEND="redis", SQLITE_PROFILE=True
+    )
+    assert multi_worker_warnings(shared, 4) == []
+    # A SQLite file without the profile has no queue for writers across workers
+    no_profile = Settings(CHANGE_FEED_BACKEND="redis", CACHE_BACKEND="redis")
+    assert [w.split(":")[0] for w in multi_worker_warnings(no_profile, 2)] == [
+        "SQLITE_PROFILE=false"
+    ]
+
+
+def test_cli_migrates_then_runs_uvicorn_with_overrides(monkeypatch, tmp_path):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    database = tmp_path / "cli.db"
+    monkeypatch.setenv(prefix + "DATABASE_URL", f"sqlite:///{database}")
+    monkeypatch.setenv(prefix + "SERVER_BACKLOG", "128")
+    # Restored after the test; the CLI turns it off for its workers
+    monkeypatch.setenv(prefix + "DATABASE_MIGRATE_ON_STARTUP", "true")
+    calls = []
+    monkeypatch.setattr("uvicorn.run", lambda app, **kw: calls.append((app, kw)))
+
+    result = CliRunner().invoke(main, ["--workers", "2", "--port", "9000"])
+    assert result.exit_code == 0, result.output
+    app, options = calls[0]
+    assert app == APP and options["factory"] is True
+    assert options["workers"] == 2
+    assert options["port"] == 9000
+    assert options["backlog"] == 128
+    assert database.exists()
+    assert os.environ[prefix + "DATABASE_MIGRATE_ON_STARTUP"] == "false"
+    assert "CHANGE_FEED_BACKEND=local" in result.output
+
+    result = CliRunner().invoke(main, ["--workers", "auto"])
+    assert result.exit_code == 0, result.output
+    assert calls[1][1]["workers"] == available_cpus()
+    assert CliRunner().invoke(main, ["--workers", "0"]).exit_code == 2
+
+
+def test_lifespan_sizes_the_threadpool(monkeypatch):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    monkeypatch.setenv(prefix + "SERVER_THREADPOOL_SIZE", "7")
+    app = create_app()
+
+    @app.get("/threadpool-size")
+    async def threadpool_size():
+        return to_thread.current_default_thread_limiter().total_tokens
+
+    with TestClient(app) as client:
+        assert client.get("/threadpool-size").json() == 7
+
+
+def test_app_touches_the_database_only_in_its_lifespan(monkeypatch, tmp_path):
+    prefix = "{{ cookiecutter.__package_slug | upper }}_"
+    unreachable = f"sqlite:///{tmp_path / 'missing' / 'app.db'}"
+    monkeypatch.setenv(prefix + "DATABASE_URL", unreachable)
+    app = create_app()
+    with pytest.raises(OperationalError):
+        with TestClient(app):
+            pass
+
+    monkeypatch.setenv(prefix + "DATABASE_MIGRATE_ON_STARTUP", "false")
+    with TestClient(create_app()) as client:
+        assert client.get("/openapi.json").status_code == 200
+
+
+def test_importing_the_app_module_builds_no_app():
+    # A fresh interpreter, so modules imported by other tests do not count
+    probe = (
+        "import sys; import {{ cookiecutter.__package_slug }}.{{ cookiecutter.__package_slug }} as m; "
+        "print(m._default_app.cache_info().currsize, "
+        "*sorted(n for n in ('sqlalchemy.ext.asyncio', 'prometheus_client', "
+        "'opentelemetry.sdk') if n in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split() == ["0"]